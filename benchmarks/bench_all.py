@@ -5,16 +5,24 @@ Compares goated implementations against native Python equivalents.
 Run with: python benchmarks/bench_all.py
 """
 
+import argparse
+import bisect
 import hashlib
+import operator
 import os
 import sys
 import time
+import timeit
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from io import BytesIO
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from cpu_features import cpu_banner, cpu_flags
+
 from goated.std import (
     base64,
     filepath,
@@ -35,6 +43,45 @@ from goated.std import (
     bytes as gobytes,
 )
 
+try:
+    from fastnumbers import fast_float, fast_int
+
+    HAVE_FASTNUMBERS = True
+except ImportError:
+    HAVE_FASTNUMBERS = False
+
+try:
+    import numpy as np
+
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+try:
+    import pybase64
+
+    HAVE_PYBASE64 = True
+except ImportError:
+    HAVE_PYBASE64 = False
+
+
+def _autorange_ns(timer: timeit.Timer) -> int:
+    """Like ``Timer.autorange`` for a ``perf_counter_ns`` timer (>= 0.2 s total)."""
+    i = 1
+    while True:
+        for j in 1, 2, 5:
+            number = i * j
+            if timer.timeit(number) >= 200_000_000:
+                return number
+        i *= 10
+
 
 class Bench:
     def __init__(self):
@@ -50,21 +97,22 @@ class Bench:
         goated_fn: Callable,
         native_fn: Callable,
         iterations: int = 1000,
-        warmup: int = 10,
+        repeat: int = 5,
     ):
-        for _ in range(warmup):
-            goated_fn()
-            native_fn()
-
-        start = time.perf_counter()
-        for _ in range(iterations):
-            goated_fn()
-        goated_ns = (time.perf_counter() - start) / iterations * 1e9
-
-        start = time.perf_counter()
-        for _ in range(iterations):
-            native_fn()
-        native_ns = (time.perf_counter() - start) / iterations * 1e9
+        go_timer = timeit.Timer(goated_fn, timer=time.perf_counter_ns)
+        py_timer = timeit.Timer(native_fn, timer=time.perf_counter_ns)
+        # autorange calibrates (and warms up); iterations is kept as a lower bound
+        go_number = max(iterations, _autorange_ns(go_timer))
+        py_number = max(iterations, _autorange_ns(py_timer))
+
+        # Alternate goated/native blocks so neither side gets the turbo-boosted
+        # start while the other runs at the throttled steady-state clock
+        go_best = py_best = float("inf")
+        for _ in range(repeat):
+            go_best = min(go_best, go_timer.timeit(go_number))
+            py_best = min(py_best, py_timer.timeit(py_number))
+        goated_ns = go_best / go_number
+        native_ns = py_best / py_number
 
         ratio = goated_ns / native_ns if native_ns > 0 else 0
         self.results.append((self.current_category, name, goated_ns, native_ns, ratio))
@@ -96,22 +144,41 @@ def bench_strings(b: Bench):
     text = "The quick brown fox jumps over the lazy dog"
     parts = ["hello", "world", "foo", "bar", "baz"]
 
-    b.run("Contains", lambda: strings.Contains(text, "fox"), lambda: "fox" in text)
-    b.run("Count", lambda: strings.Count(text, "o"), lambda: text.count("o"))
-    b.run("HasPrefix", lambda: strings.HasPrefix(text, "The"), lambda: text.startswith("The"))
-    b.run("HasSuffix", lambda: strings.HasSuffix(text, "dog"), lambda: text.endswith("dog"))
-    b.run("Index", lambda: strings.Index(text, "fox"), lambda: text.find("fox"))
-    b.run("Join", lambda: strings.Join(parts, ","), lambda: ",".join(parts))
-    b.run("Split", lambda: strings.Split(text, " "), lambda: text.split(" "))
-    b.run("ToLower", lambda: strings.ToLower(text), lambda: text.lower())
-    b.run("ToUpper", lambda: strings.ToUpper(text), lambda: text.upper())
-    b.run("TrimSpace", lambda: strings.TrimSpace("  hello  "), lambda: "  hello  ".strip())
+    b.run(
+        "Contains",
+        partial(strings.Contains, text, "fox"),
+        partial(operator.contains, text, "fox"),
+    )
+    b.run("Count", partial(strings.Count, text, "o"), partial(text.count, "o"))
+    b.run("HasPrefix", partial(strings.HasPrefix, text, "The"), partial(text.startswith, "The"))
+    b.run("HasSuffix", partial(strings.HasSuffix, text, "dog"), partial(text.endswith, "dog"))
+    b.run("Index", partial(strings.Index, text, "fox"), partial(text.find, "fox"))
+
+    # Needle shape picks CPython's search path: memchr for one char, two-way for long needles
+    long_text = text * 20 + "#"
+    long_needle = "lazy dog" * 4
+    long_haystack = text * 20 + long_needle
+    b.run(
+        "Index (single-char)",
+        partial(strings.Index, long_text, "#"),
+        partial(long_text.find, "#"),
+    )
+    b.run(
+        "Index (long needle)",
+        partial(strings.Index, long_haystack, long_needle),
+        partial(long_haystack.find, long_needle),
+    )
+    b.run("Join", partial(strings.Join, parts, ","), partial(",".join, parts))
+    b.run("Split", partial(strings.Split, text, " "), partial(text.split, " "))
+    b.run("ToLower", partial(strings.ToLower, text), text.lower)
+    b.run("ToUpper", partial(strings.ToUpper, text), text.upper)
+    b.run("TrimSpace", partial(strings.TrimSpace, "  hello  "), "  hello  ".strip)
     b.run(
         "Replace",
-        lambda: strings.Replace(text, "fox", "cat", -1),
-        lambda: text.replace("fox", "cat"),
+        partial(strings.Replace, text, "fox", "cat", -1),
+        partial(text.replace, "fox", "cat"),
     )
-    b.run("Repeat", lambda: strings.Repeat("ab", 100), lambda: "ab" * 100)
+    b.run("Repeat", partial(strings.Repeat, "ab", 100), partial(operator.mul, "ab", 100))
 
 
 def bench_bytes(b: Bench):
@@ -119,14 +186,32 @@ def bench_bytes(b: Bench):
     data = b"The quick brown fox jumps over the lazy dog"
     parts = [b"hello", b"world", b"foo", b"bar", b"baz"]
 
-    b.run("Contains", lambda: gobytes.Contains(data, b"fox"), lambda: b"fox" in data)
-    b.run("Count", lambda: gobytes.Count(data, b"o"), lambda: data.count(b"o"))
-    b.run("HasPrefix", lambda: gobytes.HasPrefix(data, b"The"), lambda: data.startswith(b"The"))
-    b.run("HasSuffix", lambda: gobytes.HasSuffix(data, b"dog"), lambda: data.endswith(b"dog"))
-    b.run("Index", lambda: gobytes.Index(data, b"fox"), lambda: data.find(b"fox"))
-    b.run("Join", lambda: gobytes.Join(parts, b","), lambda: b",".join(parts))
-    b.run("ToLower", lambda: gobytes.ToLower(data), lambda: data.lower())
-    b.run("ToUpper", lambda: gobytes.ToUpper(data), lambda: data.upper())
+    b.run(
+        "Contains",
+        partial(gobytes.Contains, data, b"fox"),
+        partial(operator.contains, data, b"fox"),
+    )
+    b.run("Count", partial(gobytes.Count, data, b"o"), partial(data.count, b"o"))
+    b.run("HasPrefix", partial(gobytes.HasPrefix, data, b"The"), partial(data.startswith, b"The"))
+    b.run("HasSuffix", partial(gobytes.HasSuffix, data, b"dog"), partial(data.endswith, b"dog"))
+    b.run("Index", partial(gobytes.Index, data, b"fox"), partial(data.find, b"fox"))
+
+    long_data = data * 20 + b"#"
+    long_needle = b"lazy dog" * 4
+    long_haystack = data * 20 + long_needle
+    b.run(
+        "Index (single-char)",
+        partial(gobytes.Index, long_data, b"#"),
+        partial(long_data.find, b"#"),
+    )
+    b.run(
+        "Index (long needle)",
+        partial(gobytes.Index, long_haystack, long_needle),
+        partial(long_haystack.find, long_needle),
+    )
+    b.run("Join", partial(gobytes.Join, parts, b","), partial(b",".join, parts))
+    b.run("ToLower", partial(gobytes.ToLower, data), data.lower)
+    b.run("ToUpper", partial(gobytes.ToUpper, data), data.upper)
 
 
 def bench_sort(b: Bench):
@@ -139,16 +224,29 @@ def bench_sort(b: Bench):
     b.run("Strings (50)", lambda: sort.Strings(strs.copy()), lambda: sorted(strs), iterations=100)
     b.run(
         "SearchInts",
-        lambda: sort.SearchInts(sorted_ints, 500),
-        lambda: sorted_ints.index(500),
+        partial(sort.SearchInts, sorted_ints, 500),
+        partial(bisect.bisect_left, sorted_ints, 500),
         iterations=10000,
     )
-    b.run(
-        "IsSorted",
-        lambda: sort.IntsAreSorted(sorted_ints),
-        lambda: all(sorted_ints[i] <= sorted_ints[i + 1] for i in range(len(sorted_ints) - 1)),
-        iterations=100,
-    )
+
+    if HAVE_NUMPY:
+        sorted_arr = np.asarray(sorted_ints, dtype=np.int64)
+        b.run(
+            "SearchInts (numpy)",
+            lambda: sort.SearchInts(sorted_ints, 500),
+            lambda a=sorted_arr: int(np.searchsorted(a, 500)),
+            iterations=10000,
+        )
+
+        def py_is_sorted(a=sorted_arr):
+            return bool(np.all(np.diff(a) >= 0))
+
+    else:
+
+        def py_is_sorted(a=sorted_ints):
+            return all(map(operator.le, a, a[1:]))
+
+    b.run("IsSorted", lambda: sort.IntsAreSorted(sorted_ints), py_is_sorted, iterations=100)
 
 
 def bench_encoding(b: Bench):
@@ -170,6 +268,18 @@ def bench_encoding(b: Bench):
         lambda: base64.StdEncoding.DecodeString(b64_encoded),
         lambda: py_b64.b64decode(b64_encoded),
     )
+    if HAVE_PYBASE64:
+        # SIMD (AVX2/AVX-512) base64 as the ceiling to aim for
+        b.run(
+            "Base64 Encode (pybase64)",
+            lambda: base64.StdEncoding.EncodeToString(data),
+            lambda: pybase64.b64encode_as_string(data),
+        )
+        b.run(
+            "Base64 Decode (pybase64)",
+            lambda: base64.StdEncoding.DecodeString(b64_encoded),
+            lambda: pybase64.b64decode(b64_encoded, validate=False),
+        )
     b.run("Hex Encode", lambda: hex.EncodeToString(hex_data), lambda: hex_data.hex())
     b.run("Hex Decode", lambda: hex.DecodeString(hex_encoded), lambda: bytes.fromhex(hex_encoded))
 
@@ -197,9 +307,26 @@ def bench_json(b: Bench):
 
     b.run("Valid", go_valid, py_valid)
 
+    if HAVE_ORJSON:
+        # SIMD-accelerated JSON (Rust) as the ceiling to aim for
+        def orjson_valid():
+            try:
+                orjson.loads(json_bytes)
+                return True
+            except orjson.JSONDecodeError:
+                return False
+
+        b.run("Marshal (orjson)", lambda: json.Marshal(obj), lambda: orjson.dumps(obj))
+        b.run(
+            "Unmarshal (orjson)",
+            lambda: json.Unmarshal(json_bytes),
+            lambda: orjson.loads(json_bytes),
+        )
+        b.run("Valid (orjson)", go_valid, orjson_valid)
+
 
 def bench_hash(b: Bench):
-    b.category("HASHING")
+    b.category(f"HASHING (sha_ni={'sha_ni' in cpu_flags()})")
     data = b"Benchmark data for hashing " * 100
 
     b.run("MD5", lambda: hash.SumMD5(data), lambda: hashlib.md5(data).digest(), iterations=500)
@@ -210,6 +337,21 @@ def bench_hash(b: Bench):
         lambda: hashlib.sha256(data).digest(),
         iterations=500,
     )
+    b.run(
+        "SHA256 (usedforsecurity=False)",
+        partial(hash.SumSHA256, data),
+        lambda: hashlib.new("sha256", data, usedforsecurity=False).digest(),
+        iterations=500,
+    )
+
+    sha256_copy = hashlib.sha256().copy
+
+    def py_sha256_primed():
+        h = sha256_copy()
+        h.update(data)
+        return h.digest()
+
+    b.run("SHA256 (primed copy)", partial(hash.SumSHA256, data), py_sha256_primed, iterations=500)
     b.run(
         "SHA512",
         lambda: hash.SumSHA512(data),
@@ -225,21 +367,35 @@ def bench_compression(b: Bench):
     data = b"Compressible data with repetition. " * 100
     compressed = py_gzip.compress(data)
 
+    # One pooled buffer + writer, Reset per call instead of rebuilt
+    pool_buf = BytesIO()
+    writer = gzip.NewWriter(pool_buf)
+
     def go_compress():
-        buf = BytesIO()
-        w = gzip.NewWriter(buf)
-        w.Write(data)
-        w.Close()
-        return buf.getvalue()
+        pool_buf.seek(0)
+        pool_buf.truncate()
+        writer.Reset(pool_buf)
+        writer.Write(data)
+        writer.Close()
+        return pool_buf.getvalue()
+
+    decomp_buf = BytesIO(compressed)
 
     def go_decompress():
-        r = gzip.NewReader(BytesIO(compressed)).unwrap()
+        decomp_buf.seek(0)
+        r = gzip.NewReader(decomp_buf).unwrap()
         result = r.Read()
         r.Close()
         return result
 
     b.run("Gzip Compress", go_compress, lambda: py_gzip.compress(data), iterations=100)
     b.run("Gzip Decompress", go_decompress, lambda: py_gzip.decompress(compressed), iterations=100)
+    b.run(
+        "Gzip Decompress (one-shot)",
+        partial(gzip.Decompress, compressed),
+        partial(py_gzip.decompress, compressed),
+        iterations=100,
+    )
 
 
 def bench_path(b: Bench):
@@ -247,25 +403,25 @@ def bench_path(b: Bench):
     p = "/usr/local/bin/python3"
     p2 = "foo/bar/baz.txt"
 
-    b.run("Base", lambda: path.Base(p), lambda: os.path.basename(p))
-    b.run("Dir", lambda: path.Dir(p), lambda: os.path.dirname(p))
-    b.run("Ext", lambda: path.Ext(p2), lambda: os.path.splitext(p2)[1])
-    b.run("Join", lambda: path.Join("a", "b", "c"), lambda: os.path.join("a", "b", "c"))
-    b.run("Clean", lambda: path.Clean("a//b/../c"), lambda: os.path.normpath("a//b/../c"))
+    b.run("Base", partial(path.Base, p), partial(os.path.basename, p))
+    b.run("Dir", partial(path.Dir, p), partial(os.path.dirname, p))
+    b.run("Ext", partial(path.Ext, p2), lambda: os.path.splitext(p2)[1])
+    b.run("Join", partial(path.Join, "a", "b", "c"), partial(os.path.join, "a", "b", "c"))
+    b.run("Clean", partial(path.Clean, "a//b/../c"), partial(os.path.normpath, "a//b/../c"))
 
 
 def bench_filepath(b: Bench):
     b.category("FILEPATH")
     p = "/usr/local/bin/python3"
 
-    b.run("Base", lambda: filepath.Base(p), lambda: os.path.basename(p))
-    b.run("Dir", lambda: filepath.Dir(p), lambda: os.path.dirname(p))
-    b.run("Ext", lambda: filepath.Ext(p), lambda: os.path.splitext(p)[1])
-    b.run("IsAbs", lambda: filepath.IsAbs(p), lambda: os.path.isabs(p))
+    b.run("Base", partial(filepath.Base, p), partial(os.path.basename, p))
+    b.run("Dir", partial(filepath.Dir, p), partial(os.path.dirname, p))
+    b.run("Ext", partial(filepath.Ext, p), lambda: os.path.splitext(p)[1])
+    b.run("IsAbs", partial(filepath.IsAbs, p), partial(os.path.isabs, p))
     b.run(
         "Join",
-        lambda: filepath.Join("/usr", "local", "bin"),
-        lambda: os.path.join("/usr", "local", "bin"),
+        partial(filepath.Join, "/usr", "local", "bin"),
+        partial(os.path.join, "/usr", "local", "bin"),
     )
 
 
@@ -282,6 +438,21 @@ def bench_strconv(b: Bench):
     b.run("ParseFloat", lambda: strconv.ParseFloat("3.14159", 64), lambda: float("3.14159"))
     b.run("ParseBool", lambda: strconv.ParseBool("true"), lambda: "true".lower() == "true")
 
+    # Specialized C converters as the parsing/formatting ceiling
+    if HAVE_FASTNUMBERS:
+        b.run("Atoi (fastnumbers)", lambda: strconv.Atoi("123456"), lambda: fast_int("123456"))
+        b.run(
+            "ParseFloat (fastnumbers)",
+            lambda: strconv.ParseFloat("3.14159", 64),
+            lambda: fast_float("3.14159"),
+        )
+    if HAVE_NUMPY:
+        b.run(
+            "FormatFloat (numpy)",
+            lambda: strconv.FormatFloat(3.14159, "f", 4, 64),
+            lambda: np.format_float_positional(3.14159, precision=4),
+        )
+
 
 def bench_url(b: Bench):
     b.category("URL")
@@ -291,7 +462,7 @@ def bench_url(b: Bench):
     to_escape = "hello world & special=chars"
     escaped = "hello%20world%20%26%20special%3Dchars"
 
-    b.run("Parse", lambda: url.Parse(test_url), lambda: urlparse(test_url), iterations=500)
+    b.run("Parse", partial(url.Parse, test_url), partial(urlparse, test_url), iterations=500)
     b.run("QueryEscape", lambda: url.QueryEscape(to_escape), lambda: quote(to_escape))
     b.run("QueryUnescape", lambda: url.QueryUnescape(escaped), lambda: unquote(escaped))
 
@@ -305,9 +476,12 @@ def bench_regexp(b: Bench):
 
     go_re = regexp.MustCompile(r"\d+")
     py_compiled = py_re.compile(r"\d+")
+    go_phone = regexp.MustCompile(pattern)
+    py_search = py_re.compile(pattern).search
 
+    b.run("MatchString", partial(go_phone.MatchString, text), lambda: bool(py_search(text)))
     b.run(
-        "MatchString",
+        "MatchString (one-shot)",
         lambda: regexp.MatchString(pattern, text),
         lambda: bool(py_re.search(pattern, text)),
     )
@@ -359,36 +533,84 @@ def bench_rand(b: Bench):
     b.run("Float64", lambda: rand.Float64(), lambda: random.random())
 
     items = list(range(100))
+    arr = items[:]
+
+    # A real swap, so the goated shuffle does observable work like random.shuffle
+    def swap(i, j, a=arr):
+        a[i], a[j] = a[j], a[i]
+
     b.run(
         "Shuffle",
-        lambda: rand.Shuffle(len(items), lambda i, j: None),
-        lambda: random.shuffle(items.copy()),
+        lambda: rand.Shuffle(len(arr), swap),
+        lambda: random.shuffle(arr[:]),
         iterations=100,
     )
+    b.run("Perm", lambda: rand.Perm(100), lambda: random.sample(range(100), 100), iterations=100)
+
+
+CATEGORIES = [
+    bench_strings,
+    bench_bytes,
+    bench_sort,
+    bench_encoding,
+    bench_json,
+    bench_hash,
+    bench_compression,
+    bench_path,
+    bench_filepath,
+    bench_strconv,
+    bench_url,
+    bench_regexp,
+    bench_sync,
+    bench_rand,
+]
+
+
+def run_category(fn: Callable[[Bench], None]) -> list[tuple[str, str, float, float, float]]:
+    """Run one category on a fresh Bench and return its results."""
+    b = Bench()
+    fn(b)
+    return b.results
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Benchmark goated.std against Python stdlib.")
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="run categories one at a time (less noise, for publication-quality numbers)",
+    )
+    parser.add_argument(
+        "--pin",
+        action="store_true",
+        help="pin to one core to avoid migration jitter; this also confines the Go "
+        "runtime's threads, so concurrency results become single-core on both sides",
+    )
+    args = parser.parse_args()
+
+    if args.pin and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {min(os.sched_getaffinity(0))})
+
     print("╔" + "═" * 83 + "╗")
     print("║" + "  GOATED COMPREHENSIVE BENCHMARKS  ".center(83) + "║")
     print("║" + "  goated.std vs Python stdlib  ".center(83) + "║")
     print("╚" + "═" * 83 + "╝")
+    print(cpu_banner())
+    if hasattr(os, "sched_getaffinity"):
+        cores = sorted(os.sched_getaffinity(0))
+        print(f"Affinity: {len(cores)} core(s) {cores}{' (pinned)' if args.pin else ''}")
 
     b = Bench()
 
-    bench_strings(b)
-    bench_bytes(b)
-    bench_sort(b)
-    bench_encoding(b)
-    bench_json(b)
-    bench_hash(b)
-    bench_compression(b)
-    bench_path(b)
-    bench_filepath(b)
-    bench_strconv(b)
-    bench_url(b)
-    bench_regexp(b)
-    bench_sync(b)
-    bench_rand(b)
+    # Categories share no state, so by default they run on separate cores.
+    # Contention adds noise; pass --sequential for stable numbers.
+    if args.sequential:
+        for fn in CATEGORIES:
+            fn(b)
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            for results in ex.map(run_category, CATEGORIES):
+                b.results.extend(results)
 
     b.print_results()
 
@@ -5,11 +5,22 @@ Single operations = Python wins (FFI overhead dominates)
 Batch operations = Go wins (parallel execution, amortized overhead)
 
 Run with: python benchmarks/bench_batch.py
+
+The batch string ops sweep power-of-two batch sizes to find where goated
+breaks even with Python. Pass --format csv or --format json to emit only
+that sweep as ``size,op,goated_ms,native_ms,speedup`` rows for plotting.
 """
 
+import argparse
+import csv
 import hashlib
+import json
+import sys
 import time
 from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+
+from cpu_features import cpu_banner
 
 from goated._core import is_library_available
 from goated.std import parallel
@@ -17,16 +28,23 @@ from goated.std import parallel
 
 def bench(func, iterations: int = 10) -> float:
     """Run benchmark, return ms per operation."""
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     for _ in range(iterations):
         func()
-    elapsed = time.perf_counter() - start
-    return (elapsed / iterations) * 1000  # ms
+    elapsed_ns = time.perf_counter_ns() - start
+    return elapsed_ns / iterations / 1_000_000  # ms
+
+
+def _pack(data_list: list[bytes]) -> tuple[bytes, list[int]]:
+    """Concatenate items into one buffer plus ``len + 1`` offsets."""
+    return b"".join(data_list), list(accumulate(map(len, data_list), initial=0))
 
 
 def format_result(goated_ms: float, native_ms: float) -> str:
     """Format benchmark result with speedup."""
-    speedup = native_ms / goated_ms if goated_ms > 0 else float("inf")
+    if goated_ms <= 0 or native_ms <= 0:
+        return f"? {goated_ms:>8.2f}ms vs {native_ms:>8.2f}ms (below timer resolution)"
+    speedup = native_ms / goated_ms
     if speedup > 1.1:
         return f"✓ {goated_ms:>8.2f}ms vs {native_ms:>8.2f}ms ({speedup:.1f}x faster)"
     elif speedup < 0.9:
@@ -37,11 +55,14 @@ def format_result(goated_ms: float, native_ms: float) -> str:
 
 def run_batch_hash_benchmarks():
     """Batch hashing - Go goroutines vs Python threads."""
-    print("\n" + "=" * 74)
+    print("\n" + "=" * 86)
     print("BATCH HASHING - Go goroutines vs Python sequential/threaded")
-    print("=" * 74)
-    print(f"{'Batch Size':<15} {'Data Size':<12} {'Goated vs Sequential':<30} {'vs ThreadPool'}")
-    print("-" * 74)
+    print("=" * 86)
+    print(
+        f"{'Batch Size':<15} {'Data Size':<12} {'Goated vs Sequential':<50} "
+        f"{'vs ThreadPool':<14} {'Packed'}"
+    )
+    print("-" * 86)
 
     configs = [
         (100, 1024, "100 × 1KB"),
@@ -51,6 +72,8 @@ def run_batch_hash_benchmarks():
         (100, 102400, "100 × 100KB"),
     ]
 
+    _sha256 = hashlib.sha256
+
     for batch_size, data_size, label in configs:
         # Generate test data
         data_list = [f"data_{i}_".encode() * (data_size // 10) for i in range(batch_size)]
@@ -58,16 +81,22 @@ def run_batch_hash_benchmarks():
         # Goated parallel
         goated_ms = bench(lambda d=data_list: parallel.parallel_hash_sha256(d), iterations=5)
 
+        # Goated parallel over one contiguous buffer (single pointer + offsets)
+        buf, offsets = _pack(data_list)
+        packed_ms = bench(
+            lambda b=buf, o=offsets: parallel.parallel_hash_sha256_packed(b, o), iterations=5
+        )
+
         # Python sequential
-        def py_sequential(d=data_list):
-            return [hashlib.sha256(x).hexdigest() for x in d]
+        def py_sequential(d=data_list, f=_sha256):
+            return [f(x).hexdigest() for x in d]
 
         seq_ms = bench(py_sequential, iterations=5)
 
         # Python ThreadPoolExecutor
-        def py_threaded(d=data_list):
+        def py_threaded(d=data_list, f=_sha256):
             with ThreadPoolExecutor(max_workers=8) as ex:
-                return list(ex.map(lambda x: hashlib.sha256(x).hexdigest(), d))
+                return list(ex.map(lambda x: f(x).hexdigest(), d))
 
         thread_ms = bench(py_threaded, iterations=5)
 
@@ -82,36 +111,71 @@ def run_batch_hash_benchmarks():
         else:
             thread_indicator = f"✗ {1 / thread_speedup:.1f}x"
 
-        print(f"{label:<15} {'':<12} {seq_result:<50} {thread_indicator}")
-
-
-def run_batch_string_benchmarks():
-    """Batch string operations - Go parallel vs Python."""
-    print("\n" + "=" * 74)
-    print("BATCH STRING OPS - Go goroutines vs Python list comprehension")
-    print("=" * 74)
-    print(f"{'Operation':<20} {'Batch Size':<15} {'Result'}")
-    print("-" * 74)
-
-    # ToUpper batch
-    for batch_size in [100, 1000, 10000]:
-        strings = [f"Hello World {i}!" for i in range(batch_size)]
-
-        goated_ms = bench(lambda s=strings: parallel.parallel_map_upper(s), iterations=10)
-        native_ms = bench(lambda s=strings: [x.upper() for x in s], iterations=10)
+        # Packed speedup relative to the list-based goated call
+        packed_indicator = f"{goated_ms / packed_ms:.2f}x" if packed_ms > 0 else "-"
+
+        print(f"{label:<15} {'':<12} {seq_result:<50} {thread_indicator:<14} {packed_indicator}")
+
+
+SWEEP_SIZES = tuple(1 << i for i in range(15))  # 1 .. 16384
+
+
+def run_batch_string_benchmarks(
+    sizes: tuple[int, ...] = SWEEP_SIZES, quiet: bool = False
+) -> list[dict]:
+    """Batch string operations - Go parallel vs Python, swept over batch sizes."""
+    if not quiet:
+        print("\n" + "=" * 74)
+        print("BATCH STRING OPS - Go goroutines vs Python list comprehension")
+        print("=" * 74)
+        print(f"{'Operation':<20} {'Batch Size':<15} {'Result'}")
+        print("-" * 74)
+
+    # Build the largest inputs once; smaller batches are prefix slices
+    digits = list(map(str, range(max(sizes))))
+    all_strings = ["Hello World " + d + "!" for d in digits]
+    all_texts = ["The quick brown fox jumps over the lazy dog " + d for d in digits]
+
+    ops = [
+        (
+            "ToUpper",
+            all_strings,
+            parallel.parallel_map_upper,
+            lambda s: [x.upper() for x in s],
+        ),
+        (
+            "Contains",
+            all_texts,
+            lambda t: parallel.parallel_contains(t, "fox"),
+            lambda t: ["fox" in x for x in t],
+        ),
+    ]
 
-        print(f"{'ToUpper':<20} {batch_size:<15} {format_result(goated_ms, native_ms)}")
+    rows = []
+    for op, inputs, goated_fn, native_fn in ops:
+        for batch_size in sizes:
+            batch = inputs[:batch_size]
 
-    print()
+            goated_ms = bench(lambda b=batch, f=goated_fn: f(b), iterations=10)
+            native_ms = bench(lambda b=batch, f=native_fn: f(b), iterations=10)
 
-    # Contains batch
-    for batch_size in [100, 1000, 10000]:
-        texts = [f"The quick brown fox jumps over the lazy dog {i}" for i in range(batch_size)]
+            rows.append(
+                {
+                    "size": batch_size,
+                    "op": op,
+                    "goated_ms": goated_ms,
+                    "native_ms": native_ms,
+                    # None (null / empty cell) when goated time is below resolution
+                    "speedup": native_ms / goated_ms if goated_ms > 0 else None,
+                }
+            )
+            if not quiet:
+                print(f"{op:<20} {batch_size:<15} {format_result(goated_ms, native_ms)}")
 
-        goated_ms = bench(lambda t=texts: parallel.parallel_contains(t, "fox"), iterations=10)
-        native_ms = bench(lambda t=texts: ["fox" in x for x in t], iterations=10)
+        if not quiet:
+            print()
 
-        print(f"{'Contains':<20} {batch_size:<15} {format_result(goated_ms, native_ms)}")
+    return rows
 
 
 def run_batch_md5_benchmarks():
@@ -119,7 +183,7 @@ def run_batch_md5_benchmarks():
     print("\n" + "=" * 74)
     print("BATCH MD5 - Simulating file checksum verification")
     print("=" * 74)
-    print(f"{'Scenario':<30} {'Result'}")
+    print(f"{'Scenario':<36} {'Result'}")
     print("-" * 74)
 
     scenarios = [
@@ -129,13 +193,26 @@ def run_batch_md5_benchmarks():
         ("50 large files (1MB)", 50, 1048576),
     ]
 
+    # Go returns hex digests, so the reference keeps .hexdigest() for parity
+    _md5 = hashlib.md5
+
     for scenario_name, count, size in scenarios:
-        data_list = [b"x" * size for _ in range(count)]
+        # One shared payload keeps caches hot: the steady-state hashing number.
+        # parallel_hash_md5 copies each input and never keys on identity, so
+        # sharing can't short-circuit work; the distinct-object row checks that.
+        payload = b"x" * size
+        variants = [
+            ("", [payload] * count),
+            (" [distinct]", [b"x" * size for _ in range(count)]),
+        ]
 
-        goated_ms = bench(lambda d=data_list: parallel.parallel_hash_md5(d), iterations=3)
-        native_ms = bench(lambda d=data_list: [hashlib.md5(x).hexdigest() for x in d], iterations=3)
+        for suffix, data_list in variants:
+            goated_ms = bench(lambda d=data_list: parallel.parallel_hash_md5(d), iterations=3)
+            native_ms = bench(
+                lambda d=data_list, f=_md5: [f(x).hexdigest() for x in d], iterations=3
+            )
 
-        print(f"{scenario_name:<30} {format_result(goated_ms, native_ms)}")
+            print(f"{scenario_name + suffix:<36} {format_result(goated_ms, native_ms)}")
 
 
 def run_throughput_comparison():
@@ -154,25 +231,56 @@ def run_throughput_comparison():
     goated_time = time.perf_counter() - start
     goated_ops = (10 * 1000) / goated_time
 
+    # Goated, writing raw digests into one reused buffer
+    out = bytearray(len(data_list) * 32)
+    start = time.perf_counter()
+    for _ in range(10):
+        parallel.parallel_hash_sha256_into(data_list, out)
+    into_time = time.perf_counter() - start
+    into_ops = (10 * 1000) / into_time
+
     # Python sequential
+    _sha256 = hashlib.sha256
     start = time.perf_counter()
     for _ in range(10):
-        [hashlib.sha256(x).hexdigest() for x in data_list]
+        [_sha256(x).hexdigest() for x in data_list]
     native_time = time.perf_counter() - start
     native_ops = (10 * 1000) / native_time
 
     print("\nSHA256 (10KB blocks):")
     print(f"  Goated:    {goated_ops:,.0f} hashes/sec")
+    print(f"  Into buf:  {into_ops:,.0f} hashes/sec ({into_ops / goated_ops:.2f}x vs allocating)")
     print(f"  Python:    {native_ops:,.0f} hashes/sec")
     print(f"  Speedup:   {goated_ops / native_ops:.1f}x")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Benchmark goated batch operations.")
+    parser.add_argument(
+        "--format",
+        choices=["table", "csv", "json"],
+        default="table",
+        help="csv/json emit only the batch-size sweep, for plotting",
+    )
+    args = parser.parse_args()
+
+    if args.format != "table":
+        rows = run_batch_string_benchmarks(quiet=True)
+        if args.format == "json":
+            json.dump(rows, sys.stdout, indent=2, allow_nan=False)
+            print()
+        else:
+            writer = csv.DictWriter(sys.stdout, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        return
+
     print("=" * 74)
     print("  GOATED BATCH BENCHMARKS - Parallel Processing with Go")
     print("=" * 74)
     print(f"\nGo FFI Available: {is_library_available()}")
     print(f"CPU Count: {parallel.num_cpus()}")
+    print(cpu_banner())
     print("\nKey insight: Batch operations amortize FFI overhead across many items,")
     print("            and Go's goroutines provide true parallelism (bypass GIL)")
 
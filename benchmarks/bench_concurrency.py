@@ -9,13 +9,35 @@ Compares:
 - Mutex vs threading.Lock
 
 Run with: python benchmarks/bench_concurrency.py
+
+Simulated work is a calibrated ~10µs CPU spin by default, so results reflect
+dispatch overhead rather than timer resolution. Pass --io-mode to use
+time.sleep instead.
 """
 
+import argparse
+import asyncio
 import queue
+import statistics
 import threading
 import time
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from functools import partial
+
+try:
+    import numpy as np
+
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
+try:
+    import uvloop
+
+    HAVE_UVLOOP = True
+except ImportError:
+    HAVE_UVLOOP = False
 
 from goated.std.goroutine import (
     Chan,
@@ -29,11 +51,19 @@ from goated.std.goroutine import (
 
 
 class BenchmarkResult:
-    def __init__(self, name: str, goated_time: float, baseline_time: float, unit: str = "ms"):
+    def __init__(
+        self,
+        name: str,
+        goated_time: float,
+        baseline_time: float,
+        unit: str = "ms",
+        asyncio_time: float | None = None,
+    ):
         self.name = name
         self.goated_time = goated_time
         self.baseline_time = baseline_time
         self.unit = unit
+        self.asyncio_time = asyncio_time
         self.speedup = baseline_time / goated_time if goated_time > 0 else 0
 
     def __str__(self):
@@ -41,29 +71,100 @@ class BenchmarkResult:
         speedup_str = (
             f"{self.speedup:.2f}x" if self.speedup >= 1 else f"{1 / self.speedup:.2f}x slower"
         )
-        return (
+        line = (
             f"{self.name:<40} {self.goated_time:>8.2f}{self.unit}  "
             f"{self.baseline_time:>8.2f}{self.unit}  {speedup_str:>12} ({winner})"
         )
+        if self.asyncio_time is not None:
+            line += f"  {self.asyncio_time:>8.2f}{self.unit}"
+        return line
+
+
+ASYNCIO_LABEL = "uvloop" if HAVE_UVLOOP else "asyncio"
+# uvloop.run() is the non-deprecated replacement for uvloop.install() + asyncio.run().
+run_async = uvloop.run if HAVE_UVLOOP else asyncio.run
+
+
+def _print_table(results: list[BenchmarkResult]) -> None:
+    header = f"\n{'Operation':<40} {'Goated':>10}  {'Baseline':>10}  {'Speedup':>12}"
+    if any(r.asyncio_time is not None for r in results):
+        header += f"  {'':>8}  {ASYNCIO_LABEL:>10}"
+    print(header)
+    print("-" * 80)
+    for r in results:
+        print(r)
 
 
 def benchmark(func: Callable, iterations: int = 1) -> float:
-    start = time.perf_counter()
+    """Return the median wall time of func over iterations runs, in ms."""
+    times = []
     for _ in range(iterations):
+        start = time.perf_counter()
         func()
-    return (time.perf_counter() - start) * 1000 / iterations
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _spin(n: int) -> int:
+    """Xorshift CPU micro-kernel: n rounds of pure integer work."""
+    x = 0x9E3779B97F4A7C15
+    for _ in range(n):
+        x ^= (x << 13) & _MASK64
+        x ^= x >> 7
+        x ^= (x << 17) & _MASK64
+    return x
+
+
+def _timed_ns(fn: Callable, *args) -> int:
+    start = time.perf_counter_ns()
+    fn(*args)
+    return time.perf_counter_ns() - start
+
+
+def _calibrate_spin(target_ns: int = 10_000) -> int:
+    """Return the _spin round count that takes about target_ns."""
+    probe = 10_000
+    best = min(_timed_ns(_spin, probe) for _ in range(5))
+    return max(1, round(target_ns * probe / best))
+
+
+SPIN_ROUNDS = _calibrate_spin()
+IO_MODE = False  # set by --io-mode
+
+
+def simulated_wait(duration: float) -> None:
+    """Sleep in --io-mode, otherwise burn a calibrated ~10µs of CPU."""
+    if IO_MODE:
+        time.sleep(duration)
+    else:
+        _spin(SPIN_ROUNDS)
 
 
 def work_unit(duration: float = 0.001):
-    time.sleep(duration)
+    simulated_wait(duration)
     return 42
 
 
-def cpu_work(n: int = 1000) -> int:
-    total = 0
-    for i in range(n):
-        total += i * i
-    return total
+if HAVE_NUMPY:
+    _ARANGE = np.arange(1024, dtype=np.int64)
+
+    def cpu_work(n: int = 1000) -> int:
+        """Sum of squares below n as a fixed-cost vector dot product."""
+        v = _ARANGE[:n] if n <= len(_ARANGE) else np.arange(n, dtype=np.int64)
+        return int(v @ v)
+
+else:
+
+    def cpu_work(n: int = 1000) -> int:
+        """Sum of squares below n, in closed form."""
+        return (n - 1) * n * (2 * n - 1) // 6
+
+
+_work_100 = partial(cpu_work, 100)
+_work_50 = partial(cpu_work, 50)
 
 
 def bench_gogroup_vs_threadpool():
@@ -78,25 +179,23 @@ def bench_gogroup_vs_threadpool():
         def goated_version(n=num_tasks):
             with GoGroup() as g:
                 for _ in range(n):
-                    g.go(cpu_work, 100)
+                    g.go(_work_100)
 
         def baseline_version(n=num_tasks):
             with ThreadPoolExecutor(max_workers=32) as executor:
-                futures = [executor.submit(cpu_work, 100) for _ in range(n)]
-                for f in as_completed(futures):
+                futures = [executor.submit(_work_100) for _ in range(n)]
+                wait(futures)
+                for f in futures:
                     f.result()
 
-        goated_time = benchmark(goated_version, 3)
-        baseline_time = benchmark(baseline_version, 3)
+        goated_time = benchmark(goated_version, 7)
+        baseline_time = benchmark(baseline_version, 7)
 
         results.append(
             BenchmarkResult(f"Spawn {num_tasks} tasks (CPU work)", goated_time, baseline_time)
         )
 
-    print(f"\n{'Operation':<40} {'Goated':>10}  {'Baseline':>10}  {'Speedup':>12}")
-    print("-" * 80)
-    for r in results:
-        print(r)
+    _print_table(results)
 
 
 def bench_parallel_map_vs_executor_map():
@@ -116,15 +215,26 @@ def bench_parallel_map_vs_executor_map():
             with ThreadPoolExecutor(max_workers=32) as executor:
                 return list(executor.map(cpu_work, it))
 
-        goated_time = benchmark(goated_version, 3)
-        baseline_time = benchmark(baseline_version, 3)
+        async def async_cpu_work(n):
+            return cpu_work(n)
 
-        results.append(BenchmarkResult(f"parallel_map {size} items", goated_time, baseline_time))
+        async def gather_all(it):
+            return await asyncio.gather(*[async_cpu_work(n) for n in it])
 
-    print(f"\n{'Operation':<40} {'Goated':>10}  {'Baseline':>10}  {'Speedup':>12}")
-    print("-" * 80)
-    for r in results:
-        print(r)
+        def asyncio_version(it=items):
+            return run_async(gather_all(it))
+
+        goated_time = benchmark(goated_version, 7)
+        baseline_time = benchmark(baseline_version, 7)
+        asyncio_time = benchmark(asyncio_version, 7)
+
+        results.append(
+            BenchmarkResult(
+                f"parallel_map {size} items", goated_time, baseline_time, asyncio_time=asyncio_time
+            )
+        )
+
+    _print_table(results)
 
 
 def bench_errgroup_vs_futures():
@@ -139,23 +249,24 @@ def bench_errgroup_vs_futures():
         def goated_version(n=num_tasks):
             with ErrGroup() as g:
                 for _ in range(n):
-                    g.go(cpu_work, 100)
+                    g.go(_work_100)
 
         def baseline_version(n=num_tasks):
             with ThreadPoolExecutor(max_workers=32) as executor:
-                futures = [executor.submit(cpu_work, 100) for _ in range(n)]
-                for f in as_completed(futures):
+                futures = [executor.submit(_work_100) for _ in range(n)]
+                wait(futures)
+                for f in futures:
                     f.result()
 
-        goated_time = benchmark(goated_version, 3)
-        baseline_time = benchmark(baseline_version, 3)
+        goated_time = benchmark(goated_version, 7)
+        baseline_time = benchmark(baseline_version, 7)
 
         results.append(BenchmarkResult(f"ErrGroup {num_tasks} tasks", goated_time, baseline_time))
 
-    print(f"\n{'Operation':<40} {'Goated':>10}  {'Baseline':>10}  {'Speedup':>12}")
-    print("-" * 80)
-    for r in results:
-        print(r)
+    _print_table(results)
+
+
+_SENTINEL = object()
 
 
 def bench_channel_vs_queue():
@@ -183,35 +294,27 @@ def bench_channel_vs_queue():
 
         def baseline_version(n=num_items):
             q: queue.Queue = queue.Queue(maxsize=100)
-            done = threading.Event()
 
             def producer():
                 for i in range(n):
                     q.put(i)
-                done.set()
+                q.put(_SENTINEL)
 
             t = threading.Thread(target=producer)
             t.start()
 
             count = 0
-            while not (done.is_set() and q.empty()):
-                try:
-                    q.get(timeout=0.01)
-                    count += 1
-                except queue.Empty:
-                    pass
+            while q.get() is not _SENTINEL:
+                count += 1
             t.join()
             return count
 
-        goated_time = benchmark(goated_version, 3)
-        baseline_time = benchmark(baseline_version, 3)
+        goated_time = benchmark(goated_version, 7)
+        baseline_time = benchmark(baseline_version, 7)
 
         results.append(BenchmarkResult(f"Send/Recv {num_items} items", goated_time, baseline_time))
 
-    print(f"\n{'Operation':<40} {'Goated':>10}  {'Baseline':>10}  {'Speedup':>12}")
-    print("-" * 80)
-    for r in results:
-        print(r)
+    _print_table(results)
 
 
 def bench_mutex_vs_lock():
@@ -224,29 +327,30 @@ def bench_mutex_vs_lock():
 
     def goated_version():
         mu = Mutex()
+        lock, unlock = mu.Lock, mu.Unlock
         counter = [0]
         for _ in range(iterations):
-            with mu:
-                counter[0] += 1
+            lock()
+            counter[0] += 1
+            unlock()
         return counter[0]
 
     def baseline_version():
         lock = threading.Lock()
+        acquire, release = lock.acquire, lock.release
         counter = [0]
         for _ in range(iterations):
-            with lock:
-                counter[0] += 1
+            acquire()
+            counter[0] += 1
+            release()
         return counter[0]
 
-    goated_time = benchmark(goated_version, 3)
-    baseline_time = benchmark(baseline_version, 3)
+    goated_time = benchmark(goated_version, 7)
+    baseline_time = benchmark(baseline_version, 7)
 
     results.append(BenchmarkResult(f"Lock/Unlock {iterations} times", goated_time, baseline_time))
 
-    print(f"\n{'Operation':<40} {'Goated':>10}  {'Baseline':>10}  {'Speedup':>12}")
-    print("-" * 80)
-    for r in results:
-        print(r)
+    _print_table(results)
 
 
 def bench_waitgroup_vs_threading():
@@ -260,31 +364,34 @@ def bench_waitgroup_vs_threading():
 
         def goated_version(n=num_workers):
             wg = WaitGroup()
+            done = wg.Done
+
+            def task():
+                _work_50()
+                done()
+
             for _ in range(n):
                 wg.Add(1)
-                go(lambda: (cpu_work(50), wg.Done()))
+                go(task)
             wg.Wait()
 
         def baseline_version(n=num_workers):
             threads = []
             for _ in range(n):
-                t = threading.Thread(target=lambda: cpu_work(50))
+                t = threading.Thread(target=_work_50)
                 t.start()
                 threads.append(t)
             for t in threads:
                 t.join()
 
-        goated_time = benchmark(goated_version, 3)
-        baseline_time = benchmark(baseline_version, 3)
+        goated_time = benchmark(goated_version, 7)
+        baseline_time = benchmark(baseline_version, 7)
 
         results.append(
             BenchmarkResult(f"Wait for {num_workers} workers", goated_time, baseline_time)
         )
 
-    print(f"\n{'Operation':<40} {'Goated':>10}  {'Baseline':>10}  {'Speedup':>12}")
-    print("-" * 80)
-    for r in results:
-        print(r)
+    _print_table(results)
 
 
 def bench_real_world_scenario():
@@ -293,35 +400,52 @@ def bench_real_world_scenario():
     print("=" * 80)
 
     def simulate_api_call(id: int) -> dict:
-        time.sleep(0.01)
+        simulated_wait(0.01)
         return {"id": id, "data": f"response_{id}"}
 
+    async def simulate_api_call_async(id: int, sem: asyncio.Semaphore) -> dict:
+        async with sem:
+            if IO_MODE:
+                await asyncio.sleep(0.01)
+            else:
+                simulated_wait(0.01)
+            return {"id": id, "data": f"response_{id}"}
+
     results = []
     num_calls = 100
+    call_ids = list(range(num_calls))
 
     def goated_version():
         with GoGroup(limit=20) as g:
-            futures = [g.go(simulate_api_call, i) for i in range(num_calls)]
+            futures = [g.go(simulate_api_call, i) for i in call_ids]
         return [f.result() for f in futures]
 
     def baseline_version():
         with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = [executor.submit(simulate_api_call, i) for i in range(num_calls)]
+            futures = [executor.submit(simulate_api_call, i) for i in call_ids]
             return [f.result() for f in as_completed(futures)]
 
-    goated_time = benchmark(goated_version, 3)
-    baseline_time = benchmark(baseline_version, 3)
+    async def gather_calls():
+        sem = asyncio.Semaphore(20)
+        return await asyncio.gather(*[simulate_api_call_async(i, sem) for i in call_ids])
+
+    def asyncio_version():
+        return run_async(gather_calls())
+
+    goated_time = benchmark(goated_version, 7)
+    baseline_time = benchmark(baseline_version, 7)
+    asyncio_time = benchmark(asyncio_version, 7)
 
     results.append(
         BenchmarkResult(
-            f"Parallel API calls ({num_calls} reqs, limit=20)", goated_time, baseline_time
+            f"Parallel API calls ({num_calls} reqs, limit=20)",
+            goated_time,
+            baseline_time,
+            asyncio_time=asyncio_time,
         )
     )
 
-    print(f"\n{'Operation':<40} {'Goated':>10}  {'Baseline':>10}  {'Speedup':>12}")
-    print("-" * 80)
-    for r in results:
-        print(r)
+    _print_table(results)
 
 
 def bench_spawn_overhead():
@@ -344,23 +468,29 @@ def bench_spawn_overhead():
         def baseline_version(n=num_tasks):
             with ThreadPoolExecutor(max_workers=32) as executor:
                 futures = [executor.submit(noop) for _ in range(n)]
-                for f in futures:
-                    f.result()
+                wait(futures)
 
-        goated_time = benchmark(goated_version, 3)
-        baseline_time = benchmark(baseline_version, 3)
+        goated_time = benchmark(goated_version, 7)
+        baseline_time = benchmark(baseline_version, 7)
 
         results.append(
             BenchmarkResult(f"Spawn {num_tasks} no-op tasks", goated_time, baseline_time)
         )
 
-    print(f"\n{'Operation':<40} {'Goated':>10}  {'Baseline':>10}  {'Speedup':>12}")
-    print("-" * 80)
-    for r in results:
-        print(r)
+    _print_table(results)
 
 
 def main():
+    global IO_MODE
+
+    parser = argparse.ArgumentParser(description="Benchmark goated concurrency primitives.")
+    parser.add_argument(
+        "--io-mode",
+        action="store_true",
+        help="simulate work with time.sleep instead of a calibrated CPU spin",
+    )
+    IO_MODE = parser.parse_args().io_mode
+
     print()
     print("╔" + "═" * 78 + "╗")
     print("║" + "  GOATED CONCURRENCY BENCHMARKS  ".center(78) + "║")
@@ -11,31 +11,149 @@ import base64 as py_base64
 import gzip as py_gzip
 import hashlib
 import json as py_json
+import operator
+import random
 import re as py_re
+import statistics
 import time
+from functools import partial
+from typing import NamedTuple
 
-from goated._core import is_library_available
-from goated.std import base64, gzip, hash, json, regexp, strings
+try:
+    import numpy as np
+
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
 
+try:
+    import orjson
 
-def bench(func, iterations: int = 100) -> float:
-    """Run benchmark, return ns per operation."""
-    start = time.perf_counter()
-    for _ in range(iterations):
-        func()
-    elapsed = time.perf_counter() - start
-    return (elapsed / iterations) * 1_000_000_000
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
 
+from go_loop import OP_CONTAINS, OP_SHA256, OP_TOUPPER, go_loop
+from time_loop import time_loop
+
+from goated._core import is_library_available
+from goated.std import base64, gzip, hash, json, regexp, strings
 
-def format_result(goated_ns: float, native_ns: float) -> str:
-    """Format benchmark result with winner indicator."""
+# FFI crossings per call for goated functions that go through the Go library.
+# Zero when it is not loaded, since every call then runs the Python fallback.
+GO_CALL = 1 if is_library_available() else 0
+
+TARGET_NS = 200_000_000  # aim for ~0.2s of timed calls per measurement
+MIN_ITERATIONS = 5
+MAX_ITERATIONS = 100_000
+
+
+def autorange(func) -> int:
+    """Pick an iteration count from one probe call, like timeit.Timer.autorange."""
+    perf = time.perf_counter_ns
+    start = perf()
+    func()
+    probe_ns = perf() - start
+    return max(MIN_ITERATIONS, min(MAX_ITERATIONS, TARGET_NS // max(probe_ns, 1)))
+
+
+class Timing(NamedTuple):
+    """Per-operation timing in ns.
+
+    ``mean_only`` rows were timed as one batch, so ``median``, ``p25`` and
+    ``p75`` all hold the mean and there is no spread to report.
+    """
+
+    median: float
+    p25: float
+    p75: float
+    mean_only: bool = False
+
+
+def bench_stats(func, iterations: int | None = None) -> Timing:
+    """Run benchmark, return the median and quartiles in ns per operation.
+
+    When ``iterations`` is omitted it is chosen by autorange(), so cheap ops
+    get many samples and expensive ones finish quickly.
+
+    Every call is timestamped so GC pauses and scheduler jitter land in the
+    tails instead of the reported median. Callables with a ``__batch__``
+    method (see go_loop) run all iterations in a single call, so only their
+    mean is known.
+    """
+    if iterations is None:
+        iterations = autorange(func)
+
+    batch = getattr(func, "__batch__", None)
+    if batch is not None:
+        mean = batch(iterations) / iterations
+        return Timing(mean, mean, mean, mean_only=True)
+
+    f = func
+    perf = time.perf_counter_ns
+    if HAVE_NUMPY:
+        ts = np.empty(iterations + 1, dtype=np.int64)
+        ts[0] = perf()
+        for i in range(1, iterations + 1):
+            f()
+            ts[i] = perf()
+        diffs = np.diff(ts)
+        p25, p75 = np.percentile(diffs, [25, 75])
+        return Timing(float(np.median(diffs)), float(p25), float(p75))
+
+    ts = [0] * (iterations + 1)
+    ts[0] = perf()
+    for i in range(1, iterations + 1):
+        f()
+        ts[i] = perf()
+    diffs = [ts[i] - ts[i - 1] for i in range(1, iterations + 1)]
+    if len(diffs) < 2:
+        return Timing(float(diffs[0]), float(diffs[0]), float(diffs[0]))
+    p25, _, p75 = statistics.quantiles(diffs, n=4)
+    return Timing(float(statistics.median(diffs)), p25, p75)
+
+
+def bench(func, iterations: int | None = None, *, mean_only: bool = False) -> Timing:
+    """Run benchmark, return its Timing.
+
+    Pass ``mean_only=True`` when the other side of the comparison was
+    batched, so both sides are timed the same way: as one loop whose mean
+    is reported, without per-call timestamps.
+    """
+    if not mean_only:
+        return bench_stats(func, iterations)
+    if iterations is None:
+        iterations = autorange(func)
+    mean = time_loop(func, iterations) / iterations
+    return Timing(mean, mean, mean, mean_only=True)
+
+
+def _spread(t: Timing) -> str:
+    return "mean" if t.mean_only else f"IQR {t.p75 - t.p25:,.0f}ns"
+
+
+def format_result(goated: Timing, native: Timing, ffi_calls: int = 0) -> str:
+    """Format benchmark result with winner indicator.
+
+    Medians are compared and each side's interquartile range is shown;
+    batched rows are compared by mean and marked as such.
+
+    ``ffi_calls`` is the number of Go FFI crossings per goated call. When
+    non-zero, the gap to native is also reported per crossing, which shows
+    how much of a slowdown is call overhead rather than compute.
+    """
+    goated_ns, native_ns = goated.median, native.median
     ratio = goated_ns / native_ns if native_ns > 0 else float("inf")
     if ratio < 0.9:
-        return f"✓ {goated_ns:>10,.0f}ns vs {native_ns:>10,.0f}ns ({ratio:.2f}x faster)"
+        result = f"✓ {goated_ns:>10,.0f}ns vs {native_ns:>10,.0f}ns ({ratio:.2f}x faster)"
     elif ratio > 1.1:
-        return f"✗ {goated_ns:>10,.0f}ns vs {native_ns:>10,.0f}ns ({ratio:.2f}x slower)"
+        result = f"✗ {goated_ns:>10,.0f}ns vs {native_ns:>10,.0f}ns ({ratio:.2f}x slower)"
     else:
-        return f"≈ {goated_ns:>10,.0f}ns vs {native_ns:>10,.0f}ns (similar)"
+        result = f"≈ {goated_ns:>10,.0f}ns vs {native_ns:>10,.0f}ns (similar)"
+    if ffi_calls:
+        per_call = (goated_ns - native_ns) / ffi_calls
+        result += f" [{ffi_calls} FFI, {per_call:+,.0f}ns/FFI]"
+    return result + f" {{{_spread(goated)} vs {_spread(native)}}}"
 
 
 def run_scaled_string_benchmarks():
@@ -56,19 +174,27 @@ def run_scaled_string_benchmarks():
 
     for size_name, text in sizes:
         # Contains
-        goated_ns = bench(lambda t=text: strings.Contains(t, "xxx"), iterations=100)
-        native_ns = bench(lambda t=text: "xxx" in t, iterations=100)
+        goated_ns = bench(
+            go_loop(partial(strings.Contains, text, "xxx"), OP_CONTAINS, text, "xxx"),
+        )
+        native_ns = bench(partial(operator.contains, text, "xxx"), mean_only=goated_ns.mean_only)
         print(f"{size_name:<20} {'Contains':<20} {format_result(goated_ns, native_ns)}")
 
+        # Contains on pre-encoded bytes: no per-call UTF-8 encode or strlen
+        text_b = text.encode()
+        goated_ns = bench(partial(strings.Contains, text_b, b"xxx"))
+        native_ns = bench(partial(operator.contains, text_b, b"xxx"))
+        print(f"{'':<20} {'Contains (bytes)':<20} {format_result(goated_ns, native_ns, GO_CALL)}")
+
         # ToUpper
-        goated_ns = bench(lambda t=text: strings.ToUpper(t), iterations=50)
-        native_ns = bench(lambda t=text: t.upper(), iterations=50)
+        goated_ns = bench(go_loop(partial(strings.ToUpper, text), OP_TOUPPER, text))
+        native_ns = bench(text.upper, mean_only=goated_ns.mean_only)
         print(f"{'':<20} {'ToUpper':<20} {format_result(goated_ns, native_ns)}")
 
         # Replace
-        goated_ns = bench(lambda t=text: strings.Replace(t, "x", "y", -1), iterations=20)
-        native_ns = bench(lambda t=text: t.replace("x", "y"), iterations=20)
-        print(f"{'':<20} {'Replace':<20} {format_result(goated_ns, native_ns)}")
+        goated_ns = bench(partial(strings.Replace, text, "x", "y", -1))
+        native_ns = bench(partial(text.replace, "x", "y"))
+        print(f"{'':<20} {'Replace':<20} {format_result(goated_ns, native_ns, GO_CALL)}")
         print()
 
 
@@ -89,19 +215,30 @@ def run_scaled_json_benchmarks():
         ("Nested", {"level1": {"level2": {"level3": {"data": list(range(100))}}}}),
     ]
 
+    marshal, unmarshal = json.Marshal, json.Unmarshal
+    dumps, loads = py_json.dumps, py_json.loads
+
     for size_name, obj in sizes:
-        json_str = py_json.dumps(obj)
+        json_str = dumps(obj)
         json_bytes = json_str.encode()
 
         # Marshal
-        goated_ns = bench(lambda o=obj: json.Marshal(o), iterations=100)
-        native_ns = bench(lambda o=obj: py_json.dumps(o), iterations=100)
-        print(f"{size_name:<20} {'Marshal':<20} {format_result(goated_ns, native_ns)}")
+        marshal_ns = bench(partial(marshal, obj))
+        native_ns = bench(partial(dumps, obj))
+        print(f"{size_name:<20} {'Marshal':<20} {format_result(marshal_ns, native_ns)}")
 
         # Unmarshal
-        goated_ns = bench(lambda b=json_bytes: json.Unmarshal(b), iterations=100)
-        native_ns = bench(lambda s=json_str: py_json.loads(s), iterations=100)
-        print(f"{'':<20} {'Unmarshal':<20} {format_result(goated_ns, native_ns)}")
+        unmarshal_ns = bench(partial(unmarshal, json_bytes))
+        native_ns = bench(partial(loads, json_str))
+        print(f"{'':<20} {'Unmarshal':<20} {format_result(unmarshal_ns, native_ns)}")
+
+        # orjson is the realistic C-extension ceiling, not stdlib json
+        if HAVE_ORJSON:
+            native_ns = bench(partial(orjson.dumps, obj))
+            print(f"{'':<20} {'Marshal (orjson)':<20} {format_result(marshal_ns, native_ns)}")
+
+            native_ns = bench(partial(orjson.loads, json_bytes))
+            print(f"{'':<20} {'Unmarshal (orjson)':<20} {format_result(unmarshal_ns, native_ns)}")
         print()
 
 
@@ -113,30 +250,33 @@ def run_scaled_hash_benchmarks():
     print(f"{'Size':<20} {'Algorithm':<20} {'Result'}")
     print("-" * 70)
 
+    # Deterministic pseudo-random input instead of a repeated byte; every
+    # size is a prefix of one 1MB block generated once.
+    block = random.Random(0).randbytes(1048576)
     sizes = [
-        ("Tiny (100B)", b"x" * 100),
-        ("Small (1KB)", b"x" * 1024),
-        ("Medium (10KB)", b"x" * 10240),
-        ("Large (100KB)", b"x" * 102400),
-        ("XL (1MB)", b"x" * 1048576),
+        ("Tiny (100B)", block[:100]),
+        ("Small (1KB)", block[:1024]),
+        ("Medium (10KB)", block[:10240]),
+        ("Large (100KB)", block[:102400]),
+        ("XL (1MB)", block),
     ]
 
-    for size_name, data in sizes:
-        iters = 100 if len(data) < 100000 else 10
+    sha256, sha512, md5 = hashlib.sha256, hashlib.sha512, hashlib.md5
 
+    for size_name, data in sizes:
         # SHA256
-        goated_ns = bench(lambda d=data: hash.SumSHA256(d), iterations=iters)
-        native_ns = bench(lambda d=data: hashlib.sha256(d).digest(), iterations=iters)
+        goated_ns = bench(go_loop(partial(hash.SumSHA256, data), OP_SHA256, data))
+        native_ns = bench(lambda d=data: sha256(d).digest(), mean_only=goated_ns.mean_only)
         print(f"{size_name:<20} {'SHA256':<20} {format_result(goated_ns, native_ns)}")
 
         # SHA512
-        goated_ns = bench(lambda d=data: hash.SumSHA512(d), iterations=iters)
-        native_ns = bench(lambda d=data: hashlib.sha512(d).digest(), iterations=iters)
+        goated_ns = bench(partial(hash.SumSHA512, data))
+        native_ns = bench(lambda d=data: sha512(d).digest())
         print(f"{'':<20} {'SHA512':<20} {format_result(goated_ns, native_ns)}")
 
         # MD5
-        goated_ns = bench(lambda d=data: hash.SumMD5(d), iterations=iters)
-        native_ns = bench(lambda d=data: hashlib.md5(d).digest(), iterations=iters)
+        goated_ns = bench(partial(hash.SumMD5, data))
+        native_ns = bench(lambda d=data: md5(d).digest())
         print(f"{'':<20} {'MD5':<20} {format_result(goated_ns, native_ns)}")
         print()
 
@@ -159,12 +299,16 @@ def run_scaled_compression_benchmarks():
         ("XL (1MB)", b"Hello World! " * 80000),
     ]
 
+    # One writer for every row; Reset rebinds it instead of building a new one
+    buf = BytesIO()
+    w = gzip.NewWriter(buf)
+
     for size_name, data in sizes:
-        iters = 20 if len(data) < 100000 else 5
 
         def goated_compress(d=data):
-            buf = BytesIO()
-            w = gzip.NewWriter(buf)
+            buf.seek(0)
+            buf.truncate()
+            w.Reset(buf)
             w.Write(d)
             w.Close()
             return buf.getvalue()
@@ -172,15 +316,19 @@ def run_scaled_compression_benchmarks():
         def native_compress(d=data):
             return py_gzip.compress(d)
 
-        goated_ns = bench(goated_compress, iterations=iters)
-        native_ns = bench(native_compress, iterations=iters)
+        goated_ns = bench(goated_compress)
+        native_ns = bench(native_compress)
         print(f"{size_name:<20} {'Gzip Compress':<20} {format_result(goated_ns, native_ns)}")
 
-        # Decompress
+        # Decompress: one rewound source per payload. gzip.Reader wraps
+        # GzipFile, so Reset only rebinds it; no Go reader pool is involved.
         compressed = py_gzip.compress(data)
+        src = BytesIO(compressed)
+        r = gzip.NewReader(src).unwrap()
 
-        def goated_decompress(c=compressed):
-            r = gzip.NewReader(BytesIO(c)).unwrap()
+        def goated_decompress(src=src, r=r):
+            src.seek(0)
+            r.Reset(src)
             result = r.Read()
             r.Close()
             return result
@@ -188,8 +336,8 @@ def run_scaled_compression_benchmarks():
         def native_decompress(c=compressed):
             return py_gzip.decompress(c)
 
-        goated_ns = bench(goated_decompress, iterations=iters)
-        native_ns = bench(native_decompress, iterations=iters)
+        goated_ns = bench(goated_decompress)
+        native_ns = bench(native_decompress)
         print(f"{'':<20} {'Gzip Decompress':<20} {format_result(goated_ns, native_ns)}")
         print()
 
@@ -214,16 +362,14 @@ def run_scaled_regexp_benchmarks():
     ]
 
     for size_name, text in sizes:
-        iters = 100 if len(text) < 10000 else 20
-
         # FindAll
-        goated_ns = bench(lambda t=text: go_re.FindAllString(t, -1), iterations=iters)
-        native_ns = bench(lambda t=text: py_compiled.findall(t), iterations=iters)
+        goated_ns = bench(partial(go_re.FindAllString, text, -1))
+        native_ns = bench(partial(py_compiled.findall, text))
         print(f"{size_name:<20} {'FindAll':<20} {format_result(goated_ns, native_ns)}")
 
         # Match
-        goated_ns = bench(lambda t=text: go_re.MatchString(t), iterations=iters)
-        native_ns = bench(lambda t=text: bool(py_compiled.search(t)), iterations=iters)
+        goated_ns = bench(partial(go_re.MatchString, text))
+        native_ns = bench(lambda t=text, search=py_compiled.search: bool(search(t)))
         print(f"{'':<20} {'Match':<20} {format_result(goated_ns, native_ns)}")
         print()
 
@@ -244,18 +390,21 @@ def run_scaled_base64_benchmarks():
         ("XL (1MB)", b"x" * 1048576),
     ]
 
+    # bytes in, bytes out on both sides: no str transcoding of the ASCII output
+    enc, dec = base64.StdEncoding.EncodeToBytes, base64.StdEncoding.DecodeFromBytes
+    b64encode, b64decode = py_base64.b64encode, py_base64.b64decode
+
     for size_name, data in sizes:
-        iters = 100 if len(data) < 100000 else 10
-        encoded = py_base64.b64encode(data).decode()
+        encoded = py_base64.b64encode(data)
 
         # Encode
-        goated_ns = bench(lambda d=data: base64.StdEncoding.EncodeToString(d), iterations=iters)
-        native_ns = bench(lambda d=data: py_base64.b64encode(d).decode(), iterations=iters)
+        goated_ns = bench(partial(enc, data))
+        native_ns = bench(partial(b64encode, data))
         print(f"{size_name:<20} {'Encode':<20} {format_result(goated_ns, native_ns)}")
 
         # Decode
-        goated_ns = bench(lambda e=encoded: base64.StdEncoding.DecodeString(e), iterations=iters)
-        native_ns = bench(lambda e=encoded: py_base64.b64decode(e), iterations=iters)
+        goated_ns = bench(partial(dec, encoded))
+        native_ns = bench(partial(b64decode, encoded))
         print(f"{'':<20} {'Decode':<20} {format_result(goated_ns, native_ns)}")
         print()
 
@@ -267,6 +416,7 @@ def main():
     print(f"\nGo FFI Available: {is_library_available()}")
     print("\nLegend: ✓ = goated faster, ✗ = goated slower, ≈ = similar")
     print("Key insight: FFI overhead is fixed, computation scales with size")
+    print("[N FFI, ±Xns/FFI] = Go calls per op and the gap to native per call")
     print("Expected: Small data → Python wins, Large data → Go FFI wins")
 
     run_scaled_string_benchmarks()
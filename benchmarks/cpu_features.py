@@ -0,0 +1,56 @@
+"""CPU feature detection for benchmark preambles.
+
+SIMD base64, SHA and regex performance depends on which ISA extensions the
+host has, so benchmarks print them up front. Uses py-cpuinfo when installed,
+otherwise parses /proc/cpuinfo (Linux only; elsewhere the flags are unknown).
+"""
+
+import platform
+
+ISA_FLAGS = ["avx2", "avx512f", "avx512vbmi", "sha_ni", "pclmulqdq"]
+
+
+def _proc_cpuinfo() -> dict[str, str]:
+    info: dict[str, str] = {}
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if not line.strip():
+                    break  # first processor is enough
+                key, _, value = line.partition(":")
+                info[key.strip()] = value.strip()
+    except OSError:
+        pass
+    return info
+
+
+def cpu_info() -> tuple[str, str, frozenset[str]]:
+    """Return ``(brand, advertised clock, feature flags)``."""
+    try:
+        from cpuinfo import get_cpu_info
+
+        info = get_cpu_info()
+        return (
+            info.get("brand_raw", platform.processor()),
+            info.get("hz_advertised_friendly", "?"),
+            frozenset(info.get("flags", [])),
+        )
+    except ImportError:
+        info = _proc_cpuinfo()
+        return (
+            info.get("model name", platform.processor() or "unknown"),
+            f"{info['cpu MHz']} MHz" if "cpu MHz" in info else "?",
+            frozenset(info.get("flags", "").split()),
+        )
+
+
+def cpu_flags() -> frozenset[str]:
+    """Return the host's CPU feature flags (empty if unknown)."""
+    return cpu_info()[2]
+
+
+def cpu_banner() -> str:
+    """Return a two-line summary of the CPU and the ISA extensions that matter here."""
+    brand, hz, flags = cpu_info()
+    isa = " ".join(f"{flag}={flag in flags}" for flag in ISA_FLAGS)
+    return f"CPU: {brand} ({hz})\nISA: {isa}"
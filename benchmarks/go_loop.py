@@ -0,0 +1,50 @@
+"""Batched benchmark callables backed by the in-Go ``goated_bench_loop``.
+
+For tiny inputs a Python-side timing loop mostly measures ctypes dispatch.
+``go_loop`` wraps a goated call so harnesses that understand ``__batch__``
+can run all iterations inside Go with a single FFI crossing.
+"""
+
+from collections.abc import Callable
+
+from goated._core import _USE_GO_LIB, get_lib
+
+OP_CONTAINS = 0
+OP_INDEX = 1
+OP_TOUPPER = 2
+OP_SHA256 = 3
+
+
+class BatchedOp:
+    """Callable that also exposes ``__batch__(n) -> elapsed ns`` via Go."""
+
+    __slots__ = ("_call", "_op", "_a", "_b")
+
+    def __init__(self, call: Callable[[], object], op: int, a: bytes, b: bytes) -> None:
+        self._call = call
+        self._op = op
+        self._a = a
+        self._b = b
+
+    def __call__(self) -> object:
+        return self._call()
+
+    def __batch__(self, n: int) -> int:
+        a, b = self._a, self._b
+        ns = get_lib().goated_bench_loop(self._op, a, len(a), b, len(b), n)
+        if ns < 0:
+            raise ValueError(f"unknown bench op {self._op}")
+        return ns
+
+
+def go_loop(
+    call: Callable[[], object], op: int, a: str | bytes, b: str | bytes = b""
+) -> Callable[[], object]:
+    """Return ``call`` with a Go-side ``__batch__`` when the library is loaded."""
+    if not _USE_GO_LIB:
+        return call
+    if isinstance(a, str):
+        a = a.encode()
+    if isinstance(b, str):
+        b = b.encode()
+    return BatchedOp(call, op, a, b)
@@ -0,0 +1,25 @@
+"""Interpreter-free timing loop for benchmark harnesses.
+
+A ``for _ in range(n): func()`` loop adds a bytecode dispatch, a range
+iterator step and a call frame per iteration, which is the same order of
+magnitude as the sub-microsecond ops being measured. ``time_loop`` drives
+the calls from C through ``itertools`` so only ``func`` itself runs as
+Python.
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable
+from itertools import repeat, starmap
+
+_NO_ARGS = ()
+
+
+def time_loop(func: Callable[[], object], n: int) -> int:
+    """Call ``func()`` ``n`` times and return the elapsed nanoseconds."""
+    calls = starmap(func, repeat(_NO_ARGS, n))
+    consume = deque(maxlen=0).extend
+    perf = time.perf_counter_ns
+    start = perf()
+    consume(calls)
+    return perf() - start
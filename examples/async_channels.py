@@ -10,7 +10,7 @@ Shows:
 
 import asyncio
 
-from goated import Channel, ChannelClosed, go
+from goated import Channel, go
 
 
 async def demo_basic_channel():
@@ -68,32 +68,28 @@ async def demo_multiple_workers():
     results = Channel[str](buffer_size=10)
 
     async def worker(id: int):
-        while True:
-            try:
-                job = await asyncio.wait_for(jobs.recv(), timeout=0.5)
-                result = f"Worker {id} processed job {job} -> {job * 2}"
-                await results.send(result)
-            except (ChannelClosed, asyncio.TimeoutError):
-                break
+        # Ends when the dispatcher closes jobs and the buffer is drained
+        async for job in jobs:
+            await asyncio.sleep(0.01)  # simulate work
+            await results.send(f"Worker {id} processed job {job} -> {job * 2}")
 
     async def dispatcher():
         for i in range(10):
             await jobs.send(i)
         jobs.close()
 
+    async def workers():
+        await asyncio.gather(worker(1), worker(2), worker(3))
+        results.close()
+
     async def collector():
         collected = []
-        while len(collected) < 10:
-            try:
-                result = await asyncio.wait_for(results.recv(), timeout=1.0)
-                collected.append(result)
-                print(f"  {result}")
-            except asyncio.TimeoutError:
-                break
-        results.close()
+        async for result in results:
+            collected.append(result)
+            print(f"  {result}")
         return collected
 
-    await asyncio.gather(dispatcher(), worker(1), worker(2), worker(3), collector())
+    await asyncio.gather(dispatcher(), workers(), collector())
 
 
 async def demo_fan_out():
@@ -110,9 +106,12 @@ async def demo_fan_out():
         source.close()
 
     async def square_worker(id: str):
-        async for n in source:
-            print(f"  Worker {id}: {n}^2 = {n * n}")
-            await asyncio.sleep(0.05)
+        # Take a couple of items per receive; small batches keep both
+        # workers busy while still amortizing the per-recv overhead.
+        while batch := await source.recv_batch(2):
+            for n in batch:
+                print(f"  Worker {id}: {n}^2 = {n * n}")
+                await asyncio.sleep(0.05)
 
     async def runner():
         gen_task = asyncio.create_task(generator())
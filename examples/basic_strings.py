@@ -68,10 +68,7 @@ def demo_builder():
     print("=" * 50)
 
     b = strings.Builder()
-    b.WriteString("Hello")
-    b.WriteString(", ")
-    b.WriteString("World")
-    b.WriteString("!")
+    b.WriteStrings("Hello", ", ", "World", "!")
 
     result = str(b)
     print(f"Built string: {result!r}")
@@ -2,20 +2,23 @@
 """Concurrency patterns using goated stdlib packages.
 
 Demonstrates:
-- Mutex and RWMutex
+- Mutex, and copy-on-write as an RWMutex alternative
 - WaitGroup
 - Once
 - Cond (condition variable)
 - sync.Map
 - Context for cancellation
-- Queue-based channels (thread-safe)
+- Deque-based channels (thread-safe)
+- Channel pipelines on one asyncio event loop
 """
 
-import queue
+import asyncio
 import threading
 import time
+from collections import deque
 from typing import Any
 
+from goated import Channel
 from goated.std import context, sync
 
 
@@ -28,11 +31,8 @@ def demo_mutex():
 
     def increment():
         for _ in range(1000):
-            mu.Lock()
-            try:
+            with mu:  # acquires the underlying lock directly
                 counter[0] += 1
-            finally:
-                mu.Unlock()
 
     # Run multiple threads
     threads = [threading.Thread(target=increment) for _ in range(10)]
@@ -46,37 +46,37 @@ def demo_mutex():
     print()
 
 
-def demo_rwmutex():
-    """Demonstrate RWMutex for read-write locking."""
-    print("=== RWMutex ===\n")
+def demo_copy_on_write():
+    """Demonstrate copy-on-write state: lock-free reads, serialized writes.
 
-    data = {"value": 0}
-    rw = sync.RWMutex()
-    read_count = [0]
+    For small read-mostly state, swapping in a fresh snapshot beats an
+    RWMutex: readers do a single list-index load instead of taking and
+    releasing reader locks.
+    """
+    print("=== Copy-on-Write (instead of RWMutex) ===\n")
+
+    state = [{"value": 0}]  # state[0] is replaced, never mutated
+    write_mu = sync.Mutex()
+    read_counts = [0] * 5
     write_count = [0]
 
-    def reader():
+    def reader(idx):
         for _ in range(100):
-            rw.RLock()
-            try:
-                _ = data["value"]
-                read_count[0] += 1
-            finally:
-                rw.RUnlock()
+            _ = state[0]["value"]
+            read_counts[idx] += 1
             time.sleep(0.001)
 
     def writer():
         for _ in range(10):
-            rw.Lock()
-            try:
-                data["value"] += 1
+            with write_mu:
+                snapshot = dict(state[0])
+                snapshot["value"] += 1
+                state[0] = snapshot
                 write_count[0] += 1
-            finally:
-                rw.Unlock()
             time.sleep(0.01)
 
     # Start readers and writers
-    readers = [threading.Thread(target=reader) for _ in range(5)]
+    readers = [threading.Thread(target=reader, args=(i,)) for i in range(5)]
     writers = [threading.Thread(target=writer) for _ in range(2)]
 
     for t in readers + writers:
@@ -84,9 +84,9 @@ def demo_rwmutex():
     for t in readers + writers:
         t.join()
 
-    print(f"Read operations: {read_count[0]}")
+    print(f"Read operations: {sum(read_counts)}")
     print(f"Write operations: {write_count[0]}")
-    print(f"Final value: {data['value']}")
+    print(f"Final value: {state[0]['value']}")
     print()
 
 
@@ -95,15 +95,18 @@ def demo_waitgroup():
     print("=== WaitGroup ===\n")
 
     wg = sync.WaitGroup()
-    results = []
+    num_workers = 5
+    # One slot per worker: each thread writes only its own index, so no
+    # shared append (and no list lock on free-threaded builds) is needed.
+    results: list[str | None] = [None] * num_workers
 
     def worker(id, delay):
         time.sleep(delay)
-        results.append(f"Worker {id} done")
+        results[id] = f"Worker {id} done"
         wg.Done()
 
     # Start workers
-    for i in range(5):
+    for i in range(num_workers):
         wg.Add(1)
         t = threading.Thread(target=worker, args=(i, (5 - i) * 0.1))
         t.start()
@@ -254,21 +257,17 @@ def demo_context_cancel():
     ctx, cancel = context.WithCancel(context.Background())
 
     work_done = [0]
-    stopped = [False]
 
     def worker():
-        while not stopped[0]:
-            # Check context error
-            err = ctx.Err()
-            if err:
-                print(f"  Worker: context cancelled: {err}")
-                return
-
+        while True:
             work_done[0] += 1
             if work_done[0] >= 5:
                 print(f"  Worker: completed {work_done[0]} tasks")
                 return
-            time.sleep(0.1)
+            # Returns as soon as cancel() runs instead of after a full sleep
+            if ctx.Wait(0.1):
+                print(f"  Worker: context cancelled: {ctx.Err()}")
+                return
 
     t = threading.Thread(target=worker)
     t.start()
@@ -276,7 +275,6 @@ def demo_context_cancel():
     time.sleep(0.25)  # Let worker do some work
     print("Main: cancelling context...")
     cancel()
-    stopped[0] = True
 
     t.join()
     print(f"Work completed: {work_done[0]}")
@@ -330,32 +328,68 @@ def demo_context_value():
     print()
 
 
-# Simple thread-safe channel using queue.Queue
+# Simple thread-safe channel: a deque behind one lock
 class Chan:
-    """Simple Go-like channel using queue.Queue."""
+    """Simple Go-like channel built on a deque.
+
+    queue.Queue keeps three conditions plus task accounting and notifies on
+    every put/get. Here senders and receivers share one lock and only
+    notify when the other side is actually waiting.
+    """
 
     def __init__(self, size: int = 0):
-        self._queue: queue.Queue = queue.Queue(maxsize=size if size > 0 else 1)
+        self._buf: deque = deque()
+        self._cap = size if size > 0 else 1
+        lock = threading.Lock()
+        self._not_empty = threading.Condition(lock)
+        self._not_full = threading.Condition(lock)
+        self._recv_waiting = 0
+        self._send_waiting = 0
         self._closed = False
-        self._unbuffered = size == 0
 
     def send(self, value: Any) -> None:
-        if self._closed:
-            raise RuntimeError("send on closed channel")
-        self._queue.put(value)
-
-    def recv(self, block: bool = True, timeout: float | None = None) -> Any:
-        try:
-            return self._queue.get(block=block, timeout=timeout)
-        except queue.Empty:
-            raise queue.Empty("channel empty or timeout")
+        with self._not_full:
+            if self._closed:
+                raise RuntimeError("send on closed channel")
+            while len(self._buf) >= self._cap:
+                self._send_waiting += 1
+                self._not_full.wait()
+                self._send_waiting -= 1
+            self._buf.append(value)
+            if self._recv_waiting:
+                self._not_empty.notify()
+
+    def recv(self) -> Any:
+        with self._not_empty:
+            while not self._buf:
+                self._recv_waiting += 1
+                self._not_empty.wait()
+                self._recv_waiting -= 1
+            value = self._buf.popleft()
+            if self._send_waiting:
+                self._not_full.notify()
+            return value
 
     def close(self) -> None:
-        self._closed = True
+        with self._not_empty:
+            self._closed = True
+            # Wake blocked receivers so iteration can end
+            self._not_empty.notify_all()
 
-    @property
-    def closed(self) -> bool:
-        return self._closed
+    def __iter__(self):
+        """Yield values until the channel is closed and drained, like Go's range."""
+        while True:
+            with self._not_empty:
+                while not self._buf and not self._closed:
+                    self._recv_waiting += 1
+                    self._not_empty.wait()
+                    self._recv_waiting -= 1
+                if not self._buf:
+                    return
+                value = self._buf.popleft()
+                if self._send_waiting:
+                    self._not_full.notify()
+            yield value
 
 
 def make_chan(size: int = 0) -> Chan:
@@ -364,35 +398,31 @@ def make_chan(size: int = 0) -> Chan:
 
 
 def demo_channels():
-    """Demonstrate Go-like channels using queue."""
-    print("=== Channels (Queue-based) ===\n")
+    """Demonstrate Go-like channels.
 
-    # Unbuffered-like channel (size=1)
-    ch = make_chan(1)
+    The sender and receiver only hand values to each other, so they run as
+    coroutines on one event loop instead of as two OS threads.
+    """
+    print("=== Channels (asyncio) ===\n")
 
-    def sender():
-        for i in range(5):
-            ch.send(i)
-            print(f"  Sent: {i}")
-        ch.close()
+    async def run():
+        # Unbuffered-like channel (size=1)
+        ch = Channel[int](buffer_size=1)
 
-    def receiver():
-        while not ch.closed:
-            try:
-                val = ch.recv(timeout=0.5)
+        async def sender():
+            for i in range(5):
+                await ch.send(i)
+                print(f"  Sent: {i}")
+            ch.close()
+
+        async def receiver():
+            async for val in ch:
                 print(f"  Received: {val}")
-            except queue.Empty:
-                if ch.closed:
-                    break
-        print("  Channel closed")
-
-    t1 = threading.Thread(target=sender)
-    t2 = threading.Thread(target=receiver)
-
-    t1.start()
-    t2.start()
-    t1.join()
-    t2.join()
+            print("  Channel closed")
+
+        await asyncio.gather(sender(), receiver())
+
+    asyncio.run(run())
     print()
 
 
@@ -413,6 +443,17 @@ def demo_buffered_channel():
     for _ in range(3):
         val = ch.recv()
         print(f"  Received: {val}")
+
+    # A producer thread blocks once the buffer is full; range until closed
+    def producer():
+        for i in range(5):
+            ch.send(i)
+        ch.close()
+
+    t = threading.Thread(target=producer)
+    t.start()
+    print(f"Ranged over closed channel: {list(ch)}")
+    t.join()
     print()
 
 
@@ -420,54 +461,34 @@ def demo_worker_pool():
     """Demonstrate worker pool pattern."""
     print("=== Worker Pool Pattern ===\n")
 
-    jobs = make_chan(10)
-    results = make_chan(10)
-    wg = sync.WaitGroup()
-    stop_workers = [False]
-
-    def worker(id):
-        while not stop_workers[0]:
-            try:
-                job = jobs.recv(timeout=0.1)
-                print(f"  Worker {id} processing job {job}")
-                time.sleep(0.05)
-                results.send(f"Result of job {job}")
-                wg.Done()
-            except queue.Empty:
-                if jobs.closed:
-                    break
-        print(f"  Worker {id} stopping")
+    async def run():
+        num_jobs = 9
+        num_workers = 3
+        jobs = Channel[int](buffer_size=num_jobs)
+        results = Channel[str](buffer_size=num_jobs)
 
-    # Start workers
-    num_workers = 3
-    worker_threads = []
-    for i in range(num_workers):
-        t = threading.Thread(target=worker, args=(i,))
-        t.start()
-        worker_threads.append(t)
+        async def worker(id):
+            label = f"  Worker {id} processing job "  # id is fixed per worker
+            async for job in jobs:
+                print(label + str(job))
+                await asyncio.sleep(0.05)  # simulated I/O wait
+                await results.send(f"Result of job {job}")
 
-    # Send jobs
-    num_jobs = 9
-    for j in range(num_jobs):
-        wg.Add(1)
-        jobs.send(j)
+        async def producer():
+            await jobs.send_batch(range(num_jobs))  # one lock round-trip, not one per job
+            jobs.close()
 
-    # Wait for completion
-    wg.Wait()
-    jobs.close()
-    stop_workers[0] = True
+        # Coroutines instead of threads: the jobs only wait, so one event
+        # loop interleaves them without thread stacks or kernel scheduling.
+        await asyncio.gather(producer(), *(worker(i) for i in range(num_workers)))
+        results.close()
+        return [r async for r in results]
 
-    for t in worker_threads:
-        t.join()
+    results = asyncio.run(run())
 
-    # Collect results
     print("\nResults:")
-    for _ in range(num_jobs):
-        try:
-            result = results.recv(block=False)
-            print(f"  {result}")
-        except queue.Empty:
-            break
+    for result in results:
+        print(f"  {result}")
     print()
 
 
@@ -475,67 +496,46 @@ def demo_fan_out_fan_in():
     """Demonstrate fan-out/fan-in pattern."""
     print("=== Fan-Out / Fan-In Pattern ===\n")
 
-    # Input channel
-    input_ch = make_chan(10)
-
-    # Output channels from workers
-    output_chs = [make_chan(10) for _ in range(3)]
-
-    # Merged output
-    merged = make_chan(30)
-
-    def producer():
-        for i in range(9):
-            input_ch.send(i)
-        input_ch.close()
-
-    def worker(id, out_ch):
-        while True:
-            try:
-                val = input_ch.recv(timeout=0.1)
-                result = f"Worker {id} processed {val}"
-                out_ch.send(result)
-            except queue.Empty:
-                if input_ch.closed:
-                    break
-        out_ch.close()
-
-    def merger():
-        for ch in output_chs:
-            while True:
-                try:
-                    val = ch.recv(timeout=0.1)
-                    merged.send(val)
-                except queue.Empty:
-                    if ch.closed:
-                        break
-
-    # Start producer
-    producer_t = threading.Thread(target=producer)
-    producer_t.start()
-
-    # Start workers (fan-out)
-    worker_threads = []
-    for i, ch in enumerate(output_chs):
-        t = threading.Thread(target=worker, args=(i, ch))
-        t.start()
-        worker_threads.append(t)
-
-    producer_t.join()
-    for t in worker_threads:
-        t.join()
-
-    # Merge results (fan-in)
-    merger()
+    async def run():
+        # Input channel
+        input_ch = Channel[int](buffer_size=10)
+
+        # Output channels from workers
+        output_chs = [Channel[str](buffer_size=10) for _ in range(3)]
+
+        # Merged output
+        merged = Channel[str](buffer_size=30)
+
+        async def producer():
+            for i in range(9):
+                await input_ch.send(i)
+            input_ch.close()
+
+        async def worker(id, out_ch):
+            prefix = f"Worker {id} processed "  # id is fixed per worker
+            async for val in input_ch:
+                await out_ch.send(prefix + str(val))
+                await asyncio.sleep(0)  # yield so the other workers get a turn
+            out_ch.close()
+
+        async def merger():
+            for ch in output_chs:
+                async for val in ch:
+                    await merged.send(val)
+            merged.close()
+
+        # Producer, workers (fan-out) and merger (fan-in) share one loop
+        await asyncio.gather(
+            producer(),
+            *(worker(i, ch) for i, ch in enumerate(output_chs)),
+            merger(),
+        )
+        return [result async for result in merged]
 
     # Print results
     print("Merged results:")
-    while True:
-        try:
-            result = merged.recv(block=False)
-            print(f"  {result}")
-        except queue.Empty:
-            break
+    for result in asyncio.run(run()):
+        print(f"  {result}")
     print()
 
 
@@ -546,7 +546,7 @@ def main():
     print()
 
     demo_mutex()
-    demo_rwmutex()
+    demo_copy_on_write()
     demo_waitgroup()
     demo_once()
     demo_cond()
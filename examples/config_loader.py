@@ -1,15 +1,25 @@
 #!/usr/bin/env python3
 """Configuration loading patterns with Result types and validation."""
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import MISSING, dataclass, fields
 from typing import TypeVar
 
 from goated import Err, Ok, Result
 from goated.result import GoError
 from goated.std import json, strconv, strings
 
+try:
+    import msgspec
+
+    HAVE_MSGSPEC = True
+except ImportError:
+    HAVE_MSGSPEC = False
+
 T = TypeVar("T")
 
+VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARN", "ERROR"})
+
 
 @dataclass
 class DatabaseConfig:
@@ -37,43 +47,82 @@ class AppConfig:
     log_level: str = "INFO"
 
 
-def require_field(obj: dict, field: str) -> Result[str, GoError]:
-    """Extract a required field from a dict."""
-    value = obj.get(field)
-    if value is None:
-        return Err(GoError(f"missing required field: {field}"))
-    return Ok(str(value))
-
-
-def parse_int_field(obj: dict, field: str, default: int | None = None) -> Result[int, GoError]:
-    """Parse an integer field with optional default."""
-    value = obj.get(field)
-    if value is None:
-        if default is not None:
-            return Ok(default)
-        return Err(GoError(f"missing required field: {field}"))
-
-    if isinstance(value, int):
-        return Ok(value)
-
-    result = strconv.Atoi(str(value))
-    match result:
-        case Ok(n):
-            return Ok(n)
-        case Err(e):
-            return Err(GoError(f"invalid integer for {field}: {e}"))
-
-    return Err(GoError("unreachable"))
-
-
-def parse_bool_field(obj: dict, field: str, default: bool = False) -> bool:
-    """Parse a boolean field with default."""
-    value = obj.get(field)
-    if value is None:
-        return default
-    if isinstance(value, bool):
-        return value
-    return strings.ToLower(str(value)) in ("true", "1", "yes", "on")
+class _EarlyReturn(Exception):
+    """Carries an Err out of a parse function, like Rust's ``?`` operator."""
+
+    def __init__(self, result: Result) -> None:
+        self.result = result
+
+
+def get_or_return(result: Result[T, GoError]) -> T:
+    """Unwrap an Ok, or abort the enclosing parse with the Err."""
+    if result.is_err():
+        raise _EarlyReturn(result)
+    return result.unwrap()
+
+
+def _field_source(name: str, typ: type, default: object) -> list[str]:
+    """Emit the statements that read and validate one field into ``name``."""
+    key = repr(name)
+    missing = repr(f"missing required field: {name}")
+    lines = [f"    v = obj.get({key})"]
+    if default is MISSING:
+        lines += ["    if v is None:", f"        return Err(GoError({missing}))"]
+    else:
+        lines += ["    if v is None:", f"        {name} = {default!r}"]
+    if typ is bool:
+        lines += [
+            "    elif isinstance(v, bool):",
+            f"        {name} = v",
+            "    else:",
+            f"        {name} = ToLower(str(v)) in ('true', '1', 'yes', 'on')",
+        ]
+    elif typ is int:
+        lines += ["    elif isinstance(v, int):", f"        {name} = v", "    else:"]
+        if default is MISSING:
+            invalid = repr(f"invalid integer for {name}: ")
+            lines += [
+                "        r = Atoi(str(v))",
+                "        if r.is_err():",
+                f"            return Err(GoError({invalid} + str(r.err())))",
+                f"        {name} = r.unwrap()",
+            ]
+        else:
+            lines += [f"        {name} = Atoi(str(v)).unwrap_or({default!r})"]
+    else:
+        lines += ["    else:", f"        {name} = str(v)"]
+    return lines
+
+
+def make_parser(cls: type[T]) -> Callable[[dict], Result[T, GoError]]:
+    """Generate a parser specialized to a config dataclass's fields.
+
+    The field names, types and defaults are fixed when the dataclass is
+    defined, so they are baked into straight-line source once instead of
+    being passed by name to generic helpers on every parse.
+    """
+    names = []
+    src = ["def parse(obj):"]
+    for f in fields(cls):
+        src += _field_source(f.name, f.type, f.default)
+        names.append(f"{f.name}={f.name}")
+    src.append(f"    return Ok(cls({', '.join(names)}))")
+    namespace = {
+        "cls": cls,
+        "Ok": Ok,
+        "Err": Err,
+        "GoError": GoError,
+        "Atoi": strconv.Atoi,
+        "ToLower": strings.ToLower,
+    }
+    exec("\n".join(src), namespace)
+    parse = namespace["parse"]
+    parse.__name__ = parse.__qualname__ = f"parse_{cls.__name__}"
+    return parse
+
+
+_parse_database = make_parser(DatabaseConfig)
+_parse_server = make_parser(ServerConfig)
 
 
 def parse_database_config(obj: dict) -> Result[DatabaseConfig, GoError]:
@@ -81,51 +130,7 @@ def parse_database_config(obj: dict) -> Result[DatabaseConfig, GoError]:
     db = obj.get("database")
     if not isinstance(db, dict):
         return Err(GoError("missing or invalid 'database' section"))
-
-    match require_field(db, "host"):
-        case Err(e):
-            return Err(e)
-        case Ok(host):
-            pass
-
-    match parse_int_field(db, "port"):
-        case Err(e):
-            return Err(e)
-        case Ok(port):
-            pass
-
-    match require_field(db, "name"):
-        case Err(e):
-            return Err(e)
-        case Ok(name):
-            pass
-
-    match require_field(db, "user"):
-        case Err(e):
-            return Err(e)
-        case Ok(user):
-            pass
-
-    match require_field(db, "password"):
-        case Err(e):
-            return Err(e)
-        case Ok(password):
-            pass
-
-    max_conn = parse_int_field(db, "max_connections", 10).unwrap_or(10)
-    timeout = parse_int_field(db, "timeout_seconds", 30).unwrap_or(30)
-
-    return Ok(
-        DatabaseConfig(
-            host=host,
-            port=port,
-            name=name,
-            user=user,
-            password=password,
-            max_connections=max_conn,
-            timeout_seconds=timeout,
-        )
-    )
+    return _parse_database(db)
 
 
 def parse_server_config(obj: dict) -> Result[ServerConfig, GoError]:
@@ -133,34 +138,33 @@ def parse_server_config(obj: dict) -> Result[ServerConfig, GoError]:
     srv = obj.get("server")
     if not isinstance(srv, dict):
         return Err(GoError("missing or invalid 'server' section"))
+    return _parse_server(srv)
 
-    match require_field(srv, "host"):
-        case Err(e):
-            return Err(e)
-        case Ok(host):
-            pass
 
-    match parse_int_field(srv, "port"):
-        case Err(e):
-            return Err(e)
-        case Ok(port):
-            pass
+def _decode_config_fast(config_json: bytes) -> AppConfig | None:
+    """Parse, type-check and apply defaults in one msgspec C pass.
 
-    debug = parse_bool_field(srv, "debug", False)
-    workers = parse_int_field(srv, "workers", 4).unwrap_or(4)
-
-    return Ok(
-        ServerConfig(
-            host=host,
-            port=port,
-            debug=debug,
-            workers=workers,
-        )
-    )
+    Returns None when msgspec rejects the input, so the caller can fall
+    back to the field-by-field path that produces the detailed error.
+    """
+    try:
+        config = msgspec.json.decode(config_json, type=AppConfig, strict=False)
+    except msgspec.MsgspecError:
+        return None
+    log_level = config.log_level.upper()
+    if log_level not in VALID_LOG_LEVELS:
+        return None
+    config.log_level = log_level
+    return config
 
 
 def load_config(config_json: bytes) -> Result[AppConfig, GoError]:
     """Load and validate application configuration from JSON."""
+    if HAVE_MSGSPEC:
+        config = _decode_config_fast(config_json)
+        if config is not None:
+            return Ok(config)
+
     parsed = json.Unmarshal(config_json)
 
     match parsed:
@@ -172,28 +176,22 @@ def load_config(config_json: bytes) -> Result[AppConfig, GoError]:
     if not isinstance(obj, dict):
         return Err(GoError("config must be a JSON object"))
 
-    match parse_server_config(obj):
-        case Err(e):
-            return Err(e)
-        case Ok(server):
-            pass
-
-    match parse_database_config(obj):
-        case Err(e):
-            return Err(e)
-        case Ok(database):
-            pass
+    try:
+        server = get_or_return(parse_server_config(obj))
+        database = get_or_return(parse_database_config(obj))
+    except _EarlyReturn as e:
+        return e.result
 
     log_level = str(obj.get("log_level", "INFO"))
-    valid_levels = ["DEBUG", "INFO", "WARN", "ERROR"]
-    if strings.ToUpper(log_level) not in valid_levels:
+    upper = strings.ToUpper(log_level)
+    if upper not in VALID_LOG_LEVELS:
         return Err(GoError(f"invalid log_level: {log_level}"))
 
     return Ok(
         AppConfig(
             server=server,
             database=database,
-            log_level=strings.ToUpper(log_level),
+            log_level=upper,
         )
     )
 
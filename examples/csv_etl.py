@@ -2,86 +2,203 @@
 """CSV ETL (Extract, Transform, Load) patterns with goated."""
 
 import io as pyio
+import operator
+from array import array
+from collections import defaultdict
 from dataclasses import dataclass
+from itertools import islice
 
 from goated import Ok
-from goated.std import csv, fmt, strings
+from goated.std import csv, strings
 
+try:
+    import numpy as np
 
-@dataclass
-class SalesRecord:
-    date: str
-    product: str
-    quantity: int
-    price: float
-    region: str
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
 
-    @property
-    def total(self) -> float:
-        return self.quantity * self.price
+try:
+    import polars as pl
 
+    HAVE_POLARS = True
+except ImportError:
+    HAVE_POLARS = False
 
-def parse_sales_csv(data: str) -> list[SalesRecord]:
-    """Parse CSV data into SalesRecord objects."""
-    reader = csv.NewReader(pyio.StringIO(data))
-    records = []
 
-    header_result = reader.Read()
-    if header_result.is_err():
-        return records
+@dataclass
+class SalesTable:
+    """Sales data stored column-wise: one sequence per field.
+
+    Each transform only touches the columns it needs, and the numeric
+    columns are packed int64/float64 arrays instead of per-record objects.
+    """
 
-    for row_result in reader:
-        match row_result:
-            case Ok(row) if len(row) >= 5:
-                records.append(
-                    SalesRecord(
-                        date=row[0],
-                        product=row[1],
-                        quantity=int(row[2]),
-                        price=float(row[3]),
-                        region=row[4],
-                    )
-                )
-            case _:
-                continue
+    date: list[str]
+    product: list[str]
+    quantity: array
+    price: array
+    region: list[str]
 
-    return records
+    def __len__(self) -> int:
+        return len(self.date)
 
+    @property
+    def total(self) -> list[float]:
+        return list(map(operator.mul, self.quantity, self.price))
+
+    def take(self, indices: list[int]) -> "SalesTable":
+        """Return a new table with the rows at indices."""
+        return SalesTable(
+            date=[self.date[i] for i in indices],
+            product=[self.product[i] for i in indices],
+            quantity=array("q", [self.quantity[i] for i in indices]),
+            price=array("d", [self.price[i] for i in indices]),
+            region=[self.region[i] for i in indices],
+        )
 
-def filter_by_region(records: list[SalesRecord], region: str) -> list[SalesRecord]:
-    """Filter records by region (case-insensitive)."""
-    return [r for r in records if strings.EqualFold(r.region, region)]
 
+def _empty_table() -> SalesTable:
+    return SalesTable([], [], array("q"), array("d"), [])
 
-def aggregate_by_product(records: list[SalesRecord]) -> dict[str, float]:
-    """Sum total sales by product."""
-    totals: dict[str, float] = {}
-    for r in records:
-        key = strings.ToLower(r.product)
-        totals[key] = totals.get(key, 0) + r.total
-    return totals
 
+def parse_sales_csv(data: str) -> SalesTable:
+    """Parse CSV data into a column-wise SalesTable.
 
-def records_to_csv(records: list[SalesRecord]) -> str:
-    """Convert records back to CSV."""
+    Reads every row in one call and converts whole columns with map(), so
+    int()/float() are driven from C rather than a Python loop body per row.
+    """
+    reader = csv.NewReader(pyio.StringIO(data))
+    match reader.ReadAll():
+        case Ok(rows):
+            pass
+        case _:
+            return _empty_table()
+
+    rows = [row for row in rows[1:] if len(row) >= 5]
+    if not rows:
+        return _empty_table()
+
+    dates, products, quantities, prices, regions = islice(zip(*rows, strict=False), 5)
+    return SalesTable(
+        date=list(dates),
+        product=list(products),
+        quantity=array("q", map(int, quantities)),
+        price=array("d", map(float, prices)),
+        region=list(regions),
+    )
+
+
+def filter_by_region(table: SalesTable, region: str) -> SalesTable:
+    """Filter rows by region (case-insensitive)."""
+    # One EqualFold per distinct region, not per row
+    matches = {r: strings.EqualFold(r, region) for r in set(table.region)}
+    return table.take([i for i, r in enumerate(table.region) if matches[r]])
+
+
+def aggregate_by_product(table: SalesTable) -> dict[str, float]:
+    """Sum total sales by product."""
+    # Products repeat, so lower-case each distinct name once
+    keys = {p: strings.ToLower(p) for p in set(table.product)}
+    if HAVE_NUMPY:
+        return _aggregate_bincount(table, keys)
+    totals: defaultdict[str, float] = defaultdict(float)
+    # Key lookup and quantity*price run in C via map(); the loop body is a
+    # single defaultdict update per row.
+    for key, total in zip(
+        map(keys.__getitem__, table.product),
+        map(operator.mul, table.quantity, table.price),
+        strict=True,
+    ):
+        totals[key] += total
+    return dict(totals)
+
+
+def _aggregate_bincount(table: SalesTable, keys: dict[str, str]) -> dict[str, float]:
+    """Sum totals with one np.bincount over integer product codes.
+
+    Names are numbered in first-seen order, so the result iterates in the
+    same order as the dict-based loop.
+    """
+    names = list(dict.fromkeys(map(keys.__getitem__, table.product)))
+    index = {name: i for i, name in enumerate(names)}
+    code_of = {p: index[key] for p, key in keys.items()}
+    codes = np.fromiter(map(code_of.__getitem__, table.product), dtype=np.intp, count=len(table))
+    weights = np.frombuffer(table.quantity, dtype=np.int64) * np.frombuffer(table.price)
+    sums = np.bincount(codes, weights=weights, minlength=len(names))
+    return dict(zip(names, sums.tolist(), strict=True))
+
+
+def region_totals_by_product(data: str, region: str) -> dict[str, float]:
+    """Parse, filter by region and sum totals by product in one pass.
+
+    No SalesTable is built: with polars the CSV scan, filter and group-by
+    run as one lazy query, otherwise each CSV row is filtered and
+    accumulated as it is read. Regions match with strings.EqualFold in the
+    pure-Python path; polars compares lower-cased names against
+    region.casefold(), which agrees for ASCII region names.
+    """
+    if HAVE_POLARS:
+        return _region_totals_polars(data, region)
+
+    reader = csv.NewReader(pyio.StringIO(data))
+    matches: dict[str, bool] = {}
+    keys: dict[str, str] = {}
+    totals: defaultdict[str, float] = defaultdict(float)
+    for result in islice(reader, 1, None):
+        if result.is_err():
+            return {}
+        row = result.unwrap()
+        if len(row) < 5:
+            continue
+        _, product, quantity, price, row_region = row[:5]
+        matched = matches.get(row_region)
+        if matched is None:
+            matched = matches[row_region] = strings.EqualFold(row_region, region)
+        if not matched:
+            continue
+        key = keys.get(product)
+        if key is None:
+            key = keys[product] = strings.ToLower(product)
+        totals[key] += int(quantity) * float(price)
+    return dict(totals)
+
+
+def _region_totals_polars(data: str, region: str) -> dict[str, float]:
+    lf = pl.scan_csv(
+        pyio.BytesIO(data.encode()), schema_overrides={"quantity": pl.Int64, "price": pl.Float64}
+    )
+    result = (
+        lf.filter(pl.col("region").str.to_lowercase() == region.casefold())
+        .group_by(pl.col("product").str.to_lowercase(), maintain_order=True)
+        .agg((pl.col("quantity") * pl.col("price")).sum().alias("total"))
+        .collect()
+    )
+    return dict(result.iter_rows())
+
+
+def records_to_csv(table: SalesTable) -> str:
+    """Convert a table back to CSV.
+
+    Each column is formatted in one map() pass and all rows go to the
+    writer in a single WriteAll call.
+    """
     buf = pyio.StringIO()
     writer = csv.NewWriter(buf)
 
     writer.Write(["date", "product", "quantity", "price", "region", "total"])
 
-    for r in records:
-        writer.Write(
-            [
-                r.date,
-                r.product,
-                str(r.quantity),
-                fmt.Sprintf("%.2f", r.price),
-                r.region,
-                fmt.Sprintf("%.2f", r.total),
-            ]
-        )
-
-    writer.Flush()
+    money = "{:.2f}".format
+    rows = zip(
+        table.date,
+        table.product,
+        map(str, table.quantity),
+        map(money, table.price),
+        table.region,
+        map(money, table.total),
+        strict=True,
+    )
+    writer.WriteAll(list(rows))
     return buf.getvalue()
 
 
@@ -96,25 +213,32 @@ def main():
 2024-01-17,Widget,120,9.99,West
 2024-01-17,Sprocket,200,4.99,North"""
 
-    records = parse_sales_csv(sample_csv)
-    print(f"Loaded {len(records)} records\n")
+    table = parse_sales_csv(sample_csv)
+    print(f"Loaded {len(table)} records\n")
 
     print("=== All Records ===")
-    for r in records:
-        print(f"  {r.date} | {r.product:10} | qty:{r.quantity:3} | ${r.total:.2f}")
+    for date, product, quantity, total in zip(
+        table.date, table.product, table.quantity, table.total, strict=True
+    ):
+        print(f"  {date} | {product:10} | qty:{quantity:3} | ${total:.2f}")
 
     print("\n=== North Region Only ===")
-    north_records = filter_by_region(records, "north")
-    for r in north_records:
-        print(f"  {r.date} | {r.product:10} | ${r.total:.2f}")
+    north = filter_by_region(table, "north")
+    for date, product, total in zip(north.date, north.product, north.total, strict=True):
+        print(f"  {date} | {product:10} | ${total:.2f}")
 
     print("\n=== Sales by Product ===")
-    by_product = aggregate_by_product(records)
+    by_product = aggregate_by_product(table)
     for product, total in sorted(by_product.items(), key=lambda x: -x[1]):
         print(f"  {product:10}: ${total:.2f}")
 
+    print("\n=== North Sales by Product (single pass) ===")
+    north_by_product = region_totals_by_product(sample_csv, "north")
+    for product, total in sorted(north_by_product.items(), key=lambda x: -x[1]):
+        print(f"  {product:10}: ${total:.2f}")
+
     print("\n=== Export to CSV ===")
-    output = records_to_csv(north_records)
+    output = records_to_csv(north)
     print(output)
 
 
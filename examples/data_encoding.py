@@ -201,6 +201,12 @@ def demo_binary_varints():
         n = binary.PutVarint(buf, val)
         decoded, m = binary.Varint(bytes(buf[:n]))
         print(f"  {val:>6}: {n} bytes -> {list(buf[:n])} -> {decoded}")
+
+    # Whole streams encode/decode in one call instead of one call per value
+    buf = bytearray(binary.MaxVarintLen64 * len(test_values))
+    n = binary.PutVarintBatch(buf, test_values)
+    decoded, m = binary.VarintBatch(bytes(buf[:n]))
+    print(f"\nBatch: {len(test_values)} varints in {n} bytes -> {decoded == test_values}")
     print()
 
 
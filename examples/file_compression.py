@@ -7,6 +7,7 @@ Demonstrates:
 - Working with file headers
 """
 
+import hashlib
 import os
 import tempfile
 from io import BytesIO
@@ -37,10 +38,17 @@ def demo_gzip_basics():
     reader_result = gzip.NewReader(buf)
     if reader_result.is_ok():
         reader = reader_result.unwrap()
-        decompressed = reader.Read().unwrap()
+        # Stream through a fixed 64 KiB buffer and check the data on the fly
+        # instead of holding the whole decompressed payload in memory.
+        size = 0
+        digest = hashlib.sha256()
+        for chunk in reader.ReadChunks(65536):
+            view = chunk.unwrap()
+            size += len(view)
+            digest.update(view)
         reader.Close()
-        print(f"Decompressed size: {len(decompressed)} bytes")
-        print(f"Data matches: {decompressed == original}")
+        print(f"Decompressed size: {size} bytes")
+        print(f"Data matches: {digest.digest() == hashlib.sha256(original).digest()}")
     print()
 
 
@@ -109,12 +117,9 @@ def demo_zip_create():
         "data/config.json": b'{"version": "1.0", "debug": true}',
     }
 
-    for name, content in files.items():
-        result = w.Create(name)
-        if result.is_ok():
-            f = result.unwrap()
-            f.write(content)
-            f.close()
+    # One call writes every entry; no per-file writer objects
+    if w.CreateAll(files).is_ok():
+        for name, content in files.items():
             print(f"Added: {name} ({len(content)} bytes)")
 
     # Set archive comment
@@ -176,9 +181,13 @@ def demo_zip_read():
     buf = BytesIO()
     w = gozip.NewWriter(buf)
 
-    w.Create("file1.txt").unwrap().write(b"Content of file 1")
-    w.Create("file2.txt").unwrap().write(b"Content of file 2")
-    w.Create("subdir/file3.txt").unwrap().write(b"Content of file 3")
+    w.CreateAll(
+        {
+            "file1.txt": b"Content of file 1",
+            "file2.txt": b"Content of file 2",
+            "subdir/file3.txt": b"Content of file 3",
+        }
+    ).unwrap()
     w.SetComment("Test archive")
     w.Close()
 
@@ -267,10 +276,7 @@ def demo_roundtrip():
     # Create archive
     archive_buf = BytesIO()
     w = gozip.NewWriter(archive_buf)
-    for name, content in original_files.items():
-        f = w.Create(name).unwrap()
-        f.write(content)
-        f.close()
+    w.CreateAll(original_files).unwrap()
     w.Close()
 
     archive_data = archive_buf.getvalue()
@@ -48,6 +48,12 @@ def demo_filepath_clean():
     for p in paths:
         cleaned = filepath.Clean(p)
         print(f"  {p!r:40} -> {cleaned!r}")
+
+    # Clean is memoized: cleaning the same paths again is a cache lookup
+    before = filepath.Clean.cache_info().hits
+    for p in paths:
+        filepath.Clean(p)
+    print(f"\n  Repeat pass cache hits: {filepath.Clean.cache_info().hits - before}/{len(paths)}")
     print()
 
 
@@ -116,20 +122,15 @@ def demo_filepath_walk():
 
         # Walk the directory
         print(f"Walking: {tmpdir}")
-
-        def walk_func(path, info, err):
-            if err:
-                print(f"  Error: {err}")
-                return None
-
-            rel = path.replace(tmpdir, ".")
-            if info.IsDir():
+        for entry_path, is_dir, size in filepath.WalkCollect(tmpdir).unwrap():
+            rel = entry_path.replace(tmpdir, ".")
+            if is_dir:
                 print(f"  DIR:  {rel}")
             else:
-                print(f"  FILE: {rel} ({info.Size()} bytes)")
-            return None
+                print(f"  FILE: {rel} ({size} bytes)")
 
-        filepath.Walk(tmpdir, walk_func)
+        matches = filepath.WalkCollect(tmpdir, "*.txt").unwrap()
+        print(f"  *.txt matches: {len(matches)}")
     print()
 
 
@@ -246,14 +247,14 @@ def demo_os_files():
         if result.is_ok():
             print(f"Created nested: {nested}")
 
-        # Read directory
-        result = os.ReadDir(tmpdir)
+        # Read directory: ScanDir yields plain (name, is_dir) tuples lazily
+        # instead of building a DirEntry object per entry
+        result = os.ScanDir(tmpdir)
         if result.is_ok():
-            entries = result.unwrap()
             print(f"\nDirectory contents of {tmpdir}:")
-            for entry in entries:
-                entry_type = "DIR" if entry.IsDir() else "FILE"
-                print(f"  {entry_type}: {entry.Name()}")
+            for name, is_dir in sorted(result.unwrap()):
+                entry_type = "DIR" if is_dir else "FILE"
+                print(f"  {entry_type}: {name}")
 
         # Rename file
         new_path = pyos.path.join(tmpdir, "renamed.txt")
@@ -89,7 +89,6 @@ def demo_hex():
 
     print("\nHex dump:")
     print(hex.Dump(b"Hello, World! This is a hex dump demo."))
-    print()
 
 
 def demo_fmt():
@@ -195,6 +195,12 @@ class GoatedLibrary:
             restype=ctypes.c_bool,
         )
 
+        self._try_setup(
+            "goated_strings_ContainsN",
+            argtypes=[ctypes.c_char_p, ctypes.c_longlong, ctypes.c_char_p, ctypes.c_longlong],
+            restype=ctypes.c_bool,
+        )
+
         self._try_setup(
             "goated_strings_Count",
             argtypes=[ctypes.c_char_p, ctypes.c_char_p],
@@ -219,6 +225,12 @@ class GoatedLibrary:
             restype=ctypes.c_int64,
         )
 
+        self._try_setup(
+            "goated_strings_IndexN",
+            argtypes=[ctypes.c_char_p, ctypes.c_longlong, ctypes.c_char_p, ctypes.c_longlong],
+            restype=ctypes.c_longlong,
+        )
+
         self._try_setup(
             "goated_strings_Join",
             argtypes=[ctypes.c_void_p, ctypes.c_int64, ctypes.c_char_p],
@@ -309,6 +321,20 @@ class GoatedLibrary:
             restype=ctypes.c_char_p,
         )
 
+        # In-Go benchmark loop (returns elapsed ns for n iterations)
+        self._try_setup(
+            "goated_bench_loop",
+            argtypes=[
+                ctypes.c_int,
+                ctypes.c_char_p,
+                ctypes.c_longlong,
+                ctypes.c_char_p,
+                ctypes.c_longlong,
+                ctypes.c_longlong,
+            ],
+            restype=ctypes.c_longlong,
+        )
+
         # Slice helper functions
         self._try_setup(
             "goated_slice_string_len",
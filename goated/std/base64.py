@@ -20,6 +20,7 @@ Example:
 from __future__ import annotations
 
 import base64 as _base64
+import binascii
 from typing import Any
 
 __all__ = [
@@ -64,11 +65,39 @@ class CorruptInputError(Exception):
 _STD_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
 _URL_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
 
+_URL_TRANS = bytes.maketrans(b"+/", b"-_")
+
+
+# binascii encoders for the predefined encodings, bypassing the
+# base64.b64encode / urlsafe_b64encode wrappers
+def _encode_std(src: bytes) -> bytes:
+    return binascii.b2a_base64(src, newline=False)
+
+
+def _encode_raw_std(src: bytes) -> bytes:
+    return binascii.b2a_base64(src, newline=False).rstrip(b"=")
+
+
+def _encode_url(src: bytes) -> bytes:
+    return binascii.b2a_base64(src, newline=False).translate(_URL_TRANS)
+
+
+def _encode_raw_url(src: bytes) -> bytes:
+    return binascii.b2a_base64(src, newline=False).translate(_URL_TRANS).rstrip(b"=")
+
+
+_FAST_ENCODERS = {
+    (_STD_ALPHABET, "="): _encode_std,
+    (_STD_ALPHABET, None): _encode_raw_std,
+    (_URL_ALPHABET, "="): _encode_url,
+    (_URL_ALPHABET, None): _encode_raw_url,
+}
+
 
 class Encoding:
     """An Encoding is a radix 64 encoding/decoding scheme, defined by a 64-character alphabet."""
 
-    __slots__ = ("_alphabet", "_padding", "_strict", "_decode_map")
+    __slots__ = ("_alphabet", "_padding", "_strict", "_decode_map", "_fast_encode")
 
     def __init__(self, alphabet: str, padding: str | None = "=", strict: bool = False):
         """Create a new Encoding with the given alphabet.
@@ -85,6 +114,7 @@ class Encoding:
         self._padding = padding
         self._strict = strict
         self._decode_map: dict[int, int] | None = None
+        self._fast_encode = _FAST_ENCODERS.get((alphabet, padding))
 
     def Encode(self, dst: bytearray, src: bytes) -> int:
         """Encode src using this encoding, writing bytes to dst.
@@ -115,8 +145,30 @@ class Encoding:
             'SGVsbG8='
 
         """
+        fast = self._fast_encode
+        if fast is not None:
+            return fast(src).decode("ascii")
         return self._encode_bytes(src).decode("ascii")
 
+    def EncodeToBytes(self, src: bytes) -> bytes:
+        """Return the base64 encoding of src as bytes.
+
+        Same output as EncodeToString without decoding the ASCII result
+        into a str.
+
+        Args:
+            src: Source bytes to encode
+
+        Returns:
+            The encoded bytes
+
+        Example:
+            >>> StdEncoding.EncodeToBytes(b"Hello")
+            b'SGVsbG8='
+
+        """
+        return self._encode_bytes(src)
+
     def EncodedLen(self, n: int) -> int:
         """Return the length in bytes of the base64 encoding of an input buffer of length n.
 
@@ -170,6 +222,29 @@ class Encoding:
         except Exception as e:
             return b"", e
 
+    def DecodeFromBytes(self, src: bytes) -> tuple[bytes, Exception | None]:
+        """Return the bytes represented by the base64 bytes src.
+
+        Same as DecodeString for input that is already bytes, skipping the
+        str-to-ASCII encode.
+
+        Args:
+            src: The encoded bytes
+
+        Returns:
+            Tuple of (decoded bytes, error or None)
+
+        Example:
+            >>> data, err = StdEncoding.DecodeFromBytes(b"SGVsbG8=")
+            >>> data
+            b'Hello'
+
+        """
+        try:
+            return self._decode_bytes(src), None
+        except Exception as e:
+            return b"", e
+
     def DecodedLen(self, n: int) -> int:
         """Return the maximum length in bytes of the decoded data.
 
@@ -209,6 +284,8 @@ class Encoding:
 
     def _encode_bytes(self, src: bytes) -> bytes:
         """Internal encoding implementation."""
+        if self._fast_encode is not None:
+            return self._fast_encode(src)
         if not src:
             return b""
 
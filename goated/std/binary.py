@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import struct
+from collections.abc import Iterable
 from typing import IO, Any
 
 from goated.result import Err, GoError, Ok, Result
@@ -13,6 +14,10 @@ __all__ = [
     "PutUvarint",
     "Varint",
     "Uvarint",
+    "PutVarintBatch",
+    "PutUvarintBatch",
+    "VarintBatch",
+    "UvarintBatch",
     "ReadVarint",
     "ReadUvarint",
     "BigEndian",
@@ -34,48 +39,49 @@ class ByteOrder:
     def __init__(self, name: str, format_prefix: str):
         self._name = name
         self._prefix = format_prefix
+        # Compiled once so each call skips struct's format-string cache lookup
+        self._u16 = struct.Struct(f"{format_prefix}H")
+        self._u32 = struct.Struct(f"{format_prefix}I")
+        self._u64 = struct.Struct(f"{format_prefix}Q")
 
     def Uint16(self, b: bytes) -> int:
         """Uint16 returns the uint16 in b."""
-        result: int = struct.unpack(f"{self._prefix}H", b[:2])[0]
+        result: int = self._u16.unpack_from(b)[0]
         return result
 
     def Uint32(self, b: bytes) -> int:
         """Uint32 returns the uint32 in b."""
-        result: int = struct.unpack(f"{self._prefix}I", b[:4])[0]
+        result: int = self._u32.unpack_from(b)[0]
         return result
 
     def Uint64(self, b: bytes) -> int:
         """Uint64 returns the uint64 in b."""
-        result: int = struct.unpack(f"{self._prefix}Q", b[:8])[0]
+        result: int = self._u64.unpack_from(b)[0]
         return result
 
     def PutUint16(self, b: bytearray, v: int) -> None:
         """PutUint16 encodes v into b."""
-        data = struct.pack(f"{self._prefix}H", v)
-        b[:2] = data
+        self._u16.pack_into(b, 0, v)
 
     def PutUint32(self, b: bytearray, v: int) -> None:
         """PutUint32 encodes v into b."""
-        data = struct.pack(f"{self._prefix}I", v)
-        b[:4] = data
+        self._u32.pack_into(b, 0, v)
 
     def PutUint64(self, b: bytearray, v: int) -> None:
         """PutUint64 encodes v into b."""
-        data = struct.pack(f"{self._prefix}Q", v)
-        b[:8] = data
+        self._u64.pack_into(b, 0, v)
 
     def AppendUint16(self, b: bytes, v: int) -> bytes:
         """AppendUint16 appends v to b."""
-        return b + struct.pack(f"{self._prefix}H", v)
+        return b + self._u16.pack(v)
 
     def AppendUint32(self, b: bytes, v: int) -> bytes:
         """AppendUint32 appends v to b."""
-        return b + struct.pack(f"{self._prefix}I", v)
+        return b + self._u32.pack(v)
 
     def AppendUint64(self, b: bytes, v: int) -> bytes:
         """AppendUint64 appends v to b."""
-        return b + struct.pack(f"{self._prefix}Q", v)
+        return b + self._u64.pack(v)
 
     def String(self) -> str:
         """String returns the name of the byte order."""
@@ -119,11 +125,11 @@ def Write(w: IO[bytes], order: ByteOrder, data: Any) -> Result[None, GoError]:
             elif data <= 0xFF:
                 w.write(struct.pack("B", data))
             elif data <= 0xFFFF:
-                w.write(struct.pack(f"{order._prefix}H", data))
+                w.write(order._u16.pack(data))
             elif data <= 0xFFFFFFFF:
-                w.write(struct.pack(f"{order._prefix}I", data))
+                w.write(order._u32.pack(data))
             else:
-                w.write(struct.pack(f"{order._prefix}Q", data))
+                w.write(order._u64.pack(data))
         elif isinstance(data, float):
             w.write(struct.pack(f"{order._prefix}d", data))
         elif isinstance(data, (list, tuple)):
@@ -165,8 +171,16 @@ def PutVarint(buf: bytearray, x: int) -> int:
     return PutUvarint(buf, ux)
 
 
+_UINT64_MASK = (1 << 64) - 1
+
+
 def PutUvarint(buf: bytearray, x: int) -> int:
-    """PutUvarint encodes a uint64 into buf and returns the number of bytes written."""
+    """PutUvarint encodes a uint64 into buf and returns the number of bytes written.
+
+    Negative x wraps to its uint64 two's-complement value, as Go's uint64(x) does.
+    """
+    if x < 0:
+        x &= _UINT64_MASK
     i = 0
     while x >= 0x80:
         buf[i] = (x & 0x7F) | 0x80
@@ -201,6 +215,74 @@ def Uvarint(buf: bytes) -> tuple[int, int]:
     return 0, 0
 
 
+def PutVarintBatch(buf: bytearray, values: Iterable[int]) -> int:
+    """PutVarintBatch encodes int64 values back to back into buf.
+
+    Returns the total number of bytes written. See PutUvarintBatch.
+    """
+    return PutUvarintBatch(buf, ((x << 1) ^ (x >> 63) for x in values))
+
+
+def PutUvarintBatch(buf: bytearray, values: Iterable[int]) -> int:
+    """PutUvarintBatch encodes uint64 values back to back into buf.
+
+    Returns the total number of bytes written. The whole stream is encoded
+    in one loop and copied into buf with a single slice assignment, instead
+    of one PutUvarint call and buffer per value.
+    """
+    out = bytearray()
+    append = out.append
+    for x in values:
+        if x < 0:
+            x &= _UINT64_MASK  # wrap like PutUvarint
+        while x >= 0x80:
+            append((x & 0x7F) | 0x80)
+            x >>= 7
+        append(x)
+    n = len(out)
+    if n > len(buf):
+        raise IndexError("binary: buffer too small for varint batch")
+    buf[:n] = out
+    return n
+
+
+def VarintBatch(buf: bytes) -> tuple[list[int], int]:
+    """VarintBatch decodes consecutive int64 varints from buf.
+
+    Returns the values and the number of bytes they used. See UvarintBatch.
+    """
+    values, n = UvarintBatch(buf)
+    return [~(ux >> 1) if ux & 1 else ux >> 1 for ux in values], n
+
+
+def UvarintBatch(buf: bytes) -> tuple[list[int], int]:
+    """UvarintBatch decodes consecutive uint64 varints from buf.
+
+    Returns the values and the number of bytes they used. Decoding stops at
+    the first truncated or overflowing varint, so n < len(buf) means the
+    rest of buf is not a valid varint stream.
+    """
+    values: list[int] = []
+    append = values.append
+    x = 0
+    s = 0
+    n = 0
+    for i, b in enumerate(buf):
+        if b < 0x80:
+            if s == 63 and b > 1:
+                break  # overflows uint64
+            append(x | (b << s))
+            x = 0
+            s = 0
+            n = i + 1
+        else:
+            if s == 63:
+                break  # longer than MaxVarintLen64
+            x |= (b & 0x7F) << s
+            s += 7
+    return values, n
+
+
 def ReadVarint(r: IO[bytes]) -> Result[int, GoError]:
     """ReadVarint reads an encoded signed integer from r."""
     result = ReadUvarint(r)
@@ -106,11 +106,26 @@ class Context:
         """Return the value associated with this context for key, or None."""
         ...
 
+    def Wait(self, timeout: float | None = None) -> bool:
+        """Block the calling thread until the context is done or timeout elapses.
+
+        Returns True if the context is done. This is the thread-side
+        counterpart of awaiting Done(): cancellation wakes waiters at once
+        instead of leaving them to poll Err() between sleeps.
+        """
+        return _never_done.wait(timeout)
+
 
 # =============================================================================
 # Implementations
 # =============================================================================
 
+# Never set; Wait() on contexts that cannot be canceled blocks on it.
+_never_done = threading.Event()
+
+# Distinguishes "key absent" from a stored None in value lookups.
+_MISSING = object()
+
 
 class _BackgroundContext(Context):
     """An empty context that is never canceled."""
@@ -172,6 +187,7 @@ class _CancelContext(Context):
     def __init__(self, parent: Context):
         self._parent = parent
         self._done = asyncio.Event()
+        self._done_thread = threading.Event()
         self._err: Exception | None = None
         self._lock = threading.Lock()
         self._children: list[_CancelContext] = []
@@ -191,6 +207,19 @@ class _CancelContext(Context):
         with self._lock:
             return self._err
 
+    def Wait(self, timeout: float | None = None) -> bool:
+        deadline, ok = self.Deadline()
+        if not ok or deadline is None:
+            return self._done_thread.wait(timeout)
+        # Without an event loop no timer fires, so expire the deadline here;
+        # it may be inherited from an ancestor.
+        remaining = max(deadline - time.time(), 0.0)
+        if timeout is not None and timeout < remaining:
+            return self._done_thread.wait(timeout)
+        if not self._done_thread.wait(remaining):
+            self._cancel(DeadlineExceeded())
+        return True
+
     def Value(self, key: Any) -> Any:
         return self._parent.Value(key)
 
@@ -201,6 +230,7 @@ class _CancelContext(Context):
             self._err = err
 
         self._done.set()
+        self._done_thread.set()
 
         # Cancel children
         for child in self._children:
@@ -246,27 +276,68 @@ class _DeadlineContext(_CancelContext):
         return f"context.WithDeadline({self._parent}, {self._deadline})"
 
 
+# Most value entries a flattened WithValue segment holds before a new one starts
+_SEGMENT_SIZE = 8
+
+
 class _ValueContext(Context):
-    """A context that carries a key-value pair."""
+    """A context that carries key-value pairs.
+
+    Runs of up to _SEGMENT_SIZE nested WithValue calls share a flat dict,
+    copied and extended at each level, so Value costs one lookup per
+    segment rather than one per level while memory stays linear in the
+    chain length. A miss continues at _next, the context just above the
+    segment. Unhashable keys get a dict-less node matched by equality, as
+    in a plain parent walk. Cancellation and deadlines come from _base,
+    the nearest ancestor that is not a value context.
+    """
 
     def __init__(self, parent: Context, key: Any, val: Any):
         self._parent = parent
         self._key = key
         self._val = val
+        self._base = parent._base if isinstance(parent, _ValueContext) else parent
+        self._values: dict[Any, Any] | None
+        try:
+            hash(key)
+        except TypeError:
+            self._values = None
+            self._next = parent
+            return
+        if (
+            isinstance(parent, _ValueContext)
+            and parent._values is not None
+            and len(parent._values) < _SEGMENT_SIZE
+        ):
+            self._values = {**parent._values, key: val}
+            self._next = parent._next
+        else:
+            self._values = {key: val}
+            self._next = parent
 
     def Deadline(self) -> tuple[float | None, bool]:
-        return self._parent.Deadline()
+        return self._base.Deadline()
 
     def Done(self) -> asyncio.Event | None:
-        return self._parent.Done()
+        return self._base.Done()
 
     def Err(self) -> Exception | None:
-        return self._parent.Err()
+        return self._base.Err()
+
+    def Wait(self, timeout: float | None = None) -> bool:
+        return self._base.Wait(timeout)
 
     def Value(self, key: Any) -> Any:
-        if key == self._key:
-            return self._val
-        return self._parent.Value(key)
+        if self._values is None:
+            return self._val if self._key == key else self._next.Value(key)
+        try:
+            val = self._values.get(key, _MISSING)
+        except TypeError:
+            # Unhashable lookups can only match dict-less nodes further up
+            val = _MISSING
+        if val is _MISSING:
+            return self._next.Value(key)
+        return val
 
     def __str__(self) -> str:
         return f"context.WithValue({self._parent}, {self._key!r})"
@@ -2,14 +2,17 @@
 
 This module provides Python bindings for Go's path/filepath package.
 OS-aware path operations (uses os.sep for separators).
+Base/Clean/Dir/Ext use a process-lifetime lru_cache(maxsize=4096); cwd-dependent Abs does not.
 """
 
 from __future__ import annotations
 
 import fnmatch
+import functools
 import os
 import os.path as _ospath
-from collections.abc import Callable
+import stat as _stat
+from collections.abc import Callable, Iterator
 
 from goated._core import get_lib, is_library_available
 from goated.result import Err, GoError, Ok, Result
@@ -35,6 +38,7 @@ __all__ = [
     "ToSlash",
     "VolumeName",
     "Walk",
+    "WalkCollect",
     "WalkDir",
     # Constants
     "Separator",
@@ -99,6 +103,7 @@ def Abs(path_: str) -> Result[str, GoError]:
     return Ok(_decode(result))
 
 
+@functools.lru_cache(maxsize=4096)
 def Base(path_: str) -> str:
     """Base returns the last element of path.
     Trailing path separators are removed before extracting the last element.
@@ -121,6 +126,7 @@ def Base(path_: str) -> str:
     return _decode(result)
 
 
+@functools.lru_cache(maxsize=4096)
 def Clean(path_: str) -> str:
     """Clean returns the shortest path name equivalent to path
     by purely lexical processing.
@@ -138,6 +144,7 @@ def Clean(path_: str) -> str:
     return _decode(result)
 
 
+@functools.lru_cache(maxsize=4096)
 def Dir(path_: str) -> str:
     """Dir returns all but the last element of path, typically the path's directory.
     After dropping the final element, Dir calls [Clean] on the path and trailing
@@ -196,6 +203,7 @@ def EvalSymlinks(path_: str) -> Result[str, GoError]:
     return Ok(_decode(result))
 
 
+@functools.lru_cache(maxsize=4096)
 def Ext(path_: str) -> str:
     """Ext returns the file name extension used by path.
     The extension is the suffix beginning at the final dot
@@ -586,6 +594,64 @@ def Walk(root: str, fn: WalkFunc) -> Result[None, GoError]:
         return Err(GoError(str(e)))
 
 
+def WalkCollect(root: str, pattern: str = "*") -> Result[list[tuple[str, bool, int]], GoError]:
+    """WalkCollect walks the file tree rooted at root and returns every entry
+    whose base name matches pattern as (path, is_dir, size) tuples.
+
+    Entries are listed in lexical order like Walk, but matching and stat
+    happen in one pass without a per-entry Python callback. Symbolic links
+    are reported as-is and never followed. Directories that cannot be read
+    and entries that vanish mid-walk are skipped instead of failing the walk.
+    Paths below root are built like Go's Join(dir, name), so
+    WalkCollect(".") yields "x" rather than "./x".
+    """
+    try:
+        info = os.stat(root)
+    except OSError as e:
+        return Err(GoError(str(e)))
+
+    match = functools.partial(fnmatch.fnmatchcase, pat=pattern)
+    out: list[tuple[str, bool, int]] = []
+    if match(Base(root)):
+        out.append((root, _stat.S_ISDIR(info.st_mode), info.st_size))
+    if not _stat.S_ISDIR(info.st_mode):
+        return Ok(out)
+
+    def listdir(dirpath: str) -> tuple[str, Iterator[os.DirEntry[str]]]:
+        # Join(dirpath, name) for a clean dirpath, computed once per directory
+        if dirpath == ".":
+            prefix = ""
+        elif dirpath.endswith(Separator):
+            prefix = dirpath
+        else:
+            prefix = dirpath + Separator
+        try:
+            with os.scandir(dirpath) as it:
+                return prefix, iter(sorted(it, key=lambda e: e.name))
+        except OSError:
+            return prefix, iter(())
+
+    # Stack of per-directory iterators gives Walk's pre-order traversal
+    stack = [listdir(Clean(root))]
+    while stack:
+        prefix, entries = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
+        path_ = prefix + entry.name
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if match(entry.name):
+                size = entry.stat(follow_symlinks=False).st_size
+                out.append((path_, is_dir, size))
+        except OSError:
+            continue
+        if is_dir:
+            stack.append(listdir(path_))
+    return Ok(out)
+
+
 # Sentinel errors for Walk
 class SkipDir(Exception):
     """SkipDir is used as a return value from WalkFuncs to indicate that
@@ -19,6 +19,7 @@ import shutil
 import stat
 import sys
 import tempfile
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import IO, Any
@@ -68,6 +69,7 @@ __all__ = [
     "Symlink",
     "Readlink",
     "ReadDir",
+    "ScanDir",
     "IsExist",
     "IsNotExist",
     "IsPermission",
@@ -770,6 +772,31 @@ def ReadDir(name: str) -> Result[list[DirEntry], GoError]:
         return Err(GoError(str(e), "os.PathError"))
 
 
+def ScanDir(name: str) -> Result[Iterator[tuple[str, bool]], GoError]:
+    """Lazily yields (name, is_dir) for each entry in the named directory.
+
+    Unlike ReadDir, entries come in directory order rather than sorted and
+    no DirEntry objects are built, so a caller that stops early never reads
+    the rest of the directory. The directory is only opened once iteration
+    starts, so an iterator that is never consumed holds no file descriptor.
+    """
+    try:
+        mode = _os.stat(name).st_mode
+    except FileNotFoundError:
+        return Err(GoError(f"open {name}: no such file or directory", "os.PathError"))
+    except Exception as e:
+        return Err(GoError(str(e), "os.PathError"))
+    if not stat.S_ISDIR(mode):
+        return Err(GoError(f"readdirent {name}: not a directory", "os.PathError"))
+    return Ok(_scan_entries(name))
+
+
+def _scan_entries(name: str) -> Iterator[tuple[str, bool]]:
+    with _os.scandir(name) as it:
+        for entry in it:
+            yield entry.name, entry.is_dir(follow_symlinks=False)
+
+
 def IsExist(err: GoError) -> bool:
     """Returns whether the error is known to report that a file or directory already exists."""
     return "exists" in str(err).lower()
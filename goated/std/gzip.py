@@ -9,12 +9,19 @@ Example:
     >>> gzip.Decompress(compressed.unwrap())
     Ok(b'hello world')
 
+Setting GOATED_GZIP_BACKEND=zlib makes Writer drive a zlib compressobj
+directly, letting zlib emit the gzip framing and CRC itself instead of
+going through GzipFile.
+
 """
 
 from __future__ import annotations
 
 import gzip as _gzip
 import io
+import os
+import zlib
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import IO
 
@@ -42,6 +49,8 @@ BestCompression = 9
 DefaultCompression = -1
 HuffmanOnly = -2  # Python doesn't have direct equivalent
 
+_ZLIB_BACKEND = os.environ.get("GOATED_GZIP_BACKEND") == "zlib"
+
 
 @dataclass
 class Header:
@@ -80,6 +89,26 @@ class Reader:
         except Exception as e:
             return Err(GoError(str(e), "gzip.ErrHeader"))
 
+    def ReadChunks(self, size: int = 65536) -> Iterator[Result[memoryview, GoError]]:
+        """Yields decompressed data in chunks of at most size bytes until EOF.
+
+        Chunks are decompressed into one reused buffer, so memory stays
+        bounded by size no matter how large the payload is. Each chunk is a
+        view that is only valid until the next one is produced; copy it with
+        bytes() to keep it.
+        """
+        view = memoryview(bytearray(size))
+        readinto = self._reader.readinto
+        while True:
+            try:
+                n = readinto(view)
+            except Exception as e:
+                yield Err(GoError(str(e), "gzip.ErrHeader"))
+                return
+            if n == 0:
+                return
+            yield Ok(view[:n])
+
     def Close(self) -> Result[None, GoError]:
         """Closes the reader."""
         try:
@@ -103,6 +132,41 @@ class Reader:
         self.Close()
 
 
+class _ZlibStream:
+    """The subset of GzipFile that Writer uses, backed by one zlib compressobj.
+
+    wbits=31 makes zlib write the gzip header, CRC-32 and size trailer, so
+    data is only passed over once per write.
+    """
+
+    __slots__ = ("_out", "_co")
+
+    def __init__(self, out: IO[bytes], level: int):
+        self._out = out
+        self._co: zlib._Compress | None = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def write(self, data: bytes) -> int:
+        if self._co is None:
+            raise ValueError("write on closed gzip writer")
+        self._out.write(self._co.compress(data))
+        return len(data)
+
+    def flush(self) -> None:
+        if self._co is not None:
+            self._out.write(self._co.flush(zlib.Z_SYNC_FLUSH))
+
+    def close(self) -> None:
+        if self._co is not None:
+            self._out.write(self._co.flush())
+            self._co = None
+
+
+def _new_stream(w: IO[bytes], level: int) -> _gzip.GzipFile | _ZlibStream:
+    if _ZLIB_BACKEND:
+        return _ZlibStream(w, level)
+    return _gzip.GzipFile(fileobj=w, mode="wb", compresslevel=level)
+
+
 class Writer:
     """Writer is an io.WriteCloser that compresses data."""
 
@@ -111,9 +175,8 @@ class Writer:
         compress_level = level if level != DefaultCompression else 9
         if compress_level < 0:
             compress_level = 9
-        self._writer = _gzip.GzipFile(
-            fileobj=w, mode="wb", compresslevel=min(9, max(0, compress_level))
-        )
+        self._level = min(9, max(0, compress_level))
+        self._writer = _new_stream(w, self._level)
         self.Header = Header()
 
     def Write(self, data: bytes | str) -> Result[int, GoError]:
@@ -142,9 +205,9 @@ class Writer:
             return Err(GoError(str(e), "gzip.Error"))
 
     def Reset(self, w: IO[bytes]) -> None:
-        """Resets the writer to write to a new destination."""
+        """Resets the writer to write to a new destination, keeping its compression level."""
         self._buffer = w
-        self._writer = _gzip.GzipFile(fileobj=w, mode="wb")
+        self._writer = _new_stream(w, self._level)
 
     def __enter__(self) -> Writer:
         return self
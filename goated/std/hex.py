@@ -148,52 +148,32 @@ def DecodeString(s: str) -> tuple[bytes, Exception | None]:
         return b"", ValueError("invalid hex string")
 
 
+# Maps every byte to itself if printable ASCII, else to "."
+_PRINTABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
+
 def Dump(data: bytes) -> str:
     """Dump returns a string that contains a hex dump of the given data.
 
     The format matches the output of `hexdump -C` on the command line.
 
     Example:
-        >>> print(Dump(b"Hello, World!"))
+        >>> print(Dump(b"Hello, World!"), end="")
         00000000  48 65 6c 6c 6f 2c 20 57  6f 72 6c 64 21           |Hello, World!|
 
     """
-    lines = []
-
-    for offset in range(0, len(data), 16):
-        chunk = data[offset : offset + 16]
-
-        # Offset
-        line = f"{offset:08x}  "
-
-        # Hex bytes
-        hex_parts = []
-        for i, b in enumerate(chunk):
-            hex_parts.append(f"{b:02x}")
-            if i == 7:
-                hex_parts.append("")
-
-        # Pad if less than 16 bytes
-        while len(hex_parts) < 17:  # 16 bytes + 1 separator
-            hex_parts.append("  ")
-
-        line += " ".join(hex_parts[:8]) + "  " + " ".join(hex_parts[8:16])
-
-        # Pad hex section
-        line = line.ljust(60)
-
-        # ASCII representation
-        ascii_repr = ""
-        for b in chunk:
-            if 32 <= b < 127:
-                ascii_repr += chr(b)
-            else:
-                ascii_repr += "."
-
-        line += f"|{ascii_repr}|"
-        lines.append(line)
-
-    return "\n".join(lines)
+    # Hex-encode and map the ASCII gutter for the whole input in two C
+    # calls, then slice fixed-width fields out of them for each line.
+    hexed = data.hex(" ")
+    gutter = data.translate(_PRINTABLE).decode("ascii")
+    return "".join(
+        [
+            f"{offset:08x}  {hexed[3 * offset : 3 * offset + 23]:<23}  "
+            f"{hexed[3 * offset + 24 : 3 * offset + 47]:<23}  "
+            f"|{gutter[offset : offset + 16]}|\n"
+            for offset in range(0, len(data), 16)
+        ]
+    )
 
 
 class Dumper:
@@ -11,15 +11,58 @@ Example:
     >>> gojson.Valid('{"valid": true}')
     True
 
+The stdlib json module is used by default. Setting
+GOATED_JSON_BACKEND=orjson (with orjson installed) switches encoding and
+decoding to orjson. Like Go, output then keeps non-ASCII text as raw
+UTF-8. Values orjson would mishandle (integers beyond 64 bits, NaN and
+infinities, datetimes, dataclasses) and input it cannot decode go to the
+stdlib instead, so results and error messages match. Output still differs
+from the default backend in a few ways: float exponents are written
+without padding (1e-7, not 1e-07); numbers beyond the 64-bit range decode
+as floats; uuid.UUID and plain Enum members encode instead of failing.
+
 """
 
 from __future__ import annotations
 
 import json
+import os
 from typing import Any
 
 from goated.result import Err, GoError, Ok, Result
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+if os.environ.get("GOATED_JSON_BACKEND") != "orjson":
+    orjson = None  # type: ignore[assignment]
+
+# Which library backs this module: "orjson" or "json"
+_backend = "json" if orjson is None else "orjson"
+
+
+def _orjson_reject(obj: Any) -> Any:
+    raise TypeError
+
+
+def _orjson_dumps(v: Any, option: int = 0) -> str | None:
+    """Encode v with orjson, or return None when the stdlib should encode it."""
+    option |= (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    try:
+        out = orjson.dumps(v, default=_orjson_reject, option=option)
+    except orjson.JSONEncodeError:
+        return None
+    # orjson writes NaN and infinities as null; the stdlib keeps them. A
+    # genuine null costs a second encode, with the same escaping either way.
+    if b"null" in out:
+        return None
+    return out.decode()
+
+
 __all__ = [
     "Marshal",
     "MarshalIndent",
@@ -31,16 +74,29 @@ __all__ = [
 
 def Marshal(v: Any) -> Result[str, GoError]:
     """Returns the JSON encoding of v."""
+    if orjson is not None and (result := _orjson_dumps(v)) is not None:
+        return Ok(result)
     try:
-        return Ok(json.dumps(v, separators=(",", ":")))
+        return Ok(json.dumps(v, separators=(",", ":"), ensure_ascii=orjson is None))
     except (TypeError, ValueError) as e:
         return Err(GoError(str(e), "json.MarshalerError"))
 
 
 def MarshalIndent(v: Any, prefix: str = "", indent: str = "  ") -> Result[str, GoError]:
     """Returns the indented JSON encoding of v."""
+    if orjson is not None and len(indent) == 2:
+        result = _orjson_dumps(v, orjson.OPT_INDENT_2)
+        if result is not None:
+            if prefix:
+                result = "\n".join(prefix + line for line in result.split("\n"))
+            return Ok(result)
     try:
-        result = json.dumps(v, indent=len(indent) if indent else None, separators=(",", ": "))
+        result = json.dumps(
+            v,
+            indent=len(indent) if indent else None,
+            separators=(",", ": "),
+            ensure_ascii=orjson is None,
+        )
         if prefix:
             lines = result.split("\n")
             result = "\n".join(prefix + line for line in lines)
@@ -51,6 +107,11 @@ def MarshalIndent(v: Any, prefix: str = "", indent: str = "  ") -> Result[str, G
 
 def Unmarshal(data: str | bytes) -> Result[Any, GoError]:
     """Parses the JSON-encoded data and returns the result."""
+    if orjson is not None:
+        try:
+            return Ok(orjson.loads(data))
+        except orjson.JSONDecodeError:
+            pass  # the stdlib may accept it (NaN) and words its errors differently
     try:
         if isinstance(data, bytes):
             data = data.decode("utf-8")
@@ -61,6 +122,12 @@ def Unmarshal(data: str | bytes) -> Result[Any, GoError]:
 
 def Valid(data: str | bytes) -> bool:
     """Reports whether data is a valid JSON encoding."""
+    if orjson is not None:
+        try:
+            orjson.loads(data)
+            return True
+        except orjson.JSONDecodeError:
+            pass
     try:
         if isinstance(data, bytes):
             data = data.decode("utf-8")
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import ctypes
 from collections.abc import Sequence
+from itertools import pairwise
 from typing import TypeVar
 
 from goated._core import _USE_GO_LIB, get_lib
@@ -17,6 +18,8 @@ __all__ = [
     "parallel_hash_md5",
     "parallel_hash_sha1",
     "parallel_hash_sha256",
+    "parallel_hash_sha256_into",
+    "parallel_hash_sha256_packed",
     "parallel_hash_sha512",
     "parallel_map_upper",
     "parallel_map_lower",
@@ -129,6 +132,116 @@ def parallel_hash_sha256(data_list: Sequence[bytes]) -> list[str]:
         return [hashlib.sha256(d).hexdigest() for d in data_list]
 
 
+def parallel_hash_sha256_into(data_list: Sequence[bytes], out: bytearray) -> None:
+    """Hash multiple byte sequences with SHA256 in parallel into a caller-owned buffer.
+
+    Raw 32-byte digests are written back to back, so ``out`` can be reused
+    across calls without any per-item allocations.
+
+    Args:
+        data_list: List of byte sequences to hash
+        out: Writable buffer of at least ``32 * len(data_list)`` bytes
+
+    Raises:
+        ValueError: If ``out`` is too small
+
+    """
+    n = len(data_list)
+    if len(out) < 32 * n:
+        raise ValueError(f"output buffer too small: need {32 * n} bytes, got {len(out)}")
+
+    if not _lib or n < 2:
+        import hashlib
+
+        for i, d in enumerate(data_list):
+            out[i * 32 : (i + 1) * 32] = hashlib.sha256(d).digest()
+        return
+
+    DataPtrArray = ctypes.c_char_p * n
+    IntArray = ctypes.c_int * n
+
+    data_ptrs = DataPtrArray()
+    data_lens = IntArray()
+
+    for i, d in enumerate(data_list):
+        data_ptrs[i] = d
+        data_lens[i] = len(d)
+
+    try:
+        _lib.goated_parallel_hash_sha256_into(
+            ctypes.cast(data_ptrs, ctypes.POINTER(ctypes.c_char_p)),
+            ctypes.cast(data_lens, ctypes.POINTER(ctypes.c_int)),
+            ctypes.c_int(n),
+            (ctypes.c_ubyte * len(out)).from_buffer(out),
+        )
+    except Exception:
+        import hashlib
+
+        for i, d in enumerate(data_list):
+            out[i * 32 : (i + 1) * 32] = hashlib.sha256(d).digest()
+
+
+def parallel_hash_sha256_packed(buf: bytes, offsets: Sequence[int]) -> list[str]:
+    """Hash consecutive slices of one buffer with SHA256 in parallel using Go goroutines.
+
+    ``offsets`` holds ``n + 1`` boundaries; item ``i`` is
+    ``buf[offsets[i]:offsets[i + 1]]``. The whole batch crosses the FFI boundary
+    as one pointer plus an offset table instead of ``n`` separate objects.
+
+    Args:
+        buf: Contiguous buffer holding every input back to back
+        offsets: Start offset of each item, followed by the end of the last one
+
+    Returns:
+        List of hex digest strings
+
+    Raises:
+        ValueError: If offsets is empty, starts below 0, decreases, or ends past len(buf)
+
+    """
+    if not offsets:
+        raise ValueError("offsets must hold at least one boundary")
+    if offsets[0] < 0 or offsets[-1] > len(buf):
+        raise ValueError(f"offsets must lie within [0, {len(buf)}]")
+    if any(a > b for a, b in pairwise(offsets)):
+        raise ValueError("offsets must be non-decreasing")
+
+    n = len(offsets) - 1
+    if not _lib or n < 2:
+        import hashlib
+
+        view = memoryview(buf)
+        return [hashlib.sha256(view[offsets[i] : offsets[i + 1]]).hexdigest() for i in range(n)]
+
+    OffsetArray = ctypes.c_int64 * (n + 1)
+    ResultPtrArray = ctypes.c_char_p * n
+
+    offset_arr = OffsetArray(*offsets)
+    results = ResultPtrArray()
+
+    try:
+        _lib.goated_parallel_hash_sha256_packed(
+            ctypes.c_char_p(buf),
+            ctypes.cast(offset_arr, ctypes.POINTER(ctypes.c_int64)),
+            ctypes.c_int(n),
+            ctypes.cast(results, ctypes.POINTER(ctypes.c_char_p)),
+        )
+
+        result_list = [r.decode("utf-8") if (r := results[i]) is not None else "" for i in range(n)]
+
+        _lib.goated_parallel_free_strings(
+            ctypes.cast(results, ctypes.POINTER(ctypes.c_char_p)),
+            ctypes.c_int(n),
+        )
+
+        return result_list
+    except Exception:
+        import hashlib
+
+        view = memoryview(buf)
+        return [hashlib.sha256(view[offsets[i] : offsets[i + 1]]).hexdigest() for i in range(n)]
+
+
 def parallel_hash_sha512(data_list: Sequence[bytes]) -> list[str]:
     """Hash multiple byte sequences with SHA512 in parallel using Go goroutines."""
     if not _lib or len(data_list) < 2:
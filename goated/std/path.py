@@ -2,11 +2,13 @@
 
 This module provides Python bindings for Go's path package.
 Implements POSIX-style path operations (always uses forward slashes).
+Pure Base/Clean/Dir/Ext results stay in an lru_cache(maxsize=4096) for the life of the process.
 """
 
 from __future__ import annotations
 
 import fnmatch
+import functools
 import posixpath
 
 from goated._core import get_lib, is_library_available
@@ -140,6 +142,7 @@ def _py_clean(path_: str) -> str:
     return result
 
 
+@functools.lru_cache(maxsize=4096)
 def Base(path_: str) -> str:
     """Base returns the last element of path.
     Trailing slashes are removed before extracting the last element.
@@ -166,6 +169,7 @@ def Base(path_: str) -> str:
     return _decode(result)
 
 
+@functools.lru_cache(maxsize=4096)
 def Clean(path_: str) -> str:
     """Clean returns the shortest path name equivalent to path
     by purely lexical processing. It applies the following rules
@@ -192,6 +196,7 @@ def Clean(path_: str) -> str:
     return _decode(result)
 
 
+@functools.lru_cache(maxsize=4096)
 def Dir(path_: str) -> str:
     """Dir returns all but the last element of path, typically the path's directory.
     After dropping the final element using [Split], the path is Cleaned and trailing
@@ -224,6 +229,7 @@ def Dir(path_: str) -> str:
     return _decode(result)
 
 
+@functools.lru_cache(maxsize=4096)
 def Ext(path_: str) -> str:
     """Ext returns the file name extension used by path.
     The extension is the suffix beginning at the final dot
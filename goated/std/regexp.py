@@ -6,7 +6,9 @@ This module provides Python bindings for Go's regexp package.
 from __future__ import annotations
 
 import ctypes
+import functools
 import re
+from itertools import islice
 
 from goated._core import get_lib, is_library_available
 from goated.result import Err, GoError, Ok, Result
@@ -115,15 +117,16 @@ class Regexp:
     def FindAllString(self, s: str, n: int = -1) -> list[str] | None:
         if self._compiled is None:
             return None
-        matches = self._compiled.findall(s)
+        compiled = self._compiled
+        if n < 0 and not compiled.groups:
+            # findall already yields the match strings; no per-item rebuild
+            return compiled.findall(s) or None
+        # Whole matches like Go (findall would return groups); stop
+        # scanning after n matches instead of slicing a full findall
+        matches = compiled.finditer(s)
         if n >= 0:
-            matches = matches[:n]
-        result = []
-        for m in matches:
-            if isinstance(m, tuple):
-                result.append(m[0] if m else "")
-            else:
-                result.append(m)
+            matches = islice(matches, n)
+        result = [m.group(0) for m in matches]
         return result if result else None
 
     def FindStringIndex(self, s: str) -> tuple[int, int] | None:
@@ -226,6 +229,11 @@ def Match(pattern: str, b: bytes) -> Result[bool, GoError]:
         return Err(GoError(f"invalid UTF-8: {e}"))
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_cached(pattern: str) -> Result[Regexp, GoError]:
+    return Compile(pattern)
+
+
 def MatchString(pattern: str, s: str) -> Result[bool, GoError]:
     """MatchString reports whether s contains any match of pattern."""
     if is_library_available():
@@ -248,12 +256,11 @@ def MatchString(pattern: str, s: str) -> Result[bool, GoError]:
         except Exception:
             pass
 
-    # Pure Python fallback
-    try:
-        compiled = re.compile(pattern)
-        return Ok(compiled.search(s) is not None)
-    except re.error as e:
-        return Err(GoError(f"error parsing regexp: {e}"))
+    # Pure Python fallback; the pattern is compiled once per distinct string
+    compiled = _compile_cached(pattern)
+    if compiled.is_err():
+        return Err(compiled.err())
+    return Ok(compiled.unwrap().MatchString(s))
 
 
 def QuoteMeta(s: str) -> str:
@@ -61,9 +61,15 @@ def _decode(b: bytes | None) -> str:
 _lib = get_lib() if _USE_GO_LIB else None
 
 
-def Contains(s: str, substr: str) -> bool:
-    """Reports whether substr is within s."""
+def Contains(s: str | bytes, substr: str | bytes) -> bool:
+    """Reports whether substr is within s.
+
+    Pre-encoded bytes skip the per-call UTF-8 encode and are passed to Go
+    with explicit lengths.
+    """
     if _lib:
+        if isinstance(s, bytes) and isinstance(substr, bytes):
+            return bool(_lib.goated_strings_ContainsN(s, len(s), substr, len(substr)))
         return bool(_lib.goated_strings_Contains(_encode(s), _encode(substr)))
     return substr in s
 
@@ -112,9 +118,14 @@ def HasSuffix(s: str, suffix: str) -> bool:
     return s.endswith(suffix)
 
 
-def Index(s: str, substr: str) -> int:
-    """Returns the index of the first instance of substr in s, or -1."""
+def Index(s: str | bytes, substr: str | bytes) -> int:
+    """Returns the index of the first instance of substr in s, or -1.
+
+    Accepts pre-encoded bytes like Contains.
+    """
     if _lib:
+        if isinstance(s, bytes) and isinstance(substr, bytes):
+            return int(_lib.goated_strings_IndexN(s, len(s), substr, len(substr)))
         return int(_lib.goated_strings_Index(_encode(s), _encode(substr)))
     return s.find(substr)
 
@@ -355,6 +366,11 @@ class Builder:
         self._parts.append(s)
         return len(s)
 
+    def WriteStrings(self, *parts: str) -> int:
+        """Appends all parts in one call; returns the total written like WriteString."""
+        self._parts.extend(parts)
+        return sum(map(len, parts))
+
     def WriteByte(self, c: int) -> None:
         self._parts.append(chr(c))
 
@@ -23,6 +23,7 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import os
 import threading
 from collections.abc import Callable
 from typing import Any, Generic, TypeVar
@@ -79,7 +80,7 @@ class Mutex:
         return self._lock.acquire(blocking=False)
 
     def __enter__(self) -> Mutex:
-        self.Lock()
+        self._lock.acquire()
         return self
 
     def __exit__(
@@ -88,7 +89,7 @@ class Mutex:
         exc_val: BaseException | None,
         exc_tb: object,
     ) -> None:
-        self.Unlock()
+        self._lock.release()
 
 
 class RWMutex:
@@ -384,9 +385,23 @@ class Pool(Generic[T]):
 # =============================================================================
 
 
+def _map_shard_count() -> int:
+    """Power of two >= 4 x CPU count, capped to bound per-Map memory."""
+    n = 4 * (os.cpu_count() or 1)
+    return min(1 << (n - 1).bit_length(), 64)
+
+
+_MAP_SHARDS = _map_shard_count()
+
+
 class Map(Generic[T]):
     """Map is like a Go map[any]any but is safe for concurrent use.
 
+    Keys are spread over independently locked shards picked by hash, so
+    operations on different keys rarely contend for the same lock. Shards
+    are created on first use, and their locks are reentrant like the single
+    RLock they replace, so a key's __eq__/__hash__ may call back into the map.
+
     Example:
         >>> m = Map()
         >>> m.Store("key", "value")
@@ -396,11 +411,22 @@ class Map(Generic[T]):
 
     """
 
-    __slots__ = ("_data", "_lock")
+    __slots__ = ("_shards", "_mask", "_grow_lock")
 
     def __init__(self) -> None:
-        self._data: dict[Any, T] = {}
-        self._lock = threading.RLock()
+        self._shards: list[tuple[threading.RLock, dict[Any, T]] | None] = [None] * _MAP_SHARDS
+        self._mask = _MAP_SHARDS - 1
+        self._grow_lock = threading.Lock()
+
+    def _shard(self, key: Any) -> tuple[threading.RLock, dict[Any, T]]:
+        i = hash(key) & self._mask
+        shard = self._shards[i]
+        if shard is None:
+            with self._grow_lock:
+                shard = self._shards[i]
+                if shard is None:
+                    shard = self._shards[i] = (threading.RLock(), {})
+        return shard
 
     def Load(self, key: Any) -> tuple[T | None, bool]:
         """Load returns the value stored in the map for a key, or None if no
@@ -408,15 +434,17 @@ class Map(Generic[T]):
 
         The ok result indicates whether value was found in the map.
         """
-        with self._lock:
-            if key in self._data:
-                return self._data[key], True
+        lock, data = self._shard(key)
+        with lock:
+            if key in data:
+                return data[key], True
             return None, False
 
     def Store(self, key: Any, value: T) -> None:
         """Store sets the value for a key."""
-        with self._lock:
-            self._data[key] = value
+        lock, data = self._shard(key)
+        with lock:
+            data[key] = value
 
     def LoadOrStore(self, key: Any, value: T) -> tuple[T, bool]:
         """LoadOrStore returns the existing value for the key if present.
@@ -424,10 +452,11 @@ class Map(Generic[T]):
 
         The loaded result is true if the value was loaded, false if stored.
         """
-        with self._lock:
-            if key in self._data:
-                return self._data[key], True
-            self._data[key] = value
+        lock, data = self._shard(key)
+        with lock:
+            if key in data:
+                return data[key], True
+            data[key] = value
             return value, False
 
     def LoadAndDelete(self, key: Any) -> tuple[T | None, bool]:
@@ -436,26 +465,29 @@ class Map(Generic[T]):
 
         The loaded result reports whether the key was present.
         """
-        with self._lock:
-            if key in self._data:
-                value = self._data.pop(key)
+        lock, data = self._shard(key)
+        with lock:
+            if key in data:
+                value = data.pop(key)
                 return value, True
             return None, False
 
     def Delete(self, key: Any) -> None:
         """Delete deletes the value for a key."""
-        with self._lock:
-            self._data.pop(key, None)
+        lock, data = self._shard(key)
+        with lock:
+            data.pop(key, None)
 
     def Swap(self, key: Any, value: T) -> tuple[T | None, bool]:
         """Swap swaps the value for a key and returns the previous value if any.
 
         The loaded result reports whether the key was present.
         """
-        with self._lock:
-            previous = self._data.get(key)
-            loaded = key in self._data
-            self._data[key] = value
+        lock, data = self._shard(key)
+        with lock:
+            previous = data.get(key)
+            loaded = key in data
+            data[key] = value
             return previous, loaded
 
     def CompareAndSwap(self, key: Any, old: T, new: T) -> bool:
@@ -464,9 +496,10 @@ class Map(Generic[T]):
 
         Returns true if the swap was performed.
         """
-        with self._lock:
-            if key in self._data and self._data[key] == old:
-                self._data[key] = new
+        lock, data = self._shard(key)
+        with lock:
+            if key in data and data[key] == old:
+                data[key] = new
                 return True
             return False
 
@@ -475,30 +508,45 @@ class Map(Generic[T]):
 
         Returns true if the entry was deleted.
         """
-        with self._lock:
-            if key in self._data and self._data[key] == old:
-                del self._data[key]
+        lock, data = self._shard(key)
+        with lock:
+            if key in data and data[key] == old:
+                del data[key]
                 return True
             return False
 
     def Range(self, f: Callable[[Any, T], bool]) -> None:
         """Range calls f sequentially for each key and value present in the map.
 
-        If f returns false, range stops the iteration.
+        If f returns false, range stops the iteration. Each shard is
+        snapshotted under its own lock, so f never runs with a lock held.
         """
-        with self._lock:
-            items = list(self._data.items())
-
-        for key, value in items:
-            if not f(key, value):
-                break
+        for shard in self._shards:
+            if shard is None:
+                continue
+            lock, data = shard
+            with lock:
+                items = list(data.items())
+            for key, value in items:
+                if not f(key, value):
+                    return
 
     def Clear(self) -> None:
         """Clear deletes all entries from the map."""
-        with self._lock:
-            self._data.clear()
+        for shard in self._shards:
+            if shard is None:
+                continue
+            lock, data = shard
+            with lock:
+                data.clear()
 
     def Len(self) -> int:
         """Return the number of items in the map."""
-        with self._lock:
-            return len(self._data)
+        total = 0
+        for shard in self._shards:
+            if shard is None:
+                continue
+            lock, data = shard
+            with lock:
+                total += len(data)
+        return total
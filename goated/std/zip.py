@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextlib
 import os as _os
 import zipfile as _zipfile
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from io import BytesIO
@@ -239,6 +240,20 @@ class Writer:
         except Exception as e:
             return Err(GoError(str(e), "zip.Error"))
 
+    def CreateAll(self, files: Mapping[str, bytes], method: int = Deflate) -> Result[None, GoError]:
+        """CreateAll adds every name -> content entry in files to the archive.
+
+        Each entry is written straight to the archive, skipping the per-file
+        writer object and buffer that Create would allocate.
+        """
+        writestr = self._zf.writestr
+        try:
+            for name, data in files.items():
+                writestr(name, data, compress_type=method)
+            return Ok(None)
+        except Exception as e:
+            return Err(GoError(str(e), "zip.Error"))
+
     def SetComment(self, comment: str) -> None:
         """SetComment sets the end-of-central-directory comment."""
         self._zf.comment = comment.encode()
@@ -0,0 +1,63 @@
+package main
+
+/*
+#include <stdint.h>
+*/
+import "C"
+import (
+	"crypto/sha256"
+	"strings"
+	"time"
+)
+
+// In-Go benchmark loop. Running the iterations on this side of the FFI
+// boundary lets the Python harness time the operation itself instead of
+// n ctypes dispatches.
+
+const (
+	benchOpContains = 0
+	benchOpIndex    = 1
+	benchOpToUpper  = 2
+	benchOpSHA256   = 3
+)
+
+// benchSink keeps results observable so the loop body is not optimized away.
+var benchSink int
+
+//export goated_bench_loop
+func goated_bench_loop(op C.int, a *C.char, aLen C.longlong, b *C.char, bLen C.longlong, n C.longlong) C.longlong {
+	goA := C.GoStringN(a, C.int(aLen))
+	goB := C.GoStringN(b, C.int(bLen))
+	iterations := int(n)
+	sink := 0
+
+	start := time.Now()
+	switch int(op) {
+	case benchOpContains:
+		for i := 0; i < iterations; i++ {
+			if strings.Contains(goA, goB) {
+				sink++
+			}
+		}
+	case benchOpIndex:
+		for i := 0; i < iterations; i++ {
+			sink += strings.Index(goA, goB)
+		}
+	case benchOpToUpper:
+		for i := 0; i < iterations; i++ {
+			sink += len(strings.ToUpper(goA))
+		}
+	case benchOpSHA256:
+		data := []byte(goA)
+		for i := 0; i < iterations; i++ {
+			sum := sha256.Sum256(data)
+			sink += int(sum[0])
+		}
+	default:
+		return -1
+	}
+	elapsed := time.Since(start)
+
+	benchSink = sink
+	return C.longlong(elapsed.Nanoseconds())
+}
@@ -10,18 +10,51 @@ import (
 	"bytes"
 	"compress/gzip"
 	"io"
+	"sync"
 	"unsafe"
 )
 
+// Default-level writers and readers are pooled; Reset rebinds them to a new
+// buffer so repeated calls skip re-allocating the deflate state.
+var gzipWriterPool = sync.Pool{
+	New: func() any { return gzip.NewWriter(nil) },
+}
+
+var gzipReaderPool sync.Pool
+
+func getGzipWriter(buf *bytes.Buffer, level int) (*gzip.Writer, bool, error) {
+	if level == gzip.DefaultCompression {
+		w := gzipWriterPool.Get().(*gzip.Writer)
+		w.Reset(buf)
+		return w, true, nil
+	}
+	w, err := gzip.NewWriterLevel(buf, level)
+	return w, false, err
+}
+
+func getGzipReader(r io.Reader) (*gzip.Reader, error) {
+	if zr, ok := gzipReaderPool.Get().(*gzip.Reader); ok {
+		if err := zr.Reset(r); err != nil {
+			gzipReaderPool.Put(zr)
+			return nil, err
+		}
+		return zr, nil
+	}
+	return gzip.NewReader(r)
+}
+
 //export goated_gzip_compress
 func goated_gzip_compress(data *C.char, dataLen C.int, level C.int, outLen *C.int) *C.char {
 	input := C.GoBytes(unsafe.Pointer(data), dataLen)
 	var buf bytes.Buffer
-	w, err := gzip.NewWriterLevel(&buf, int(level))
+	w, pooled, err := getGzipWriter(&buf, int(level))
 	if err != nil {
 		*outLen = 0
 		return nil
 	}
+	if pooled {
+		defer gzipWriterPool.Put(w)
+	}
 	_, err = w.Write(input)
 	if err != nil {
 		*outLen = 0
@@ -40,13 +73,16 @@ func goated_gzip_compress(data *C.char, dataLen C.int, level C.int, outLen *C.in
 //export goated_gzip_decompress
 func goated_gzip_decompress(data *C.char, dataLen C.int, outLen *C.int, errOut **C.char) *C.char {
 	input := C.GoBytes(unsafe.Pointer(data), dataLen)
-	r, err := gzip.NewReader(bytes.NewReader(input))
+	r, err := getGzipReader(bytes.NewReader(input))
 	if err != nil {
 		*errOut = C.CString(err.Error())
 		*outLen = 0
 		return nil
 	}
-	defer r.Close()
+	defer func() {
+		r.Close()
+		gzipReaderPool.Put(r)
+	}()
 	result, err := io.ReadAll(r)
 	if err != nil {
 		*errOut = C.CString(err.Error())
@@ -174,6 +174,89 @@ func goated_parallel_hash_sha256_batch(
 	wg.Wait()
 }
 
+// Into variant: raw 32-byte digests are written back to back into a
+// caller-owned buffer, so no per-item C strings are allocated or freed.
+//
+//export goated_parallel_hash_sha256_into
+func goated_parallel_hash_sha256_into(
+	data **C.char, dataLens *C.int, count C.int,
+	out *C.uchar,
+) {
+	n := int(count)
+
+	var wg sync.WaitGroup
+	dataSlice := (*[1 << 30]*C.char)(unsafe.Pointer(data))[:n:n]
+	lenSlice := (*[1 << 30]C.int)(unsafe.Pointer(dataLens))[:n:n]
+	outSlice := unsafe.Slice((*byte)(unsafe.Pointer(out)), n*sha256.Size)
+
+	numWorkers := runtime.NumCPU()
+	chunkSize := (n + numWorkers - 1) / numWorkers
+
+	for i := 0; i < numWorkers; i++ {
+		start := i * chunkSize
+		end := start + chunkSize
+		if end > n {
+			end = n
+		}
+		if start >= n {
+			break
+		}
+
+		wg.Add(1)
+		go func(start, end int) {
+			defer wg.Done()
+			for j := start; j < end; j++ {
+				input := unsafe.Slice((*byte)(unsafe.Pointer(dataSlice[j])), int(lenSlice[j]))
+				hash := sha256.Sum256(input)
+				copy(outSlice[j*sha256.Size:], hash[:])
+			}
+		}(start, end)
+	}
+	wg.Wait()
+}
+
+// Packed variant: all inputs live in one contiguous buffer and offsets holds
+// count+1 boundaries, so Python crosses the FFI boundary with a single pointer
+// instead of count separate ones. Inputs are hashed in place without copying.
+//
+//export goated_parallel_hash_sha256_packed
+func goated_parallel_hash_sha256_packed(
+	data *C.char, offsets *C.longlong, count C.int,
+	results **C.char,
+) {
+	n := int(count)
+
+	var wg sync.WaitGroup
+	resultSlice := (*[1 << 30]*C.char)(unsafe.Pointer(results))[:n:n]
+	offsetSlice := (*[1 << 30]C.longlong)(unsafe.Pointer(offsets))[: n+1 : n+1]
+	buf := unsafe.Slice((*byte)(unsafe.Pointer(data)), int(offsetSlice[n]))
+
+	numWorkers := runtime.NumCPU()
+	chunkSize := (n + numWorkers - 1) / numWorkers
+
+	for i := 0; i < numWorkers; i++ {
+		start := i * chunkSize
+		end := start + chunkSize
+		if end > n {
+			end = n
+		}
+		if start >= n {
+			break
+		}
+
+		wg.Add(1)
+		go func(start, end int) {
+			defer wg.Done()
+			for j := start; j < end; j++ {
+				hash := sha256.Sum256(buf[offsetSlice[j]:offsetSlice[j+1]])
+				hexStr := hex.EncodeToString(hash[:])
+				resultSlice[j] = C.CString(hexStr)
+			}
+		}(start, end)
+	}
+	wg.Wait()
+}
+
 //export goated_parallel_hash_sha512_batch
 func goated_parallel_hash_sha512_batch(
 	data **C.char, dataLens *C.int, count C.int,
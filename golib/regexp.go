@@ -8,18 +8,47 @@ package main
 import "C"
 import (
 	"regexp"
+	"sync"
 )
 
+// Compiled patterns for the one-shot MatchString entry point. The cache is
+// dropped wholesale once it reaches regexpCacheSize entries.
+const regexpCacheSize = 256
+
+var (
+	regexpCacheMu sync.Mutex
+	regexpCache   = make(map[string]*regexp.Regexp)
+)
+
+func compileCached(pattern string) (*regexp.Regexp, error) {
+	regexpCacheMu.Lock()
+	re, ok := regexpCache[pattern]
+	regexpCacheMu.Unlock()
+	if ok {
+		return re, nil
+	}
+	re, err := regexp.Compile(pattern)
+	if err != nil {
+		return nil, err
+	}
+	regexpCacheMu.Lock()
+	if len(regexpCache) >= regexpCacheSize {
+		regexpCache = make(map[string]*regexp.Regexp)
+	}
+	regexpCache[pattern] = re
+	regexpCacheMu.Unlock()
+	return re, nil
+}
 
 //export goated_regexp_MatchString
 func goated_regexp_MatchString(pattern *C.char, s *C.char, errOut **C.char) C.bool {
-	result, err := regexp.MatchString(C.GoString(pattern), C.GoString(s))
+	re, err := compileCached(C.GoString(pattern))
 	if err != nil {
 		*errOut = C.CString(err.Error())
 		return false
 	}
 	*errOut = nil
-	return C.bool(result)
+	return C.bool(re.MatchString(C.GoString(s)))
 }
 
 //export goated_regexp_QuoteMeta
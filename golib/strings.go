@@ -16,6 +16,21 @@ func goated_strings_Contains(s *C.char, substr *C.char) C.bool {
 	return C.bool(strings.Contains(C.GoString(s), C.GoString(substr)))
 }
 
+// goBytesString views a length-delimited C buffer as a Go string without
+// copying or scanning for a NUL. The caller keeps the buffer alive for the
+// duration of the call and the result must not escape it.
+func goBytesString(p *C.char, n C.longlong) string {
+	if n == 0 {
+		return ""
+	}
+	return unsafe.String((*byte)(unsafe.Pointer(p)), int(n))
+}
+
+//export goated_strings_ContainsN
+func goated_strings_ContainsN(s *C.char, sLen C.longlong, substr *C.char, substrLen C.longlong) C.bool {
+	return C.bool(strings.Contains(goBytesString(s, sLen), goBytesString(substr, substrLen)))
+}
+
 //export goated_strings_ContainsAny
 func goated_strings_ContainsAny(s *C.char, chars *C.char) C.bool {
 	return C.bool(strings.ContainsAny(C.GoString(s), C.GoString(chars)))
@@ -46,6 +61,11 @@ func goated_strings_Index(s *C.char, substr *C.char) C.longlong {
 	return C.longlong(strings.Index(C.GoString(s), C.GoString(substr)))
 }
 
+//export goated_strings_IndexN
+func goated_strings_IndexN(s *C.char, sLen C.longlong, substr *C.char, substrLen C.longlong) C.longlong {
+	return C.longlong(strings.Index(goBytesString(s, sLen), goBytesString(substr, substrLen)))
+}
+
 //export goated_strings_IndexAny
 func goated_strings_IndexAny(s *C.char, chars *C.char) C.longlong {
 	return C.longlong(strings.IndexAny(C.GoString(s), C.GoString(chars)))
@@ -31,6 +31,21 @@ class TestStdEncoding:
         assert err is None
         assert data == b"Hello, World!"
 
+    def test_bytes_variants(self):
+        """Test EncodeToBytes/DecodeFromBytes."""
+        from goated.std.base64 import StdEncoding
+
+        assert StdEncoding.EncodeToBytes(b"foobar") == b"Zm9vYmFy"
+        assert StdEncoding.EncodeToBytes(b"") == b""
+
+        data, err = StdEncoding.DecodeFromBytes(b"SGVsbG8sIFdvcmxkIQ==")
+        assert err is None
+        assert data == b"Hello, World!"
+
+        data, err = StdEncoding.DecodeFromBytes(b"Zm9vY")
+        assert err is not None
+        assert data == b""
+
     def test_encode_decode_roundtrip(self):
         """Test encode/decode roundtrip."""
         from goated.std.base64 import StdEncoding
@@ -117,6 +132,26 @@ class TestURLEncoding:
         assert err is None
         assert decoded == data
 
+    def test_predefined_match_stdlib(self):
+        """Test predefined encodings match the stdlib base64 module."""
+        import base64 as pybase64
+
+        from goated.std.base64 import (
+            RawStdEncoding,
+            RawURLEncoding,
+            StdEncoding,
+            URLEncoding,
+        )
+
+        for n in range(8):
+            data = bytes(range(250, 250 - n, -1))
+            std = pybase64.b64encode(data)
+            url = pybase64.urlsafe_b64encode(data)
+            assert StdEncoding.EncodeToString(data) == std.decode()
+            assert URLEncoding.EncodeToString(data) == url.decode()
+            assert RawStdEncoding.EncodeToString(data) == std.rstrip(b"=").decode()
+            assert RawURLEncoding.EncodeToBytes(data) == url.rstrip(b"=")
+
 
 class TestRawEncoding:
     """Tests for raw (unpadded) encodings."""
@@ -1,7 +1,10 @@
 """Tests for goated.std.binary module (encoding/binary)."""
 
+import struct
 from io import BytesIO
 
+import pytest
+
 from goated.std import binary
 
 
@@ -81,6 +84,15 @@ class TestBigEndianUint64:
         result = binary.BigEndian.AppendUint64(b, 256)
         assert len(result) == 8
 
+    def test_put_uint64_at_start_of_larger_buffer(self):
+        b = bytearray(10)
+        binary.BigEndian.PutUint64(b, 1)
+        assert b == bytearray([0, 0, 0, 0, 0, 0, 0, 1, 0, 0])
+
+    def test_put_uint64_short_buffer(self):
+        with pytest.raises(struct.error):
+            binary.BigEndian.PutUint64(bytearray(4), 1)
+
 
 class TestLittleEndianUint16:
     """Test LittleEndian Uint16 operations."""
@@ -355,6 +367,52 @@ class TestRoundTrip:
             assert decoded == val
 
 
+class TestVarintBatch:
+    """Test batch varint encoding/decoding."""
+
+    def test_uvarint_batch_matches_scalar(self):
+        values = [0, 1, 127, 128, 300, 2**20, 2**63, 2**64 - 1]
+        buf = bytearray(binary.MaxVarintLen64 * len(values))
+        n = binary.PutUvarintBatch(buf, values)
+
+        expected = bytearray()
+        for val in values:
+            one = bytearray(binary.MaxVarintLen64)
+            expected += one[: binary.PutUvarint(one, val)]
+        assert bytes(buf[:n]) == bytes(expected)
+        assert binary.UvarintBatch(bytes(buf[:n])) == (values, n)
+
+    def test_varint_batch_roundtrip(self):
+        values = [0, 1, -1, 63, -64, 1000, -1000, 2**63 - 1, -(2**63)]
+        buf = bytearray(binary.MaxVarintLen64 * len(values))
+        n = binary.PutVarintBatch(buf, values)
+        assert binary.VarintBatch(bytes(buf[:n])) == (values, n)
+
+    def test_put_uvarint_negative_matches_scalar(self):
+        one = bytearray(binary.MaxVarintLen64)
+        scalar = bytes(one[: binary.PutUvarint(one, -1)])
+        buf = bytearray(binary.MaxVarintLen64)
+        n = binary.PutUvarintBatch(buf, [-1])
+        assert bytes(buf[:n]) == scalar
+        assert binary.Uvarint(scalar) == (2**64 - 1, binary.MaxVarintLen64)
+
+    def test_put_uvarint_batch_short_buffer(self):
+        with pytest.raises(IndexError):
+            binary.PutUvarintBatch(bytearray(1), [1, 2])
+
+    def test_uvarint_batch_truncated(self):
+        values, n = binary.UvarintBatch(bytes([5, 0x80]))
+        assert values == [5]
+        assert n == 1
+
+    def test_uvarint_batch_overflow(self):
+        buf = bytes([1]) + bytes([0xFF] * 9) + bytes([0x02])
+        assert binary.UvarintBatch(buf) == ([1], 1)
+
+    def test_uvarint_batch_empty(self):
+        assert binary.UvarintBatch(b"") == ([], 0)
+
+
 class TestModuleExports:
     """Test module exports."""
 
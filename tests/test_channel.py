@@ -67,6 +67,80 @@ class TestBufferedChannel:
             assert await ch.recv() == i
 
 
+class TestRecvBatch:
+    @pytest.mark.asyncio
+    async def test_recv_batch_limits(self):
+        ch = Channel[int](buffer_size=5)
+        for i in range(5):
+            await ch.send(i)
+
+        assert await ch.recv_batch(3) == [0, 1, 2]
+        assert await ch.recv_batch(10) == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_recv_batch_closed(self):
+        ch = Channel[int](buffer_size=2)
+        await ch.send(1)
+        ch.close()
+
+        assert await ch.recv_batch(4) == [1]
+        assert await ch.recv_batch(4) == []
+
+    @pytest.mark.asyncio
+    async def test_recv_batch_waits_for_data(self):
+        ch = Channel[int](buffer_size=2)
+
+        async def sender():
+            await asyncio.sleep(0.01)
+            await ch.send(7)
+
+        task = asyncio.create_task(sender())
+        assert await ch.recv_batch(4) == [7]
+        await task
+
+    @pytest.mark.asyncio
+    async def test_recv_batch_invalid(self):
+        ch = Channel[int](buffer_size=1)
+        with pytest.raises(ValueError):
+            await ch.recv_batch(0)
+
+
+class TestSendBatch:
+    @pytest.mark.asyncio
+    async def test_send_batch_fits_buffer(self):
+        ch = Channel[int](buffer_size=5)
+        await ch.send_batch(range(4))
+
+        assert len(ch) == 4
+        assert await ch.recv_batch(10) == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_send_batch_waits_for_space(self):
+        ch = Channel[int](buffer_size=2)
+        task = asyncio.create_task(ch.send_batch(range(7)))
+
+        received = []
+        while len(received) < 7:
+            received.extend(await ch.recv_batch(7))
+        await task
+
+        assert received == list(range(7))
+
+    @pytest.mark.asyncio
+    async def test_send_batch_empty(self):
+        ch = Channel[int](buffer_size=1)
+        await ch.send_batch([])
+        assert len(ch) == 0
+
+    @pytest.mark.asyncio
+    async def test_send_batch_closed(self):
+        ch = Channel[int](buffer_size=2)
+        ch.close()
+
+        with pytest.raises(ChannelClosed):
+            await ch.send_batch([1, 2])
+
+
 class TestChannelClose:
     @pytest.mark.asyncio
     async def test_close_prevents_send(self):
@@ -561,3 +561,108 @@ class TestMutexContextManager:
         rw = RWMutex()
         with rw.RLocker(), rw.RLocker():
             pass  # Nested reads should be OK
+
+
+class TestShardedMap:
+    """Test std.sync.Map behaviour across its lock shards."""
+
+    def test_operations_across_shards(self):
+        """Keys landing in different shards are all reachable."""
+        from goated.std.sync import Map
+
+        m = Map()
+        for i in range(200):
+            m.Store(i, i * 2)
+        assert m.Len() == 200
+        assert m.Load(150) == (300, True)
+        assert m.Load(999) == (None, False)
+        assert m.LoadOrStore(5, 0) == (10, True)
+        assert m.Swap(5, 11) == (10, True)
+        assert m.CompareAndSwap(5, 11, 12)
+        assert m.CompareAndDelete(5, 12)
+        assert m.LoadAndDelete(6) == (12, True)
+        assert m.Len() == 198
+
+        seen = {}
+        m.Range(lambda k, v: seen.setdefault(k, v) is not None)
+        assert len(seen) == 198
+
+        m.Clear()
+        assert m.Len() == 0
+
+    def test_range_stops_early(self):
+        """Range stops as soon as f returns False, even mid-shard."""
+        from goated.std.sync import Map
+
+        m = Map()
+        for i in range(50):
+            m.Store(i, i)
+        calls = []
+        m.Range(lambda k, v: calls.append(k) or len(calls) < 3)
+        assert len(calls) == 3
+
+    def test_concurrent_writers(self):
+        """Concurrent writers on distinct keys lose no updates."""
+        from goated.std.sync import Map
+
+        m = Map()
+
+        def writer(base):
+            for i in range(500):
+                m.Store(base + i, i)
+
+        threads = [threading.Thread(target=writer, args=(n * 1000,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert m.Len() == 4000
+
+    def test_range_callback_may_mutate(self):
+        """Range callbacks run without a shard lock held and may use the map."""
+        from goated.std.sync import Map
+
+        m = Map()
+        m.Store("a", 1)
+        m.Store("b", 2)
+        m.Range(lambda k, v: m.Store(k, v + 10) is None)
+        assert sorted([m.Load("a")[0], m.Load("b")[0]]) == [11, 12]
+
+    def test_shards_created_lazily(self):
+        """A new Map allocates no shards until a key lands in one."""
+        from goated.std.sync import Map
+
+        m = Map()
+        assert all(shard is None for shard in m._shards)
+        assert m.Len() == 0
+        m.Store("a", 1)
+        assert sum(shard is not None for shard in m._shards) == 1
+
+    def test_key_eq_reenters_same_shard(self):
+        """A key whose __eq__ uses the map re-enters its shard lock."""
+        from goated.std.sync import Map
+
+        m = Map()
+        probing = []
+
+        class Key:
+            def __init__(self, name):
+                self.name = name
+
+            def __hash__(self):
+                return 0
+
+            def __eq__(self, other):
+                if not probing:
+                    probing.append(True)
+                    m.Load(0)  # hash(0) == 0: same shard as this key
+                    probing.pop()
+                return isinstance(other, Key) and self.name == other.name
+
+        m.Store(Key("a"), 1)
+        result = []
+        t = threading.Thread(target=lambda: result.append(m.Load(Key("a"))), daemon=True)
+        t.start()
+        t.join(timeout=5)
+        assert not t.is_alive()
+        assert result == [(1, True)]
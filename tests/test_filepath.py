@@ -61,6 +61,12 @@ class TestClean:
     def test_clean_already_clean(self):
         assert filepath.Clean("/a/b/c") == "/a/b/c"
 
+    def test_clean_repeat_hits_cache(self):
+        filepath.Clean("/cache/./probe/..")
+        hits = filepath.Clean.cache_info().hits
+        assert filepath.Clean("/cache/./probe/..") == "/cache"
+        assert filepath.Clean.cache_info().hits == hits + 1
+
 
 class TestDir:
     def test_dir_simple(self):
@@ -244,3 +250,55 @@ class TestVolumeName:
 
     def test_volumename_empty(self):
         assert filepath.VolumeName("") == ""
+
+
+class TestWalkCollect:
+    def _tree(self, root):
+        (root / "b").mkdir()
+        (root / "a.txt").write_text("aa")
+        (root / "b" / "x.txt").write_text("xxx")
+        (root / "b" / "y.log").write_text("y")
+        (root / "c.txt").write_text("c")
+
+    def test_walkcollect_order(self, tmp_path):
+        self._tree(tmp_path)
+        result = filepath.WalkCollect(str(tmp_path))
+        assert result.is_ok()
+        rel = [(p[len(str(tmp_path)) :], d, s) for p, d, s in result.unwrap()]
+        assert [r[0] for r in rel] == ["", "/a.txt", "/b", "/b/x.txt", "/b/y.log", "/c.txt"]
+        assert rel[1] == ("/a.txt", False, 2)
+        assert rel[2][1] is True
+
+    def test_walkcollect_pattern(self, tmp_path):
+        self._tree(tmp_path)
+        result = filepath.WalkCollect(str(tmp_path), "*.txt")
+        names = [filepath.Base(p) for p, _, _ in result.unwrap()]
+        assert names == ["a.txt", "x.txt", "c.txt"]
+
+    def test_walkcollect_symlink_loop(self, tmp_path):
+        self._tree(tmp_path)
+        (tmp_path / "b" / "loop").symlink_to("..")
+        result = filepath.WalkCollect(str(tmp_path))
+        assert result.is_ok()
+        entries = {p[len(str(tmp_path)) :]: d for p, d, _ in result.unwrap()}
+        assert entries["/b/loop"] is False
+        assert not any(p.startswith("/b/loop/") for p in entries)
+
+    def test_walkcollect_dangling_symlink(self, tmp_path):
+        self._tree(tmp_path)
+        (tmp_path / "b" / "broken").symlink_to(tmp_path / "missing")
+        result = filepath.WalkCollect(str(tmp_path))
+        assert result.is_ok()
+        paths = [p[len(str(tmp_path)) :] for p, _, _ in result.unwrap()]
+        assert paths == ["", "/a.txt", "/b", "/b/broken", "/b/x.txt", "/b/y.log", "/c.txt"]
+
+    def test_walkcollect_relative_root(self, tmp_path, monkeypatch):
+        self._tree(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        paths = [p for p, _, _ in filepath.WalkCollect(".").unwrap()]
+        assert paths == [".", "a.txt", "b", "b/x.txt", "b/y.log", "c.txt"]
+        paths = [p for p, _, _ in filepath.WalkCollect("b/").unwrap()]
+        assert paths == ["b/", "b/x.txt", "b/y.log"]
+
+    def test_walkcollect_missing_root(self, tmp_path):
+        assert filepath.WalkCollect(str(tmp_path / "nope")).is_err()
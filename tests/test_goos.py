@@ -1,6 +1,8 @@
 import os as stdlib_os
 import tempfile
 
+import pytest
+
 from goated.std import os
 
 
@@ -194,6 +196,33 @@ class TestReadDir:
             assert "file2.txt" in names
 
 
+class TestScanDir:
+    def test_scan_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(stdlib_os.path.join(tmpdir, "file.txt"), "w") as f:
+                f.write("1")
+            stdlib_os.mkdir(stdlib_os.path.join(tmpdir, "sub"))
+
+            result = os.ScanDir(tmpdir)
+            assert result.is_ok()
+            assert sorted(result.unwrap()) == [("file.txt", False), ("sub", True)]
+
+    def test_scan_dir_missing(self):
+        assert os.ScanDir("/nonexistent/path/for/scandir").is_err()
+
+    def test_scan_dir_not_a_directory(self):
+        with tempfile.NamedTemporaryFile() as f:
+            assert os.ScanDir(f.name).is_err()
+
+    @pytest.mark.skipif(not stdlib_os.path.isdir("/proc/self/fd"), reason="needs /proc")
+    def test_scan_dir_opens_lazily(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            before = len(stdlib_os.listdir("/proc/self/fd"))
+            result = os.ScanDir(tmpdir)
+            assert result.is_ok()
+            assert len(stdlib_os.listdir("/proc/self/fd")) == before
+
+
 class TestTempDir:
     def test_temp_dir(self):
         tmp = os.TempDir()
@@ -142,6 +142,89 @@ class TestWriterReset:
         assert len(buf2.getvalue()) > 0
         assert gzip.Decompress(buf2.getvalue()).unwrap() == b"Second"
 
+    def test_reset_keeps_level(self):
+        data = b"Compressible data with repetition. " * 100
+        fast = gzip.NewWriterLevel(io.BytesIO(), gzip.BestSpeed).unwrap()
+        fast.Close()
+
+        buf = io.BytesIO()
+        fast.Reset(buf)
+        fast.Write(data)
+        fast.Close()
+
+        reference = io.BytesIO()
+        with gzip.NewWriterLevel(reference, gzip.BestSpeed).unwrap() as w:
+            w.Write(data)
+
+        assert len(buf.getvalue()) == len(reference.getvalue())
+        assert gzip.Decompress(buf.getvalue()).unwrap() == data
+
+    def test_reset_reuses_buffer(self):
+        buf = io.BytesIO()
+        writer = gzip.NewWriter(buf)
+        for payload in (b"first", b"second"):
+            buf.seek(0)
+            buf.truncate()
+            writer.Reset(buf)
+            writer.Write(payload)
+            writer.Close()
+            assert gzip.Decompress(buf.getvalue()).unwrap() == payload
+
+
+class TestReaderReset:
+    def test_reset_rewound_source(self):
+        src = io.BytesIO(gzip.Compress(b"payload").unwrap())
+        reader = gzip.NewReader(src).unwrap()
+        for _ in range(3):
+            src.seek(0)
+            assert reader.Reset(src).is_ok()
+            assert reader.Read().unwrap() == b"payload"
+
+    def test_reset_new_source(self):
+        reader = gzip.NewReader(io.BytesIO(gzip.Compress(b"one").unwrap())).unwrap()
+        reader.Read()
+        reader.Reset(io.BytesIO(gzip.Compress(b"two").unwrap()))
+        assert reader.Read().unwrap() == b"two"
+
+
+class TestReadChunks:
+    def test_chunks_reassemble(self):
+        payload = bytes(range(256)) * 1000
+        reader = gzip.NewReader(io.BytesIO(gzip.Compress(payload).unwrap())).unwrap()
+        chunks = [bytes(r.unwrap()) for r in reader.ReadChunks(4096)]
+        assert b"".join(chunks) == payload
+        assert all(len(c) <= 4096 for c in chunks)
+
+    def test_empty_payload(self):
+        reader = gzip.NewReader(io.BytesIO(gzip.Compress(b"").unwrap())).unwrap()
+        assert list(reader.ReadChunks()) == []
+
+    def test_corrupt_stream(self):
+        compressed = gzip.Compress(b"x" * 10000).unwrap()
+        reader = gzip.NewReader(io.BytesIO(compressed[:20])).unwrap()
+        results = list(reader.ReadChunks())
+        assert results[-1].is_err()
+
+
+class TestZlibBackend:
+    def test_writer_roundtrip(self, monkeypatch):
+        monkeypatch.setattr(gzip, "_ZLIB_BACKEND", True)
+        payload = b"The quick brown fox jumps over the lazy dog. " * 50
+        for level in (gzip.NoCompression, gzip.BestSpeed, gzip.BestCompression):
+            buf = io.BytesIO()
+            writer = gzip.NewWriterLevel(buf, level).unwrap()
+            writer.Write(payload[:100])
+            assert writer.Flush().is_ok()
+            writer.Write(payload[100:])
+            assert writer.Close().is_ok()
+            assert gzip.Decompress(buf.getvalue()).unwrap() == payload
+
+    def test_write_after_close(self, monkeypatch):
+        monkeypatch.setattr(gzip, "_ZLIB_BACKEND", True)
+        writer = gzip.NewWriter(io.BytesIO())
+        writer.Close()
+        assert writer.Write(b"late").is_err()
+
 
 class TestConstants:
     def test_compression_levels(self):
@@ -0,0 +1,62 @@
+import hashlib
+
+import pytest
+
+from goated.std import parallel
+
+
+class TestParallelHashSHA256Into:
+    def test_writes_raw_digests(self):
+        items = [f"item-{i}".encode() for i in range(20)]
+        out = bytearray(32 * len(items))
+        assert parallel.parallel_hash_sha256_into(items, out) is None
+        assert bytes(out) == b"".join(hashlib.sha256(item).digest() for item in items)
+
+    def test_reuses_buffer(self):
+        out = bytearray(64)
+        parallel.parallel_hash_sha256_into([b"a", b"b"], out)
+        parallel.parallel_hash_sha256_into([b"c", b"d"], out)
+        assert bytes(out) == hashlib.sha256(b"c").digest() + hashlib.sha256(b"d").digest()
+
+    def test_buffer_too_small(self):
+        with pytest.raises(ValueError):
+            parallel.parallel_hash_sha256_into([b"a", b"b"], bytearray(32))
+
+
+class TestParallelHashSHA256Packed:
+    def test_matches_list_variant(self):
+        items = [f"item-{i}".encode() * (i + 1) for i in range(20)]
+        buf = b"".join(items)
+        offsets = [0]
+        for item in items:
+            offsets.append(offsets[-1] + len(item))
+        assert parallel.parallel_hash_sha256_packed(buf, offsets) == [
+            hashlib.sha256(item).hexdigest() for item in items
+        ]
+
+    def test_empty_items(self):
+        assert parallel.parallel_hash_sha256_packed(b"ab", [0, 0, 2, 2]) == [
+            hashlib.sha256(b"").hexdigest(),
+            hashlib.sha256(b"ab").hexdigest(),
+            hashlib.sha256(b"").hexdigest(),
+        ]
+
+    def test_single_item(self):
+        assert parallel.parallel_hash_sha256_packed(b"hello", [0, 5]) == [
+            hashlib.sha256(b"hello").hexdigest()
+        ]
+
+    def test_no_items(self):
+        assert parallel.parallel_hash_sha256_packed(b"", [0]) == []
+
+    def test_offset_past_end(self):
+        with pytest.raises(ValueError):
+            parallel.parallel_hash_sha256_packed(b"ab", [0, 1, 1 << 33])
+
+    def test_decreasing_offsets(self):
+        with pytest.raises(ValueError):
+            parallel.parallel_hash_sha256_packed(b"ab", [0, 3, 1])
+
+    def test_negative_offset(self):
+        with pytest.raises(ValueError):
+            parallel.parallel_hash_sha256_packed(b"ab", [-1, 2])
@@ -54,6 +54,12 @@ class TestClean:
     def test_clean_root(self):
         assert path.Clean("/") == "/"
 
+    def test_clean_repeat_hits_cache(self):
+        path.Clean("/cache/./probe/..")
+        hits = path.Clean.cache_info().hits
+        assert path.Clean("/cache/./probe/..") == "/cache"
+        assert path.Clean.cache_info().hits == hits + 1
+
 
 class TestDir:
     def test_dir_simple(self):
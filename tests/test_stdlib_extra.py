@@ -1,9 +1,15 @@
-"""Tests for additional stdlib packages: bytes, strconv, json, crypto."""
+"""Tests for additional stdlib packages: bytes, strconv, json, crypto, regexp, context, hex."""
+
+import dataclasses
+import datetime
+import math
+import os
+import time
 
 import pytest
 
 from goated.std import bytes as gobytes
-from goated.std import crypto, strconv
+from goated.std import context, crypto, hex, regexp, strconv
 from goated.std import json as gojson
 
 
@@ -156,12 +162,69 @@ class TestJSON:
         assert gojson.Valid("[1, 2, 3]")
         assert not gojson.Valid("not json")
 
+    def test_marshal_int_keys(self):
+        assert gojson.Marshal({1: "a"}).unwrap() == '{"1":"a"}'
+
+    def test_marshal_big_int(self):
+        assert gojson.Marshal(2**70).unwrap() == str(2**70)
+
+    def test_marshal_indent_prefix(self):
+        result = gojson.MarshalIndent({"a": 1}, prefix="> ", indent="  ")
+        assert result.unwrap() == '> {\n>   "a": 1\n> }'
+
+    def test_unmarshal_bytes(self):
+        assert gojson.Unmarshal(b'{"a": [1, 2]}').unwrap() == {"a": [1, 2]}
+
+    def test_default_backend_is_stdlib(self):
+        if os.environ.get("GOATED_JSON_BACKEND") != "orjson":
+            assert gojson._backend == "json"
+            assert gojson.Marshal({"n": "José"}).unwrap() == '{"n":"Jos\\u00e9"}'
+
     def test_compact(self):
         result = gojson.Compact('{\n  "a": 1,\n  "b": 2\n}')
         assert result.is_ok()
         assert result.unwrap() == '{"a":1,"b":2}'
 
 
+class TestJSONBackends:
+    """Behaviour that must not depend on which backend is selected."""
+
+    @pytest.fixture(params=["orjson", "json"], autouse=True)
+    def backend(self, request, monkeypatch):
+        mod = pytest.importorskip("orjson") if request.param == "orjson" else None
+        monkeypatch.setattr(gojson, "orjson", mod)
+        return request.param
+
+    def test_marshal_non_finite(self):
+        assert gojson.Marshal(float("nan")).unwrap() == "NaN"
+        assert gojson.Marshal([float("inf"), None]).unwrap() == "[Infinity,null]"
+        assert gojson.MarshalIndent({"a": float("-inf")}).unwrap() == '{\n  "a": -Infinity\n}'
+
+    def test_marshal_date_rejected(self):
+        assert gojson.Marshal(datetime.date(2024, 1, 2)).is_err()
+
+    def test_marshal_dataclass_rejected(self):
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        assert gojson.Marshal(Point(1)).is_err()
+
+    def test_unmarshal_error_message(self):
+        err = gojson.Unmarshal("not json").err()
+        assert str(err).startswith("Expecting value: line 1 column 1")
+
+    def test_unmarshal_nan(self):
+        assert math.isnan(gojson.Unmarshal("NaN").unwrap())
+        assert gojson.Valid("NaN")
+
+    def test_escaping_independent_of_nulls(self, backend):
+        plain = gojson.Marshal({"n": "José"}).unwrap()
+        with_null = gojson.Marshal({"n": "José", "x": None}).unwrap()
+        assert with_null == plain[:-1] + ',"x":null}'
+        assert ("José" in plain) == (backend == "orjson")
+
+
 class TestCrypto:
     def test_sha256_sum(self):
         result = crypto.sha256.Sum("hello world")
@@ -192,3 +255,175 @@ class TestCrypto:
     def test_sha512_size(self):
         assert crypto.sha512.Size == 64
         assert crypto.sha512.BlockSize == 128
+
+
+class TestRegexpMatchString:
+    def test_match(self):
+        assert regexp.MatchString(r"\d{3}-\d{4}", "call 555-1234").unwrap() is True
+        assert regexp.MatchString(r"\d{3}-\d{4}", "no digits").unwrap() is False
+
+    def test_invalid_pattern(self):
+        result = regexp.MatchString("(", "x")
+        assert result.is_err()
+        assert "error parsing regexp" in str(result.err())
+
+    def test_repeated_pattern_compiles_once(self):
+        from goated._core import _USE_GO_LIB
+
+        if _USE_GO_LIB:
+            pytest.skip("Go library caches compiled patterns on its side")
+
+        regexp._compile_cached.cache_clear()
+        for s in ("a1", "b2", "c"):
+            regexp.MatchString(r"\d", s)
+        info = regexp._compile_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+
+class TestRegexpFindAllString:
+    def test_all_matches(self):
+        re = regexp.MustCompile(r"\d+")
+        assert re.FindAllString("a1 b22 c333", -1) == ["1", "22", "333"]
+
+    def test_limit(self):
+        re = regexp.MustCompile(r"\d+")
+        assert re.FindAllString("a1 b22 c333", 2) == ["1", "22"]
+        assert re.FindAllString("a1 b22 c333", 0) is None
+
+    def test_no_match(self):
+        assert regexp.MustCompile(r"\d+").FindAllString("abc", -1) is None
+
+    def test_group_pattern(self):
+        re = regexp.MustCompile(r"(\w)=(\d)")
+        assert re.FindAllString("a=1 b=2", -1) == ["a=1", "b=2"]
+        assert re.FindAllString("a=1 b=2", 1) == ["a=1"]
+
+
+class TestContextWait:
+    def test_background_times_out(self):
+        assert context.Background().Wait(0.01) is False
+
+    def test_cancel_wakes_waiter(self):
+        import threading
+
+        ctx, cancel = context.WithCancel(context.Background())
+        threading.Timer(0.01, cancel).start()
+        assert ctx.Wait(5.0) is True
+        assert ctx.Err() is not None
+
+    def test_value_context_delegates(self):
+        ctx, cancel = context.WithCancel(context.Background())
+        vctx = context.WithValue(ctx, "k", 1)
+        assert vctx.Wait(0) is False
+        cancel()
+        assert vctx.Wait(0) is True
+
+    def test_deadline_expires_without_event_loop(self):
+        ctx, _ = context.WithTimeout(context.Background(), 0.01)
+        assert ctx.Wait(0) is False
+        assert ctx.Wait() is True
+        assert isinstance(ctx.Err(), context.DeadlineExceeded)
+
+    def test_cancel_inherits_parent_deadline(self):
+        parent, _ = context.WithTimeout(context.Background(), 0.02)
+        ctx, _ = context.WithCancel(parent)
+        start = time.monotonic()
+        assert ctx.Wait(5.0) is True
+        assert time.monotonic() - start < 1.0
+        assert isinstance(ctx.Err(), context.DeadlineExceeded)
+
+    def test_later_timeout_inherits_earlier_deadline(self):
+        parent, _ = context.WithTimeout(context.Background(), 0.02)
+        ctx, _ = context.WithTimeout(parent, 5.0)
+        start = time.monotonic()
+        assert ctx.Wait() is True
+        assert time.monotonic() - start < 1.0
+        assert isinstance(ctx.Err(), context.DeadlineExceeded)
+
+    def test_inherited_deadline_respects_wait_timeout(self):
+        parent, _ = context.WithTimeout(context.Background(), 5.0)
+        ctx, _ = context.WithCancel(parent)
+        assert ctx.Wait(0.01) is False
+        assert ctx.Err() is None
+
+
+class TestContextValue:
+    def test_nested_values(self):
+        ctx = context.WithValue(context.Background(), "a", 1)
+        ctx = context.WithValue(ctx, "b", 2)
+        ctx = context.WithValue(ctx, "a", 3)
+        assert ctx.Value("a") == 3
+        assert ctx.Value("b") == 2
+        assert ctx.Value("missing") is None
+
+    def test_parent_unchanged(self):
+        parent = context.WithValue(context.Background(), "a", 1)
+        child = context.WithValue(parent, "a", 2)
+        assert parent.Value("a") == 1
+        assert child.Value("a") == 2
+
+    def test_none_value_shadows_parent(self):
+        ctx = context.WithValue(context.Background(), "a", 1)
+        ctx = context.WithValue(ctx, "a", None)
+        assert ctx.Value("a") is None
+
+    def test_lookup_through_cancel_context(self):
+        ctx = context.WithValue(context.Background(), "a", 1)
+        ctx, cancel = context.WithCancel(ctx)
+        ctx = context.WithValue(ctx, "b", 2)
+        assert ctx.Value("a") == 1
+        assert ctx.Value("b") == 2
+        cancel()
+        assert ctx.Err() is not None
+
+    def test_unhashable_key(self):
+        ctx = context.WithValue(context.Background(), "a", 1)
+        ctx = context.WithValue(ctx, ["k"], 2)
+        ctx = context.WithValue(ctx, "b", 3)
+        assert ctx.Value(["k"]) == 2
+        assert ctx.Value("a") == 1
+        assert ctx.Value("b") == 3
+        assert ctx.Value(["other"]) is None
+
+    def test_deep_chain(self):
+        ctx = context.Background()
+        for i in range(50):
+            ctx = context.WithValue(ctx, i, i * 10)
+        ctx = context.WithValue(ctx, 3, "shadow")
+        assert ctx.Value(3) == "shadow"
+        assert all(ctx.Value(i) == i * 10 for i in range(50) if i != 3)
+        assert ctx.Value(50) is None
+        assert len(ctx._values) <= context._SEGMENT_SIZE
+
+
+class TestHexDump:
+    def test_partial_line(self):
+        assert hex.Dump(b"Hello, World!") == (
+            "00000000  48 65 6c 6c 6f 2c 20 57  6f 72 6c 64 21           |Hello, World!|\n"
+        )
+
+    def test_full_lines(self):
+        out = hex.Dump(bytes(range(32)))
+        assert out.splitlines() == [
+            "00000000  00 01 02 03 04 05 06 07  08 09 0a 0b 0c 0d 0e 0f  |................|",
+            "00000010  10 11 12 13 14 15 16 17  18 19 1a 1b 1c 1d 1e 1f  |................|",
+        ]
+
+    def test_short_first_group(self):
+        assert hex.Dump(b"abc") == (
+            "00000000  61 62 63                                          |abc|\n"
+        )
+
+    def test_empty(self):
+        assert hex.Dump(b"") == ""
+
+    def test_matches_dumper(self):
+        import io
+
+        data = bytes(range(256)) + b"tail"
+        buf = io.StringIO()
+        d = hex.Dumper(buf)
+        d.Write(data)
+        d.Close()
+        assert hex.Dump(data) == buf.getvalue()
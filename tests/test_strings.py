@@ -28,6 +28,11 @@ class TestContains:
     def test_contains_both_empty(self):
         assert strings.Contains("", "") is True
 
+    def test_contains_bytes(self):
+        assert strings.Contains(b"hello world", b"world") is True
+        assert strings.Contains(b"hello world", b"xyz") is False
+        assert strings.Contains(b"", b"") is True
+
 
 class TestContainsAny:
     def test_contains_any_present(self):
@@ -111,6 +116,10 @@ class TestIndex:
     def test_index_empty(self):
         assert strings.Index("hello", "") == 0
 
+    def test_index_bytes(self):
+        assert strings.Index(b"hello", b"ll") == 2
+        assert strings.Index(b"hello", b"xyz") == -1
+
 
 class TestIndexAny:
     def test_index_any_found(self):
@@ -336,6 +345,13 @@ class TestBuilder:
         b.WriteString("world")
         assert str(b) == "hello world"
 
+    def test_builder_write_strings(self):
+        b = strings.Builder()
+        assert b.WriteStrings("Hello", ", ", "World", "!") == 13
+        b.WriteString("?")
+        assert str(b) == "Hello, World!?"
+        assert b.WriteStrings() == 0
+
     def test_builder_len(self):
         b = strings.Builder()
         b.WriteString("hello")
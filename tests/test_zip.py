@@ -133,6 +133,27 @@ class TestWriter:
         with zipfile.ZipFile(buf, "r") as zf:
             assert len(zf.namelist()) == 3
 
+    def test_create_all(self):
+        files = {"a.txt": b"alpha", "dir/b.txt": b"beta" * 100}
+        buf = BytesIO()
+        w = gozip.NewWriter(buf)
+        assert w.CreateAll(files).is_ok()
+        assert w.CreateAll({"c.txt": b"gamma"}, method=gozip.Store).is_ok()
+        w.Close()
+
+        data = buf.getvalue()
+        reader = gozip.NewReader(BytesIO(data), len(data)).unwrap()
+        contents = {f.FileHeader.Name: f.Read().unwrap() for f in reader.File}
+        methods = {f.FileHeader.Name: f.FileHeader.Method for f in reader.File}
+        assert contents == {**files, "c.txt": b"gamma"}
+        assert methods["a.txt"] == gozip.Deflate
+        assert methods["c.txt"] == gozip.Store
+
+    def test_create_all_after_close(self):
+        w = gozip.NewWriter(BytesIO())
+        w.Close()
+        assert w.CreateAll({"late.txt": b"x"}).is_err()
+
     def test_create_header(self):
         buf = BytesIO()
         w = gozip.NewWriter(buf)